@@ -3,16 +3,246 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Execution profiles: speed-relevant settings that change together. A setting
+# given explicitly in the environment still wins over the profile's value.
+PROFILES = {
+    # Lowest latency: no slow-mo, short waits, lean network, viewport JPEG only
+    "fast": {
+        "SLOW_MO": 0,
+        "TIMEOUT": 15000,
+        "PROBE_TIMEOUT": 2000,
+        "ELEMENT_TIMEOUT": 5000,
+        "NAVIGATION_WAIT_TIMEOUT": 8000,
+        "SCREENSHOT_FORMAT": "jpeg",
+        "SCREENSHOT_FULL_PAGE": "false",
+        "SNAPSHOT_POLICY": "never",
+        "NETWORK_LOG_POLICY": "never",
+        "CONSOLE_LOG_LEVEL": "error",
+        "TRACING": "off",
+        "STEP_RETRIES": 1,
+        "PERF_METRICS": "false",
+        "RESOURCE_PROFILE": "lean",
+        "READINESS_STRATEGY": "dom",
+        "DOM_QUIET_MS": 150,
+    },
+    # The suite's long-standing settings; slow-mo only when the browser is visible
+    "standard": {
+        # No SLOW_MO: 100 ms headed, none headless (see Config.SLOW_MO)
+        "TIMEOUT": 30000,
+        "PROBE_TIMEOUT": 5000,
+        "ELEMENT_TIMEOUT": 10000,
+        "NAVIGATION_WAIT_TIMEOUT": 10000,
+        "SCREENSHOT_FORMAT": "jpeg",
+        "SCREENSHOT_FULL_PAGE": "true",
+        "SNAPSHOT_POLICY": "failure",
+        "NETWORK_LOG_POLICY": "failure",
+        "CONSOLE_LOG_LEVEL": "warning",
+        "TRACING": "off",
+        "STEP_RETRIES": 1,
+        "PERF_METRICS": "true",
+        "RESOURCE_PROFILE": "full",
+        "READINESS_STRATEGY": "dom",
+        "DOM_QUIET_MS": 300,
+    },
+    # Watchable runs with a trace kept for every failure
+    "debug": {
+        "SLOW_MO": 100,
+        "TIMEOUT": 30000,
+        "PROBE_TIMEOUT": 5000,
+        "ELEMENT_TIMEOUT": 10000,
+        "NAVIGATION_WAIT_TIMEOUT": 10000,
+        "SCREENSHOT_FORMAT": "png",
+        "SCREENSHOT_FULL_PAGE": "true",
+        "SNAPSHOT_POLICY": "failure",
+        "NETWORK_LOG_POLICY": "failure",
+        "CONSOLE_LOG_LEVEL": "debug",
+        "TRACING": "retain-on-failure",
+        "STEP_RETRIES": 0,
+        "PERF_METRICS": "true",
+        "RESOURCE_PROFILE": "full",
+        "READINESS_STRATEGY": "dom",
+        "DOM_QUIET_MS": 300,
+    },
+    # Everything recorded for every test, generous waits, full network idle
+    "forensic": {
+        "SLOW_MO": 250,
+        "TIMEOUT": 60000,
+        "PROBE_TIMEOUT": 10000,
+        "ELEMENT_TIMEOUT": 20000,
+        "NAVIGATION_WAIT_TIMEOUT": 30000,
+        "SCREENSHOT_FORMAT": "png",
+        "SCREENSHOT_FULL_PAGE": "true",
+        "SNAPSHOT_POLICY": "always",
+        "NETWORK_LOG_POLICY": "always",
+        "CONSOLE_LOG_LEVEL": "debug",
+        "TRACING": "on",
+        "STEP_RETRIES": 0,
+        "PERF_METRICS": "true",
+        "RESOURCE_PROFILE": "full",
+        "READINESS_STRATEGY": "networkidle",
+        "DOM_QUIET_MS": 500,
+        "ADAPTIVE_TIMEOUTS": "false",
+    },
+}
+DEFAULT_PROFILE = "standard"
+
+_profile_name = os.getenv("TEST_PROFILE", DEFAULT_PROFILE)
+if _profile_name not in PROFILES:
+    raise ValueError(f"Unknown TEST_PROFILE '{_profile_name}', expected one of {list(PROFILES)}")
+
+
+def _setting(name: str, default: str = None) -> str:
+    """Environment value, else the active profile's value, else the default"""
+    value = os.getenv(name)
+    if value is None:
+        value = PROFILES[_profile_name].get(name, default)
+    return str(value) if value is not None else None
+
+
 class Config:
+    PROFILE = _profile_name
+    
     BASE_URL = os.getenv("BASE_URL", "https://www.effective-mobile.ru")
     BROWSER = os.getenv("BROWSER", "chromium")
     HEADED = os.getenv("HEADED", "false").lower() == "true"
-    TIMEOUT = int(os.getenv("TIMEOUT", "30000"))
+    TIMEOUT = int(_setting("TIMEOUT", "30000"))
     
     # Playwright settings
     PLAYWRIGHT_TIMEOUT = TIMEOUT
     NAVIGATION_TIMEOUT = TIMEOUT
+    # Slow-mo only helps a human watching; 100 ms for headed runs unless the environment or profile sets it
+    SLOW_MO = int(_setting("SLOW_MO", "100" if HEADED else "0"))
+    # Racing fallback selectors, waiting for a single element, waiting after a navigating click
+    PROBE_TIMEOUT = int(_setting("PROBE_TIMEOUT", "5000"))
+    ELEMENT_TIMEOUT = int(_setting("ELEMENT_TIMEOUT", "10000"))
+    NAVIGATION_WAIT_TIMEOUT = int(_setting("NAVIGATION_WAIT_TIMEOUT", "10000"))
+    
+    # Step-level retry: retries per failing step and retry time budget per test
+    STEP_RETRIES = int(_setting("STEP_RETRIES", "1"))
+    STEP_RETRY_BUDGET_MS = int(os.getenv("STEP_RETRY_BUDGET_MS", "15000"))
+    
+    # Adaptive timeouts: p99 of past latencies x safety factor, clamped to [min, max] ms
+    ADAPTIVE_TIMEOUTS_ENABLED = _setting("ADAPTIVE_TIMEOUTS", "true").lower() == "true"
+    ADAPTIVE_TIMEOUTS_PATH = os.getenv("ADAPTIVE_TIMEOUTS_PATH", ".cache/latency_stats.json")
+    TIMEOUT_SAFETY_FACTOR = float(os.getenv("TIMEOUT_SAFETY_FACTOR", "3"))
+    TIMEOUT_MIN_MS = int(os.getenv("TIMEOUT_MIN_MS", "1000"))
+    TIMEOUT_MAX_MS = int(os.getenv("TIMEOUT_MAX_MS", str(TIMEOUT)))
+    TIMEOUT_MIN_SAMPLES = int(os.getenv("TIMEOUT_MIN_SAMPLES", "5"))
+    
+    # Playwright tracing: off, on, or retain-on-failure; traces are attached to Allure
+    TRACING = _setting("TRACING", "off")
+    TRACES_DIR = os.getenv("TRACES_DIR", "traces")
+    
+    # Browser context options shared by every fixture that opens a context
+    CONTEXT_OPTIONS = {
+        "viewport": {"width": 1920, "height": 1080},
+        "ignore_https_errors": True,
+        "java_script_enabled": True,
+    }
+    
+    # Maximum pages driven at once by the async page objects
+    ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "5"))
+    
+    # Per-run step and action timeline (JSON + CSV)
+    TIMELINE_DIR = os.getenv("TIMELINE_DIR", "timeline")
     
     # Test settings
     RETRY_COUNT = 2
     SCREENSHOT_ON_FAILURE = True
+    
+    # Failure screenshots: png, jpeg or webp (webp and background encoding need Pillow)
+    SCREENSHOT_FORMAT = _setting("SCREENSHOT_FORMAT", "jpeg")
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+    SCREENSHOT_FULL_PAGE = _setting("SCREENSHOT_FULL_PAGE", "true").lower() == "true"
+    ARTIFACT_WORKERS = int(os.getenv("ARTIFACT_WORKERS", "2"))
+    ARTIFACT_MAX_PENDING = int(os.getenv("ARTIFACT_MAX_PENDING", "4"))
+    ARTIFACT_FLUSH_TIMEOUT = float(os.getenv("ARTIFACT_FLUSH_TIMEOUT", "10"))
+    
+    # DOM snapshots: attach "always", only on "failure" or "never"; sizes in bytes (0 = unlimited)
+    SNAPSHOT_POLICY = _setting("SNAPSHOT_POLICY", "failure")
+    SNAPSHOT_BUDGET_BYTES = int(os.getenv("SNAPSHOT_BUDGET_BYTES", str(20 * 1024 * 1024)))
+    SNAPSHOT_MAX_BYTES = int(os.getenv("SNAPSHOT_MAX_BYTES", str(2 * 1024 * 1024)))
+    
+    # Readiness: "dom" (MutationObserver settle + URL change) or "networkidle"
+    READINESS_STRATEGY = _setting("READINESS_STRATEGY", "dom")
+    DOM_QUIET_MS = int(_setting("DOM_QUIET_MS", "300"))
+    
+    # Network record/replay: live, record or replay
+    NETWORK_MODE = os.getenv("NETWORK_MODE", "live")
+    NETWORK_ARCHIVE_DIR = os.getenv("NETWORK_ARCHIVE_DIR", "network-archive")
+    
+    # Per-test network waterfall: always, failure or never; requests kept per context
+    NETWORK_LOG_POLICY = _setting("NETWORK_LOG_POLICY", "failure")
+    NETWORK_LOG_CAPACITY = int(os.getenv("NETWORK_LOG_CAPACITY", "500"))
+    
+    # Console/page error log attached per test: lowest level kept (debug, info, warning, error), distinct messages kept
+    CONSOLE_LOG_LEVEL = _setting("CONSOLE_LOG_LEVEL", "warning")
+    CONSOLE_LOG_CAPACITY = int(os.getenv("CONSOLE_LOG_CAPACITY", "200"))
+    
+    # Request filtering: profile for tests without a resource_profile marker
+    RESOURCE_PROFILE = _setting("RESOURCE_PROFILE", "full")
+    BLOCKED_RESOURCE_TYPES = [t for t in os.getenv("BLOCKED_RESOURCE_TYPES", "image,font,media").split(",") if t]
+    BLOCKED_DOMAINS = [d for d in os.getenv(
+        "BLOCKED_DOMAINS",
+        "google-analytics.com,googletagmanager.com,doubleclick.net,mc.yandex.ru,top-fwz1.mail.ru,facebook.net,vk.com"
+    ).split(",") if d]
+    ALLOWED_DOMAINS = [d for d in os.getenv("ALLOWED_DOMAINS", "").split(",") if d]
+    RESOURCE_PROFILES = {
+        "full": {},
+        "lean": {
+            "deny_types": BLOCKED_RESOURCE_TYPES,
+            "deny_domains": BLOCKED_DOMAINS,
+            "allow_domains": ALLOWED_DOMAINS,
+        },
+        "no-trackers": {
+            "deny_domains": BLOCKED_DOMAINS,
+            "allow_domains": ALLOWED_DOMAINS,
+        },
+    }
+    
+    # Selector memo cache
+    SELECTOR_CACHE_ENABLED = os.getenv("SELECTOR_CACHE_ENABLED", "true").lower() == "true"
+    SELECTOR_CACHE_PATH = os.getenv("SELECTOR_CACHE_PATH", ".cache/selector_cache.json")
+    
+    # Site crawler: http (raw HTML) or browser (rendered pages); rate in requests per second (0 = unlimited)
+    CRAWL_MODE = os.getenv("CRAWL_MODE", "http")
+    CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "8"))
+    CRAWL_MAX_DEPTH = int(os.getenv("CRAWL_MAX_DEPTH", "2"))
+    CRAWL_MAX_PAGES = int(os.getenv("CRAWL_MAX_PAGES", "500"))
+    CRAWL_RATE = float(os.getenv("CRAWL_RATE", "10"))
+    CRAWL_DIR = os.getenv("CRAWL_DIR", "crawl")
+    
+    # Browserless HTTP smoke tier run before the browser suite; timeout in seconds
+    SMOKE_WORKERS = int(os.getenv("SMOKE_WORKERS", "16"))
+    SMOKE_TIMEOUT = float(os.getenv("SMOKE_TIMEOUT", "5"))
+    
+    # Warm browser daemon (run_tests.py daemon start): restart after N sessions or above RSS in MB (0 = no limit)
+    BROWSER_DAEMON_ENABLED = os.getenv("BROWSER_DAEMON_ENABLED", "true").lower() == "true"
+    BROWSER_DAEMON_MAX_SESSIONS = int(os.getenv("BROWSER_DAEMON_MAX_SESSIONS", "20"))
+    BROWSER_DAEMON_MAX_RSS_MB = float(os.getenv("BROWSER_DAEMON_MAX_RSS_MB", "1500"))
+    
+    # Local mirror server (fast_fastapi.py): serves the archived snapshot of MIRROR_ORIGIN, latency in ms
+    MIRROR_ORIGIN = os.getenv("MIRROR_ORIGIN", "https://www.effective-mobile.ru")
+    MIRROR_HOST = os.getenv("MIRROR_HOST", "127.0.0.1")
+    MIRROR_PORT = int(os.getenv("MIRROR_PORT", "8000"))
+    MIRROR_WORKERS = int(os.getenv("MIRROR_WORKERS", "2"))
+    MIRROR_LATENCY_MS = float(os.getenv("MIRROR_LATENCY_MS", "0"))
+    MIRROR_JITTER_MS = float(os.getenv("MIRROR_JITTER_MS", "0"))
+    MIRROR_URL = f"http://{MIRROR_HOST}:{MIRROR_PORT}"
+    
+    # Page performance metrics per navigation, failing the test above a budget (0 = no budget)
+    PERF_METRICS_ENABLED = _setting("PERF_METRICS", "true").lower() == "true"
+    PERF_BUDGETS = {
+        "ttfb_ms": float(os.getenv("PERF_BUDGET_TTFB_MS", "1500")),
+        "fcp_ms": float(os.getenv("PERF_BUDGET_FCP_MS", "3000")),
+        "lcp_ms": float(os.getenv("PERF_BUDGET_LCP_MS", "4000")),
+        "cls": float(os.getenv("PERF_BUDGET_CLS", "0.25")),
+        "duration_ms": float(os.getenv("PERF_BUDGET_DURATION_MS", "15000")),
+        "transfer_bytes": float(os.getenv("PERF_BUDGET_TRANSFER_BYTES", "0")),
+        "requests": float(os.getenv("PERF_BUDGET_REQUESTS", "0")),
+    }
+    
+    # run_tests.py output log, rotated at RUN_LOG_MAX_BYTES with RUN_LOG_BACKUPS old files kept
+    RUN_LOG_PATH = os.getenv("RUN_LOG_PATH", "logs/run_tests.log")
+    RUN_LOG_MAX_BYTES = int(os.getenv("RUN_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    RUN_LOG_BACKUPS = int(os.getenv("RUN_LOG_BACKUPS", "5"))
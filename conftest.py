@@ -1,24 +1,211 @@
 import pytest
 import os
+import json
+import allure
+import allure_commons
 from playwright.sync_api import Page, BrowserContext, Browser
 from config.config import Config
+from pages.main_page import MainPage
+from runner.timings import TimingHistory
+from utils.adaptive_timeouts import adaptive_timeouts
+from utils.allure_environment import update_environment
+from utils.artifacts import artifact_pipeline
+from utils.async_runner import run_page_checks
+from utils.browser_daemon import browser_daemon
+from utils.console_log import ConsoleLog
+from utils.context_setup import prepare_context, setup_page, start_network_log
+from utils.instrumentation import timeline
+from utils.json_store import atomic_write_json
+from utils.network_archive import NETWORK_MODES, network_archive
+from utils.network_log import NetworkLog
+from utils.page_metrics import SUMMARY_METRICS, page_metrics
+from utils.request_filter import RequestFilter
+from utils.response_cache import ResponseCache
+from utils.selector_cache import selector_cache
+from utils.snapshots import snapshot_service
+from utils.step_retry import step_retry
 
 
-@pytest.fixture(scope="function")
-def page(page: Page):
-    """Setup and teardown for each test"""
-    # Set default timeout
-    page.set_default_timeout(Config.PLAYWRIGHT_TIMEOUT)
+def pytest_addoption(parser):
+    """Register custom command line options"""
+    parser.addoption(
+        "--network",
+        choices=NETWORK_MODES,
+        default=Config.NETWORK_MODE,
+        help="live: real network, record: archive responses, replay: serve from archive only",
+    )
+    parser.addoption(
+        "--test-list",
+        default=None,
+        help="File with node ids to run, one per line, in the order to run them",
+    )
+    parser.addoption(
+        "--timings-out",
+        default=None,
+        help="Write per-test durations (setup + call + teardown) to this JSON file",
+    )
+
+
+def pytest_configure(config):
+    """Apply command line options to session-wide services"""
+    network_archive.mode = config.getoption("network")
     
-    # Setup error handling
-    def handle_error(error):
-        print(f"Page error: {error}")
+    # Time every Allure step and write the durations onto the steps themselves
+    listener = config.pluginmanager.getplugin("allure_listener")
+    timeline.reporter = listener.allure_logger if listener else None
+    allure_commons.plugin_manager.register(timeline)
+    config.add_cleanup(lambda: allure_commons.plugin_manager.unregister(timeline))
     
-    page.on("pageerror", handle_error)
+    # Share one DOM serialization per step and store snapshots once per content hash
+    snapshot_service.reporter = timeline.reporter
+    allure_commons.plugin_manager.register(snapshot_service)
+    config.add_cleanup(lambda: allure_commons.plugin_manager.unregister(snapshot_service))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Attribute timeline events, step retries and page metrics to the running test"""
+    timeline.test = nodeid
+    step_retry.start_test(nodeid)
+    page_metrics.start_test(nodeid)
+
+
+def _resource_profile(request):
+    """Resource profile requested by the test's marker, or the configured default"""
+    marker = request.node.get_closest_marker("resource_profile")
+    return marker.args[0] if marker else Config.RESOURCE_PROFILE
+
+
+def _attach_request_filter_stats(request_filter: RequestFilter, name: str = "Blocked Requests"):
+    """Report requests and bytes saved by the request filter"""
+    if not request_filter.active:
+        return
+    allure.attach(
+        json.dumps(request_filter.stats(), indent=2),
+        name=name,
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+def _attach_console_log(console_log: ConsoleLog, name: str = "Console Log"):
+    """Attach the page's deduplicated console log, if anything was logged"""
+    if console_log is None or not console_log.entries:
+        return
+    allure.attach(
+        console_log.report(),
+        name=name,
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+def _start_tracing(context: BrowserContext):
+    """Start a Playwright trace when the profile asks for one"""
+    if Config.TRACING != "off":
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+
+def _test_failed(item) -> bool:
+    """Whether the test's setup or call phase has failed so far"""
+    return any(
+        getattr(getattr(item, f"rep_{when}", None), "failed", False) for when in ("setup", "call")
+    )
+
+
+def _stop_tracing(context: BrowserContext, item):
+    """Stop the trace, keeping and attaching it per the tracing policy"""
+    if Config.TRACING == "off":
+        return
+    if Config.TRACING == "on" or _test_failed(item):
+        name = "".join(c if c.isalnum() or c in "-_." else "_" for c in item.nodeid)
+        path = os.path.join(Config.TRACES_DIR, f"{name}.zip")
+        context.tracing.stop(path=path)
+        allure.attach.file(path, name="Playwright Trace", extension="zip")
+    else:
+        context.tracing.stop()
+
+
+def _start_network_log(context: BrowserContext, item):
+    """Record the context's requests when a waterfall may be attached for this test"""
+    return start_network_log(context, force=bool(item.get_closest_marker("network_waterfall")))
+
+
+def _attach_network_log(network_log: NetworkLog, item, failed: bool = None, name: str = "Network Waterfall",
+                        fill_sizes: bool = True):
+    """Attach the request waterfall on failure, or always when the policy or marker asks"""
+    if network_log is None:
+        return
+    if failed is None:
+        failed = _test_failed(item)
+    if Config.NETWORK_LOG_POLICY == "always" or item.get_closest_marker("network_waterfall") or failed:
+        if fill_sizes:
+            network_log.fill_sizes()
+        allure.attach(
+            network_log.waterfall(),
+            name=name,
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+def _get_test_page(item):
+    """Find the page used by a test, whichever fixture provided it"""
+    page = item.funcargs.get("page")
+    if page is None:
+        main_page = item.funcargs.get("main_page")
+        page = getattr(main_page, "page", None)
+    return page
+
+
+@pytest.fixture(scope="session")
+def daemon_lease(browser_name, browser_type_launch_args):
+    """Lease on the warm browser daemon, or None when it is not running"""
+    lease = None
+    # The daemon runs a headless Chromium, so headed and other-browser runs launch locally
+    if (Config.BROWSER_DAEMON_ENABLED and browser_name == "chromium"
+            and browser_type_launch_args.get("headless", True)):
+        lease = browser_daemon.acquire()
+    yield lease
+    if lease:
+        browser_daemon.release(lease["lease"])
+
+
+@pytest.fixture(scope="session")
+def browser(launch_browser, browser_type, browser_type_launch_args, daemon_lease):
+    """Browser from the warm daemon when available, otherwise a local launch"""
+    browser = None
+    if daemon_lease:
+        try:
+            browser = browser_type.connect_over_cdp(
+                daemon_lease["endpoint"], slow_mo=browser_type_launch_args.get("slow_mo")
+            )
+        except Exception as e:
+            print(f"Browser daemon unavailable, launching locally: {e}")
+    if browser is None:
+        browser = launch_browser()
+    yield browser
+    # For a daemon browser this only drops our contexts and disconnects
+    browser.close()
+
+
+@pytest.fixture(scope="function")
+def context(context: BrowserContext, request):
+    """Browser context with network handling applied"""
+    request_filter = prepare_context(context, _resource_profile(request))
+    network_log = _start_network_log(context, request.node)
+    _start_tracing(context)
+    yield context
+    _stop_tracing(context, request.node)
+    _attach_network_log(network_log, request.node)
+    _attach_request_filter_stats(request_filter)
+
+
+@pytest.fixture(scope="function")
+def page(page: Page, request):
+    """Setup and teardown for each test"""
+    request.node.console_log = setup_page(page)
     
     yield page
     
     # Cleanup
+    _attach_console_log(request.node.console_log)
     page.close()
 
 
@@ -27,19 +214,112 @@ def browser_context_args(browser_context_args):
     """Configure browser context"""
     return {
         **browser_context_args,
-        "viewport": {"width": 1920, "height": 1080},
-        "ignore_https_errors": True,
-        "java_script_enabled": True,
+        **Config.CONTEXT_OPTIONS,
     }
 
 
+@pytest.fixture(scope="session")
+def main_page_state(browser: Browser):
+    """Load and settle the main page once per worker, capturing its state"""
+    context = browser.new_context(**Config.CONTEXT_OPTIONS)
+    try:
+        prepare_context(context)
+        page = context.new_page()
+        setup_page(page)
+        
+        responses = []
+        page.on("response", responses.append)
+        
+        main_page = MainPage(page)
+        main_page.collect_metrics = False
+        main_page.navigate_to_main_page()
+        main_page.wait_for_page_load()
+        
+        response_cache = ResponseCache()
+        for response in responses:
+            response_cache.record(response)
+        
+        return {
+            "storage_state": context.storage_state(),
+            "response_cache": response_cache,
+        }
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope="function")
+def preloaded_main_page(browser: Browser, main_page_state, request):
+    """Isolated copy of the loaded main page in a fresh context"""
+    context = browser.new_context(
+        **Config.CONTEXT_OPTIONS,
+        storage_state=main_page_state["storage_state"],
+    )
+    main_page_state["response_cache"].install(context)
+    request_filter = prepare_context(context, _resource_profile(request))
+    network_log = _start_network_log(context, request.node)
+    _start_tracing(context)
+    page = context.new_page()
+    request.node.console_log = setup_page(page)
+    
+    main_page = MainPage(page)
+    main_page.open_preloaded_main_page()
+    
+    yield main_page
+    
+    # Cleanup
+    _attach_console_log(request.node.console_log)
+    _stop_tracing(context, request.node)
+    _attach_network_log(network_log, request.node)
+    context.close()
+    _attach_request_filter_stats(request_filter)
+
+
+@pytest.fixture(scope="function")
+def main_page(request):
+    """Main page object; tests marked `preloaded` get a copy of the warm main page"""
+    if request.node.get_closest_marker("preloaded"):
+        return request.getfixturevalue("preloaded_main_page")
+    return MainPage(request.getfixturevalue("page"))
+
+
+@pytest.fixture(scope="function")
+def console_log(main_page, request):
+    """Console log of the test's page, e.g. for "no new JavaScript errors" assertions"""
+    return request.node.console_log
+
+
+@pytest.fixture(scope="function")
+def async_pages(browser_name, browser_type_launch_args, daemon_lease, request):
+    """Runner that drives async page checks concurrently on one browser"""
+    endpoint = daemon_lease["endpoint"] if daemon_lease else None
+    
+    def report(index: int, result, diagnostics: dict):
+        # Each check has its own context, so its logs are attached under its number
+        failed = isinstance(result, Exception)
+        _attach_console_log(diagnostics["console_log"], f"Console Log (check {index + 1})")
+        # Runs on the asyncio thread, where the sync size lookups are not available
+        _attach_network_log(diagnostics["network_log"], request.node, failed,
+                            f"Network Waterfall (check {index + 1})", fill_sizes=False)
+        _attach_request_filter_stats(diagnostics["request_filter"], f"Blocked Requests (check {index + 1})")
+    
+    def run(checks, concurrency: int = None):
+        return run_page_checks(
+            checks, browser_name, browser_type_launch_args, concurrency, endpoint,
+            resource_profile=_resource_profile(request),
+            network_log=bool(request.node.get_closest_marker("network_waterfall")),
+            on_done=report,
+        )
+    
+    return run
+
+
 @pytest.fixture(scope="session")
 def browser_type_launch_args(browser_type_launch_args):
     """Configure browser launch arguments"""
     return {
         **browser_type_launch_args,
         "headless": not Config.HEADED,
-        "slow_mo": 100,  # Slow down for better visibility in headed mode
+        "slow_mo": Config.SLOW_MO,  # Set by the execution profile; only worth it when watching
     }
 
 
@@ -48,42 +328,200 @@ def pytest_runtest_makereport(item, call):
     """Hook to take screenshots on test failure"""
     outcome = yield
     report = outcome.get_result()
+    # Let fixtures see the outcome of each phase during teardown
+    setattr(item, f"rep_{report.when}", report)
     
     if report.when == "call" and report.failed:
         try:
-            page = item.funcargs.get("page")
+            page = _get_test_page(item)
             if page:
-                if not os.path.exists("screenshots"):
-                    os.makedirs("screenshots")
-                
-                screenshot_name = f"{item.name}_failure"
-                screenshot_path = f"screenshots/{screenshot_name}.png"
-                page.screenshot(path=screenshot_path, full_page=True)
-                
-                # Attach to Allure report
-                import allure
-                allure.attach.file(
-                    screenshot_path,
-                    name=f"Failure Screenshot: {item.name}",
-                    attachment_type=allure.attachment_type.PNG
+                # Captured in memory; encoding runs while the test tears down
+                artifact_pipeline.capture_screenshot(
+                    page, f"Failure Screenshot: {item.name}", key=item.nodeid
                 )
         except Exception as e:
             print(f"Failed to take screenshot: {e}")
+    
+    if report.failed:
+        # Held DOM snapshots are only worth their size when something broke
+        snapshot_service.flush(item.nodeid, failed=True)
+    
+    if report.when == "teardown":
+        # Attach encoded screenshots while the Allure test result is still open
+        artifact_pipeline.flush(item.nodeid)
+        snapshot_service.flush(item.nodeid)
+
+
+def _allure_dir(config):
+    """Results directory passed with --alluredir"""
+    return getattr(config.option, "allure_report_dir", None) or "allure-results"
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_allure_environment():
+def setup_allure_environment(pytestconfig):
     """Setup Allure environment properties"""
-    if not os.path.exists("allure-results"):
-        os.makedirs("allure-results")
-    
-    # Create environment properties file for Allure
-    env_props = """Browser=Chromium
-BaseURL={}
-Headed={}
-Timeout={}
-Python Version=3.10+
-""".format(Config.BASE_URL, Config.HEADED, Config.TIMEOUT)
-    
-    with open("allure-results/environment.properties", "w", encoding="utf-8") as f:
-        f.write(env_props)
+    # Each parallel worker writes into its own --alluredir and the runner
+    # merges them, so the file is never shared between processes
+    update_environment(_allure_dir(pytestconfig), {
+        "Browser": "Chromium",
+        "BaseURL": Config.BASE_URL,
+        "Headed": Config.HEADED,
+        "Timeout": Config.TIMEOUT,
+        "Profile": Config.PROFILE,
+        "Slow Mo": Config.SLOW_MO,
+        "Tracing": Config.TRACING,
+        "Python Version": "3.10+",
+    })
+
+
+# Per-test durations summed over setup, call and teardown, for --timings-out
+_test_durations = {}
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate per-test durations for the run_tests.py scheduler"""
+    entry = _test_durations.setdefault(report.nodeid, {"duration": 0.0, "outcome": "passed"})
+    entry["duration"] += report.duration
+    if report.failed:
+        entry["outcome"] = "failed"
+    elif report.skipped and entry["outcome"] != "failed":
+        entry["outcome"] = "skipped"
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Restrict and order the run to the node ids listed in --test-list"""
+    test_list = config.getoption("test_list")
+    if not test_list:
+        return
+    with open(test_list, "r", encoding="utf-8") as f:
+        order = {line.strip(): i for i, line in enumerate(f) if line.strip()}
+    
+    selected = [item for item in items if item.nodeid in order]
+    deselected = [item for item in items if item.nodeid not in order]
+    selected.sort(key=lambda item: order[item.nodeid])
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist caches and timings, and report cache counters to Allure"""
+    selector_cache.save()
+    network_archive.save()
+    
+    timings_out = session.config.getoption("timings_out")
+    if timings_out:
+        atomic_write_json(timings_out, _test_durations)
+    
+    artifact_pipeline.shutdown()
+    worker = os.getenv('TEST_WORKER_ID', 'main')
+    timeline.write(Config.TIMELINE_DIR, f"timeline-{worker}")
+    
+    adaptive_timeouts.save()
+    timeout_report = adaptive_timeouts.report()
+    atomic_write_json(os.path.join(Config.TIMELINE_DIR, f"timeouts-{worker}.json"), timeout_report)
+    retry_summary = step_retry.summary()
+    if step_retry.history:
+        atomic_write_json(
+            os.path.join(Config.TIMELINE_DIR, f"retries-{worker}.json"),
+            {"summary": retry_summary, "history": step_retry.history}
+        )
+    
+    if page_metrics.records:
+        # Compare with earlier runs before this run's values join the history
+        history = TimingHistory()
+        page_metrics.baseline = history.page_metric_medians(page_metrics.summary(), SUMMARY_METRICS)
+        history.add_page_metrics(page_metrics.records, SUMMARY_METRICS)
+        history.close()
+    
+    results_dir = _allure_dir(session.config)
+    if selector_cache.enabled and os.path.exists(results_dir):
+        stats = selector_cache.stats()
+        update_environment(results_dir, {
+            "Selector Cache Hits": stats["hits"],
+            "Selector Cache Misses": stats["misses"],
+            "Selector Cache Evictions": stats["evictions"],
+        })
+    if adaptive_timeouts.decisions and os.path.exists(results_dir):
+        update_environment(results_dir, {
+            "Timeouts Tightened": len(timeout_report["tightened"]),
+            "Timeouts Loosened": len(timeout_report["loosened"]),
+        })
+    if step_retry.history and os.path.exists(results_dir):
+        update_environment(results_dir, {
+            "Step Retries": retry_summary["retries"],
+            "Steps Recovered": retry_summary["recovered"],
+        })
+    if snapshot_service.stats["attached"] and os.path.exists(results_dir):
+        update_environment(results_dir, {
+            "Snapshot Bytes": snapshot_service.written,
+            "Snapshots Deduplicated": snapshot_service.stats["deduplicated"],
+        })
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report page metrics, adaptive timeout changes, step retries and archive misses"""
+    _report_page_metrics(terminalreporter)
+    _report_adaptive_timeouts(terminalreporter)
+    _report_step_retries(terminalreporter)
+    # Misses come from replay mode, or from third-party requests of a mirror run
+    if not network_archive.missing:
+        return
+    missing = sorted(network_archive.missing)
+    terminalreporter.section("Network archive misses")
+    for key in missing[:20]:
+        terminalreporter.write_line(key)
+    if len(missing) > 20:
+        terminalreporter.write_line(f"... and {len(missing) - 20} more")
+    terminalreporter.write_line(f"Full list: {network_archive.missing_path}")
+
+
+def _report_adaptive_timeouts(terminalreporter):
+    """List the waits whose learned budget differs from the configured timeout"""
+    report = adaptive_timeouts.report()
+    if not (report["tightened"] or report["loosened"]):
+        return
+    terminalreporter.section("Adaptive timeouts")
+    for label in ("tightened", "loosened"):
+        for row in report[label]:
+            terminalreporter.write_line(
+                f"{label:9} {row['default_ms']:>6} -> {row['budget_ms']:>6} ms"
+                f" (p99 {row['p99_ms']} ms, {row['samples']} samples)  {row['key']}"
+            )
+
+
+def _report_step_retries(terminalreporter):
+    """List retried steps and compare their cost with rerunning the whole tests"""
+    if not step_retry.history:
+        return
+    summary = step_retry.summary()
+    terminalreporter.section("Step retries")
+    for entry in step_retry.history:
+        outcome = "recovered" if entry["recovered"] else "failed"
+        terminalreporter.write_line(
+            f"{outcome:9} attempt {entry['attempt']} {entry['retry_ms']:>8} ms  "
+            f"{entry['test']} :: {entry['step']} ({entry['error']})"
+        )
+    terminalreporter.write_line(
+        f"{summary['retries']} retries, {summary['recovered']} recovered, "
+        f"{summary['retry_ms']} ms spent retrying steps; "
+        f"rerunning those tests would have cost about {summary['rerun_cost_ms']} ms"
+    )
+
+
+def _report_page_metrics(terminalreporter):
+    """Median metrics per navigation step, next to the median of earlier runs"""
+    summary = page_metrics.summary()
+    if not summary:
+        return
+    terminalreporter.section("Page performance")
+    for step, medians in summary.items():
+        baseline = page_metrics.baseline.get(step, {})
+        values = []
+        for name in SUMMARY_METRICS:
+            if name not in medians:
+                continue
+            previous = f" (was {baseline[name]:g})" if name in baseline else ""
+            values.append(f"{name}={medians[name]:g}{previous}")
+        breaches = f", {medians['breaches']} over budget" if medians["breaches"] else ""
+        terminalreporter.write_line(f"{step} [{medians['samples']} samples{breaches}]: {' '.join(values)}")
@@ -1,7 +1,160 @@
-from fastapi import FastAPI 
+"""Local mirror of the target site for benchmarking the suite without network noise.
 
-app = FastAPI()
+Serves the captured snapshot of Config.MIRROR_ORIGIN from the network archive
+(`run_tests.py mirror capture`). Every response is prepared once at startup:
+links to the live origin are rewritten to root-relative ones, and ETags and
+gzip/brotli variants are precomputed, so a request costs a dict lookup plus
+the configured injected latency.
 
-@app.get("/")
-async def root():
-    return {"message": "Hello World"}
\ No newline at end of file
+Run with `python fast_fastapi.py` or `run_tests.py mirror start`.
+"""
+import asyncio
+import gzip
+import hashlib
+import os
+import random
+from urllib.parse import urlsplit
+from fastapi import FastAPI, Request, Response
+from config.config import Config
+from utils.json_store import load_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml", "image/svg+xml")
+# Headers that no longer describe the mirrored body or only make sense for the live host
+DROPPED_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "etag", "last-modified",
+    "strict-transport-security", "alt-svc", "set-cookie", "connection", "keep-alive",
+}
+MIN_COMPRESS_BYTES = 1024
+
+
+class MirroredResource:
+    """One archived response with its validator and precomputed encodings"""
+
+    def __init__(self, status: int, headers: dict, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.encoded = {}
+        content_type = headers.get("content-type", "")
+        if len(body) >= MIN_COMPRESS_BYTES and content_type.startswith(COMPRESSIBLE_TYPES):
+            self.encoded["gzip"] = gzip.compress(body, compresslevel=6)
+            if brotli is not None:
+                self.encoded["br"] = brotli.compress(body, quality=5)
+
+    def negotiate(self, accept_encoding: str):
+        """Body and Content-Encoding for the client's Accept-Encoding header"""
+        accepted = set()
+        for token in accept_encoding.lower().split(","):
+            name, _, params = token.strip().partition(";")
+            if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(name.strip())
+        for encoding in ("br", "gzip"):
+            if encoding in self.encoded and (encoding in accepted or "*" in accepted):
+                return self.encoded[encoding], encoding
+        return self.body, None
+
+
+class MirrorSnapshot:
+    """Archived same-origin GET responses of the mirrored site, keyed by path and query"""
+
+    def __init__(self, archive_dir: str, origin: str):
+        self.origin = origin.rstrip("/")
+        self.resources = {}
+        index = load_json(os.path.join(archive_dir, "index.json"), {})
+        host = urlsplit(self.origin).netloc
+        # Absolute links to the live site become root-relative, so they stay on the mirror
+        self.live_prefixes = [f"https://{host}", f"http://{host}", f"//{host}"]
+        for key, entry in index.items():
+            method, _, url = key.partition(" ")
+            parts = urlsplit(url)
+            if method != "GET" or parts.netloc != host:
+                continue
+            body_path = os.path.join(archive_dir, "blobs", entry["body"][:2], entry["body"])
+            try:
+                with open(body_path, "rb") as f:
+                    body = f.read()
+            except OSError:
+                continue
+            headers = {
+                name.lower(): value for name, value in entry["headers"].items()
+                if name.lower() not in DROPPED_HEADERS
+            }
+            if "location" in headers:
+                headers["location"] = self._rewrite(headers["location"])
+            if headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+                body = self._rewrite(body.decode("utf-8", errors="surrogateescape")).encode(
+                    "utf-8", errors="surrogateescape"
+                )
+            self.resources[self.make_key(parts.path, parts.query)] = MirroredResource(
+                entry["status"], headers, body
+            )
+
+    @staticmethod
+    def make_key(path: str, query: str = "") -> str:
+        path = path.rstrip("/") or "/"
+        return f"{path}?{query}" if query else path
+
+    def _rewrite(self, text: str) -> str:
+        for prefix in self.live_prefixes:
+            text = text.replace(f"{prefix}/", "/").replace(prefix, "/")
+        return text
+
+    def lookup(self, path: str, query: str = ""):
+        return self.resources.get(self.make_key(path, query))
+
+
+snapshot = MirrorSnapshot(Config.NETWORK_ARCHIVE_DIR, Config.MIRROR_ORIGIN)
+app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+
+@app.get("/__mirror__/status")
+async def status():
+    return {
+        "origin": snapshot.origin,
+        "resources": len(snapshot.resources),
+        "latency_ms": Config.MIRROR_LATENCY_MS,
+        "jitter_ms": Config.MIRROR_JITTER_MS,
+        "brotli": brotli is not None,
+    }
+
+
+@app.api_route("/{path:path}", methods=["GET", "HEAD"])
+async def serve(request: Request, path: str):
+    if Config.MIRROR_LATENCY_MS or Config.MIRROR_JITTER_MS:
+        await asyncio.sleep((Config.MIRROR_LATENCY_MS + random.uniform(0, Config.MIRROR_JITTER_MS)) / 1000)
+    resource = snapshot.lookup(request.url.path, request.url.query)
+    if resource is None:
+        return Response(status_code=404)
+
+    headers = {**resource.headers, "etag": resource.etag}
+    if resource.encoded:
+        headers["vary"] = "Accept-Encoding"
+    if_none_match = request.headers.get("if-none-match", "")
+    if resource.etag in if_none_match or if_none_match.strip() == "*":
+        headers.pop("content-type", None)
+        return Response(status_code=304, headers=headers)
+
+    body, encoding = resource.negotiate(request.headers.get("accept-encoding", ""))
+    if encoding:
+        headers["content-encoding"] = encoding
+    headers["content-length"] = str(len(body))
+    return Response(
+        content=body if request.method == "GET" else b"",
+        status_code=resource.status,
+        headers=headers
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "fast_fastapi:app", host=Config.MIRROR_HOST, port=Config.MIRROR_PORT,
+        workers=Config.MIRROR_WORKERS, access_log=False, log_level="warning"
+    )
@@ -2,5 +2,19 @@
 
 from .base_page import BasePage
 from .main_page import MainPage
+from .async_base_page import AsyncBasePage
+from .async_main_page import AsyncMainPage
+from .locators import MainPageLocators, NAVIGATION_TARGETS
+from .selector_resolver import SelectorResolver, AsyncSelectorResolver, SelectorNotFoundError
 
-__all__ = ['BasePage', 'MainPage']
\ No newline at end of file
+__all__ = [
+    'BasePage',
+    'MainPage',
+    'AsyncBasePage',
+    'AsyncMainPage',
+    'MainPageLocators',
+    'NAVIGATION_TARGETS',
+    'SelectorResolver',
+    'AsyncSelectorResolver',
+    'SelectorNotFoundError'
+]
\ No newline at end of file
@@ -0,0 +1,174 @@
+from playwright.async_api import Page
+from config.config import Config
+from utils.adaptive_timeouts import adaptive_timeouts
+from utils.page_metrics import page_metrics
+from utils.selector_cache import SelectorCache, selector_cache
+from utils.instrumentation import timed_action, timeline
+from .dom_queries import (
+    MARK_NAVIGATION_SCRIPT, NAVIGATION_MARK, PAGE_METRICS_SCRIPT, QUERY_ELEMENTS_SCRIPT, WAIT_VISIBLE_SCRIPT
+)
+from .readiness import ReadinessEngine
+from .selector_resolver import AsyncSelectorResolver, SelectorNotFoundError
+
+
+class AsyncBasePage:
+    """playwright.async_api counterpart of BasePage.
+
+    Methods mirror BasePage one to one. Allure steps are not opened here because
+    concurrent coroutines would interleave them; callers attach results instead.
+    """
+
+    # Page object name used in selector cache keys; defaults to the class name
+    cache_name = None
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.base_url = Config.BASE_URL
+        self.timeout = Config.PLAYWRIGHT_TIMEOUT
+        self.probe_timeout = Config.PROBE_TIMEOUT
+        self.element_timeout = Config.ELEMENT_TIMEOUT
+        self.navigation_wait_timeout = Config.NAVIGATION_WAIT_TIMEOUT
+        self.resolver = AsyncSelectorResolver(page, selector_cache)
+        self.readiness = ReadinessEngine.from_name(page, Config.READINESS_STRATEGY, Config.DOM_QUIET_MS)
+        self.url_before_click = None
+        self.last_action = None
+        self.metrics_pending = False
+        # Off for warm-up loads, which belong to no test and must not fail on budgets
+        self.collect_metrics = True
+
+    def wait_key(self, wait: str) -> str:
+        """Key of a wait in the latency history, built like selector cache keys"""
+        return SelectorCache.make_key(self.cache_name or type(self).__name__, wait, self.base_url)
+
+    @timed_action
+    async def navigate_to(self, url: str = None):
+        """Navigate to a specific URL"""
+        target_url = url if url else self.base_url
+        await self.page.goto(target_url, timeout=self.timeout)
+        await self.wait_until_ready("navigate")
+        await self.collect_page_metrics("navigate")
+
+    @timed_action
+    async def wait_until_ready(self, step: str, timeout: int = None, previous_url: str = None):
+        """Wait for the page to settle using the configured readiness strategy"""
+        if timeout:
+            with timeline.waiting():
+                return await self.readiness.wait_until_ready_async(step, timeout, previous_url)
+        with adaptive_timeouts.measure(self.wait_key(f"ready:{step}"), self.timeout) as budget:
+            with timeline.waiting():
+                return await self.readiness.wait_until_ready_async(step, budget, previous_url)
+
+    async def wait_for_navigation(self, timeout: int = None):
+        """Wait for the navigation triggered by the last click to settle"""
+        if timeout:
+            measurement = await self.wait_until_ready("navigation", timeout, self.url_before_click)
+        else:
+            key = self.wait_key(f"navigation after {self.last_action or 'click'}")
+            with adaptive_timeouts.measure(key, self.navigation_wait_timeout) as budget:
+                measurement = await self.wait_until_ready("navigation", budget, self.url_before_click)
+        # Measured once per click, outside the wait so a budget breach is not taken for a timeout
+        if self.metrics_pending:
+            self.metrics_pending = False
+            await self.collect_page_metrics(f"navigation after {self.last_action or 'click'}")
+        return measurement
+
+    async def collect_page_metrics(self, step: str):
+        """Collect the page's performance metrics and check them against the budgets"""
+        if not (self.collect_metrics and page_metrics.enabled):
+            return None
+        metrics = await self.page.evaluate(PAGE_METRICS_SCRIPT, {"mark": NAVIGATION_MARK})
+        return page_metrics.record(step, self.page.url, metrics, attach=False)
+
+    async def _before_navigation_click(self, action: str):
+        """Remember where a click starts from and mark it for the navigation metrics"""
+        self.url_before_click = self.page.url
+        self.last_action = action
+        if self.collect_metrics and page_metrics.enabled:
+            await self.page.evaluate(MARK_NAVIGATION_SCRIPT, NAVIGATION_MARK)
+            self.metrics_pending = True
+
+    @timed_action
+    async def wait_for_element(self, locator, timeout: int = None):
+        """Wait for element to be visible"""
+        if timeout:
+            with timeline.waiting():
+                await self.page.locator(locator).wait_for(state="visible", timeout=timeout)
+            return
+        with adaptive_timeouts.measure(self.wait_key(f"visible:{locator}"), self.timeout) as budget:
+            with timeline.waiting():
+                await self.page.locator(locator).wait_for(state="visible", timeout=budget)
+
+    @timed_action
+    async def click_element(self, locator, timeout: int = None):
+        """Click on element with wait"""
+        await self.wait_for_element(locator, timeout)
+        await self._before_navigation_click(locator)
+        await self.page.locator(locator).click(timeout=timeout or self.timeout)
+
+    @timed_action
+    async def click_first_visible(self, selectors, name: str = None, timeout: int = None):
+        """Click the first visible element out of fallback selectors"""
+        cache_key = SelectorCache.make_key(self.cache_name or type(self).__name__, name, self.base_url)
+        if timeout:
+            resolution = await self.resolver.resolve(selectors, timeout, name, cache_key)
+        else:
+            with adaptive_timeouts.measure(
+                self.wait_key(f"probe:{name}"), self.probe_timeout, (SelectorNotFoundError,)
+            ) as budget:
+                resolution = await self.resolver.resolve(selectors, budget, name, cache_key)
+        await self._before_navigation_click(name)
+        await self.resolver.visible(resolution["selector"]).first.click(timeout=self.timeout)
+        return resolution
+
+    @timed_action
+    async def get_text(self, locator, timeout: int = None):
+        """Get text from element"""
+        await self.wait_for_element(locator, timeout)
+        return await self.page.locator(locator).text_content(timeout=timeout or self.timeout)
+
+    @timed_action
+    async def is_element_visible(self, locator, timeout: int = None):
+        """Check if element is visible"""
+        timeout = timeout or self.timeout
+        try:
+            with timeline.waiting():
+                await self.page.locator(locator).wait_for(state="visible", timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    @timed_action
+    async def query_elements(self, selectors, attributes=("href",)):
+        """Text, attributes, visibility and bounding box of every element in one evaluation"""
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return await self.page.evaluate(
+            QUERY_ELEMENTS_SCRIPT, {"selectors": list(selectors), "attributes": list(attributes)}
+        )
+
+    @timed_action
+    async def wait_for_all_visible(self, locators, timeout: int = None):
+        """Wait for several elements in one window and report each one's time to visible"""
+        keys = {locator: self.wait_key(f"visible:{locator}") for locator in locators}
+        budgets = {
+            locator: timeout or adaptive_timeouts.budget(key, self.element_timeout)
+            for locator, key in keys.items()
+        }
+        with timeline.waiting():
+            results = await self.page.evaluate(WAIT_VISIBLE_SCRIPT, {"budgets": budgets, "pollMs": 100})
+        if not timeout:
+            for locator, result in results.items():
+                if result["visible"]:
+                    adaptive_timeouts.observe(keys[locator], result["ms"])
+                else:
+                    adaptive_timeouts.observe(keys[locator], budgets[locator], timed_out=True)
+        return results
+
+    def verify_url(self, expected_url: str):
+        """Verify current URL matches expected"""
+        current_url = self.page.url
+        assert expected_url in current_url, f"Expected URL '{expected_url}' not found in '{current_url}'"
+
+    async def take_screenshot(self, name: str):
+        """Take screenshot for debugging"""
+        await self.page.screenshot(path=f"screenshots/{name}.png")
@@ -0,0 +1,116 @@
+import allure
+from playwright.async_api import Page, expect
+from utils.step_retry import step_retry
+from .async_base_page import AsyncBasePage
+from .locators import MainPageLocators
+
+
+class AsyncMainPage(AsyncBasePage):
+    """playwright.async_api counterpart of MainPage sharing its locators"""
+
+    cache_name = "MainPage"
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+        # Navigation locators
+        self.navigation_menu = MainPageLocators.NAVIGATION_MENU
+        self.about_us_link = MainPageLocators.ABOUT_US_LINK
+        self.contacts_link = MainPageLocators.CONTACTS_LINK
+        self.services_link = MainPageLocators.SERVICES_LINK
+        self.careers_link = MainPageLocators.CAREERS_LINK
+        self.blog_link = MainPageLocators.BLOG_LINK
+
+        # Fallback selectors per navigation link, in priority order
+        self.about_us_selectors = MainPageLocators.ABOUT_US_SELECTORS
+        self.contacts_selectors = MainPageLocators.CONTACTS_SELECTORS
+        self.services_selectors = MainPageLocators.SERVICES_SELECTORS
+        self.careers_selectors = MainPageLocators.CAREERS_SELECTORS
+        self.blog_selectors = MainPageLocators.BLOG_SELECTORS
+
+        # Common navigation patterns
+        self.header_logo = MainPageLocators.HEADER_LOGO
+        self.main_navigation = MainPageLocators.MAIN_NAVIGATION
+        self.footer = MainPageLocators.FOOTER
+
+        # URL patterns
+        self.about_us_url_pattern = MainPageLocators.ABOUT_US_URL_PATTERN
+        self.contacts_url_pattern = MainPageLocators.CONTACTS_URL_PATTERN
+        self.services_url_pattern = MainPageLocators.SERVICES_URL_PATTERN
+        self.careers_url_pattern = MainPageLocators.CAREERS_URL_PATTERN
+        self.blog_url_pattern = MainPageLocators.BLOG_URL_PATTERN
+
+    async def navigate_to_main_page(self):
+        """Navigate to the main page"""
+        await self.navigate_to()
+        await self.page.wait_for_load_state("domcontentloaded")
+
+    async def wait_for_page_load(self):
+        """Wait for the page to fully load"""
+        await self.page.wait_for_selector(MainPageLocators.ROOT, timeout=self.timeout)
+        await self.wait_until_ready("page load")
+
+    async def open_preloaded_main_page(self):
+        """Open the main page in a context warmed from a session snapshot"""
+        await self.page.goto(self.base_url, wait_until="domcontentloaded", timeout=self.timeout)
+        await self.page.wait_for_selector(MainPageLocators.ROOT, timeout=self.timeout)
+
+    async def click_about_us(self):
+        """Click on About Us navigation link"""
+        return await self.click_first_visible(self.about_us_selectors, "About Us link")
+
+    async def click_contacts(self):
+        """Click on Contacts navigation link"""
+        return await self.click_first_visible(self.contacts_selectors, "Contacts link")
+
+    async def click_services(self):
+        """Click on Services navigation link"""
+        return await self.click_first_visible(self.services_selectors, "Services link")
+
+    async def click_careers(self):
+        """Click on Careers navigation link"""
+        return await self.click_first_visible(self.careers_selectors, "Careers link")
+
+    async def click_blog(self):
+        """Click on Blog navigation link"""
+        return await self.click_first_visible(self.blog_selectors, "Blog link")
+
+    async def get_navigation_links(self):
+        """Get all navigation links for analysis"""
+        for selector in MainPageLocators.NAVIGATION_LINK_SELECTORS:
+            links = self.page.locator(selector)
+            if await links.count() > 0:
+                return await links.all()
+
+        return []
+
+    async def get_navigation_link_info(self):
+        """Text, href, visibility and bounding box of every navigation link in one round trip"""
+        return await self.query_elements(MainPageLocators.NAVIGATION_LINK_SELECTORS, attributes=("href",))
+
+    async def verify_section_url(self, section: str, url_patterns):
+        """Assert the URL belongs to a section, re-waiting for a navigation that lands late"""
+        async def verify_url():
+            current_url = self.page.url
+            assert any(pattern in current_url.lower() for pattern in url_patterns), \
+                f"URL '{current_url}' does not contain expected {section} page patterns"
+
+        await step_retry.run_async(
+            f"Verify URL contains {section} section", verify_url, previous=self.wait_for_navigation
+        )
+
+    async def verify_main_page_elements(self):
+        """Verify that main page elements are present"""
+        await expect(self.page).to_have_url(self.base_url)
+
+        results = await self.wait_for_all_visible(
+            [self.header_logo, self.main_navigation, MainPageLocators.ROOT]
+        )
+        for element, result in results.items():
+            if not result["visible"]:
+                allure.attach(
+                    f"Element {element} not found on page",
+                    name="Missing Element",
+                    attachment_type=allure.attachment_type.TEXT
+                )
+        return results
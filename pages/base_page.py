@@ -1,46 +1,196 @@
+import json
+import allure
 import pytest
 from playwright.sync_api import Page, expect
 from config.config import Config
+from utils.adaptive_timeouts import adaptive_timeouts
+from utils.page_metrics import page_metrics
+from utils.selector_cache import SelectorCache, selector_cache
+from utils.instrumentation import timed_action, timeline
+from .dom_queries import (
+    MARK_NAVIGATION_SCRIPT, NAVIGATION_MARK, PAGE_METRICS_SCRIPT, QUERY_ELEMENTS_SCRIPT, WAIT_VISIBLE_SCRIPT
+)
+from .readiness import ReadinessEngine
+from .selector_resolver import SelectorNotFoundError, SelectorResolver
 
 
 class BasePage:
+    # Page object name used in selector cache keys; defaults to the class name
+    cache_name = None
+    
     def __init__(self, page: Page):
         self.page = page
         self.base_url = Config.BASE_URL
         self.timeout = Config.PLAYWRIGHT_TIMEOUT
+        self.probe_timeout = Config.PROBE_TIMEOUT
+        self.element_timeout = Config.ELEMENT_TIMEOUT
+        self.navigation_wait_timeout = Config.NAVIGATION_WAIT_TIMEOUT
+        self.resolver = SelectorResolver(page, selector_cache)
+        self.readiness = ReadinessEngine.from_name(page, Config.READINESS_STRATEGY, Config.DOM_QUIET_MS)
+        self.url_before_click = None
+        self.last_action = None
+        self.metrics_pending = False
+        # Off for warm-up loads, which belong to no test and must not fail on budgets
+        self.collect_metrics = True
+    
+    def wait_key(self, wait: str) -> str:
+        """Key of a wait in the latency history, built like selector cache keys"""
+        return SelectorCache.make_key(self.cache_name or type(self).__name__, wait, self.base_url)
     
+    @timed_action
     def navigate_to(self, url: str = None):
         """Navigate to a specific URL"""
         target_url = url if url else self.base_url
         self.page.goto(target_url, timeout=self.timeout)
-        self.page.wait_for_load_state("networkidle", timeout=self.timeout)
+        self.wait_until_ready("navigate")
+        self.collect_page_metrics("navigate")
+    
+    @timed_action
+    def wait_until_ready(self, step: str, timeout: int = None, previous_url: str = None):
+        """Wait for the page to settle using the configured readiness strategy.
+        
+        Without an explicit timeout the budget is learned from past waits of this step.
+        """
+        if timeout:
+            return self._wait_until_ready(step, timeout, previous_url)
+        with adaptive_timeouts.measure(self.wait_key(f"ready:{step}"), self.timeout) as budget:
+            return self._wait_until_ready(step, budget, previous_url)
+    
+    def _wait_until_ready(self, step: str, timeout: int, previous_url: str = None):
+        with timeline.waiting():
+            measurement = self.readiness.wait_until_ready(step, timeout, previous_url)
+        allure.attach(
+            json.dumps(measurement, indent=2),
+            name=f"Readiness: {step}",
+            attachment_type=allure.attachment_type.JSON
+        )
+        return measurement
+    
+    def wait_for_navigation(self, timeout: int = None):
+        """Wait for the navigation triggered by the last click to settle"""
+        if timeout:
+            measurement = self.wait_until_ready("navigation", timeout, self.url_before_click)
+        else:
+            key = self.wait_key(f"navigation after {self.last_action or 'click'}")
+            with adaptive_timeouts.measure(key, self.navigation_wait_timeout) as budget:
+                measurement = self.wait_until_ready("navigation", budget, self.url_before_click)
+        # Measured once per click, outside the wait so a budget breach is not taken for a timeout
+        if self.metrics_pending:
+            self.metrics_pending = False
+            self.collect_page_metrics(f"navigation after {self.last_action or 'click'}")
+        return measurement
+    
+    def collect_page_metrics(self, step: str):
+        """Collect the page's performance metrics and check them against the budgets"""
+        if not (self.collect_metrics and page_metrics.enabled):
+            return None
+        metrics = self.page.evaluate(PAGE_METRICS_SCRIPT, {"mark": NAVIGATION_MARK})
+        return page_metrics.record(step, self.page.url, metrics)
+    
+    def _before_navigation_click(self, action: str):
+        """Remember where a click starts from and mark it for the navigation metrics"""
+        self.url_before_click = self.page.url
+        self.last_action = action
+        if self.collect_metrics and page_metrics.enabled:
+            self.page.evaluate(MARK_NAVIGATION_SCRIPT, NAVIGATION_MARK)
+            self.metrics_pending = True
     
+    @timed_action
     def wait_for_element(self, locator, timeout: int = None):
         """Wait for element to be visible"""
-        timeout = timeout or self.timeout
-        self.page.locator(locator).wait_for(state="visible", timeout=timeout)
+        if timeout:
+            with timeline.waiting():
+                self.page.locator(locator).wait_for(state="visible", timeout=timeout)
+            return
+        with adaptive_timeouts.measure(self.wait_key(f"visible:{locator}"), self.timeout) as budget:
+            with timeline.waiting():
+                self.page.locator(locator).wait_for(state="visible", timeout=budget)
     
+    @timed_action
     def click_element(self, locator, timeout: int = None):
         """Click on element with wait"""
-        timeout = timeout or self.timeout
         self.wait_for_element(locator, timeout)
-        self.page.locator(locator).click(timeout=timeout)
+        self._before_navigation_click(locator)
+        self.page.locator(locator).click(timeout=timeout or self.timeout)
+    
+    @timed_action
+    def click_first_visible(self, selectors, name: str = None, timeout: int = None):
+        """Click the first visible element out of fallback selectors"""
+        cache_key = SelectorCache.make_key(self.cache_name or type(self).__name__, name, self.base_url)
+        if timeout:
+            resolution = self.resolver.resolve(selectors, timeout, name, cache_key)
+        else:
+            with adaptive_timeouts.measure(
+                self.wait_key(f"probe:{name}"), self.probe_timeout, (SelectorNotFoundError,)
+            ) as budget:
+                resolution = self.resolver.resolve(selectors, budget, name, cache_key)
+        allure.attach(
+            json.dumps(resolution, indent=2, ensure_ascii=False),
+            name=f"Selector resolution: {resolution['name']}",
+            attachment_type=allure.attachment_type.JSON
+        )
+        self._before_navigation_click(name)
+        self.resolver.visible(resolution["selector"]).first.click(timeout=self.timeout)
+        return resolution
     
+    @timed_action
     def get_text(self, locator, timeout: int = None):
         """Get text from element"""
-        timeout = timeout or self.timeout
         self.wait_for_element(locator, timeout)
-        return self.page.locator(locator).text_content(timeout=timeout)
+        return self.page.locator(locator).text_content(timeout=timeout or self.timeout)
     
+    @timed_action
     def is_element_visible(self, locator, timeout: int = None):
         """Check if element is visible"""
         timeout = timeout or self.timeout
         try:
-            self.page.locator(locator).wait_for(state="visible", timeout=timeout)
+            with timeline.waiting():
+                self.page.locator(locator).wait_for(state="visible", timeout=timeout)
             return True
         except:
             return False
     
+    @timed_action
+    def query_elements(self, selectors, attributes=("href",)):
+        """Text, attributes, visibility and bounding box of every element in one evaluation.
+        
+        `selectors` are CSS fallbacks tried in order; the first one with matches is used.
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return self.page.evaluate(
+            QUERY_ELEMENTS_SCRIPT, {"selectors": list(selectors), "attributes": list(attributes)}
+        )
+    
+    @timed_action
+    def wait_for_all_visible(self, locators, timeout: int = None):
+        """Wait for several elements in one window and report each one's time to visible.
+        
+        All locators are checked by a single in-page wait, so missing elements cost
+        no more than the largest budget instead of one timeout each. Without an
+        explicit timeout every element gets its learned budget. Returns
+        {locator: {"visible": bool, "ms": time to visible or None}}; nothing is raised.
+        """
+        keys = {locator: self.wait_key(f"visible:{locator}") for locator in locators}
+        budgets = {
+            locator: timeout or adaptive_timeouts.budget(key, self.element_timeout)
+            for locator, key in keys.items()
+        }
+        with timeline.waiting():
+            results = self.page.evaluate(WAIT_VISIBLE_SCRIPT, {"budgets": budgets, "pollMs": 100})
+        if not timeout:
+            for locator, result in results.items():
+                if result["visible"]:
+                    adaptive_timeouts.observe(keys[locator], result["ms"])
+                else:
+                    adaptive_timeouts.observe(keys[locator], budgets[locator], timed_out=True)
+        allure.attach(
+            json.dumps({"budgets_ms": budgets, "results": results}, indent=2),
+            name=f"Visibility of {len(locators)} elements",
+            attachment_type=allure.attachment_type.JSON
+        )
+        return results
+    
     def verify_url(self, expected_url: str):
         """Verify current URL matches expected"""
         current_url = self.page.url
@@ -0,0 +1,143 @@
+# Collects text, attributes, visibility and bounding box of every element
+# matched by the first selector (in priority order) that matches anything.
+# Runs as a single evaluation, so N elements cost one round trip instead of
+# several Locator calls each. Selectors must be plain CSS.
+QUERY_ELEMENTS_SCRIPT = """
+({ selectors, attributes }) => {
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = Array.from(document.querySelectorAll(selector));
+        } catch (e) {
+            continue;
+        }
+        if (!elements.length) continue;
+        return elements.map((element, index) => {
+            const rect = element.getBoundingClientRect();
+            const style = window.getComputedStyle(element);
+            const attrs = {};
+            for (const name of attributes) attrs[name] = element.getAttribute(name);
+            return {
+                index,
+                selector,
+                text: (element.textContent || "").trim(),
+                visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+                bbox: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
+                ...attrs,
+            };
+        });
+    }
+    return [];
+}
+"""
+
+
+# Waits for several selectors at once inside the page and reports, per
+# selector, whether it became visible and how many ms that took. Each
+# selector has its own budget; the promise settles once every selector is
+# visible or past its budget, so the whole wait costs at most the largest
+# budget. DOM mutations trigger a re-check, with a short poll as a fallback
+# for style and layout changes that mutations do not reveal.
+WAIT_VISIBLE_SCRIPT = """
+({ budgets, pollMs }) => new Promise(resolve => {
+    const started = performance.now();
+    const results = {};
+    const isVisible = element => {
+        const rect = element.getBoundingClientRect();
+        const style = window.getComputedStyle(element);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+    };
+    let observer = null;
+    let timer = null;
+    const check = () => {
+        const elapsed = performance.now() - started;
+        let pending = false;
+        for (const [selector, budget] of Object.entries(budgets)) {
+            if (results[selector]) continue;
+            let elements;
+            try {
+                elements = Array.from(document.querySelectorAll(selector));
+            } catch (e) {
+                results[selector] = { visible: false, ms: null, error: String(e.message || e) };
+                continue;
+            }
+            if (elements.some(isVisible)) {
+                results[selector] = { visible: true, ms: Math.round(elapsed * 10) / 10 };
+            } else if (elapsed >= budget) {
+                results[selector] = { visible: false, ms: null, found: elements.length };
+            } else {
+                pending = true;
+            }
+        }
+        if (!pending) {
+            if (observer) observer.disconnect();
+            clearInterval(timer);
+            resolve(results);
+        }
+        return pending;
+    };
+    if (!check()) return;
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+    timer = setInterval(check, pollMs);
+})
+"""
+
+
+# Set right before a click, so the metrics of a client-side navigation only
+# count what happened after it. A full page load discards the mark.
+NAVIGATION_MARK = "test:navigation-start"
+MARK_NAVIGATION_SCRIPT = "name => { performance.clearMarks(name); performance.mark(name); }"
+
+# Navigation Timing, paint, LCP, CLS, request count and transfer sizes of the
+# current document, or of the client-side navigation since NAVIGATION_MARK.
+# Times are ms from the navigation start; metrics a browser does not support
+# are null. LCP is only reported for full loads, as browsers stop it at input.
+PAGE_METRICS_SCRIPT = """
+async ({ mark }) => {
+    const observed = type => new Promise(resolve => {
+        if (!(PerformanceObserver.supportedEntryTypes || []).includes(type)) return resolve(null);
+        const entries = [];
+        const observer = new PerformanceObserver(list => entries.push(...list.getEntries()));
+        observer.observe({ type, buffered: true });
+        setTimeout(() => { observer.disconnect(); resolve(entries); }, 10);
+    });
+    const round = value => value === null || value === undefined ? null : Math.round(value * 10) / 10;
+    const markEntry = performance.getEntriesByName(mark, "mark").pop();
+    const soft = !!markEntry;
+    const start = soft ? markEntry.startTime : 0;
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paints = {};
+    for (const paint of performance.getEntriesByType("paint")) paints[paint.name] = paint.startTime;
+    const [lcpEntries, shifts] = await Promise.all([observed("largest-contentful-paint"), observed("layout-shift")]);
+    const resources = performance.getEntriesByType("resource").filter(r => r.startTime >= start);
+    const byType = {};
+    let transfer = soft || !nav ? 0 : nav.transferSize || 0;
+    let encoded = soft || !nav ? 0 : nav.encodedBodySize || 0;
+    for (const resource of resources) {
+        byType[resource.initiatorType] = (byType[resource.initiatorType] || 0) + 1;
+        transfer += resource.transferSize || 0;
+        encoded += resource.encodedBodySize || 0;
+    }
+    const lcp = !soft && lcpEntries && lcpEntries.length ? lcpEntries[lcpEntries.length - 1].startTime : null;
+    const cls = shifts === null ? null : shifts
+        .filter(shift => !shift.hadRecentInput && shift.startTime >= start)
+        .reduce((sum, shift) => sum + shift.value, 0);
+    if (soft) performance.clearMarks(mark);
+    return {
+        soft_navigation: soft,
+        ttfb_ms: !soft && nav ? round(nav.responseStart) : null,
+        dom_content_loaded_ms: !soft && nav ? round(nav.domContentLoadedEventEnd) : null,
+        load_ms: !soft && nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+        first_paint_ms: soft ? null : round(paints["first-paint"]),
+        fcp_ms: soft ? null : round(paints["first-contentful-paint"]),
+        lcp_ms: round(lcp),
+        cls: cls === null ? null : Math.round(cls * 1000) / 1000,
+        duration_ms: round(soft || !nav || !nav.loadEventEnd ? performance.now() - start : nav.loadEventEnd),
+        requests: resources.length + (soft ? 0 : 1),
+        requests_by_type: byType,
+        transfer_bytes: transfer,
+        encoded_body_bytes: encoded,
+    };
+}
+"""
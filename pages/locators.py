@@ -0,0 +1,103 @@
+class MainPageLocators:
+    """Locators shared by the sync and async main page objects"""
+
+    NAVIGATION_MENU = "nav"
+    ABOUT_US_LINK = "text=О нас"
+    CONTACTS_LINK = "text=Контакты"
+    SERVICES_LINK = "text=Услуги"
+    CAREERS_LINK = "text=Карьера"
+    BLOG_LINK = "text=Блог"
+
+    # Fallback selectors per navigation link, in priority order
+    ABOUT_US_SELECTORS = [
+        "text=О нас",
+        "text=О компании",
+        "[href*='about']",
+        "a:has-text('О нас')",
+        "a:has-text('О компании')"
+    ]
+    CONTACTS_SELECTORS = [
+        "text=Контакты",
+        "text=Contact us",
+        "[href*='contact']",
+        "a:has-text('Контакты')",
+        "a:has-text('Contact')"
+    ]
+    SERVICES_SELECTORS = [
+        "text=Услуги",
+        "text=Services",
+        "[href*='service']",
+        "a:has-text('Услуги')",
+        "a:has-text('Services')"
+    ]
+    CAREERS_SELECTORS = [
+        "text=Карьера",
+        "text=Careers",
+        "[href*='career']",
+        "a:has-text('Карьера')",
+        "a:has-text('Careers')"
+    ]
+    BLOG_SELECTORS = [
+        "text=Блог",
+        "text=Blog",
+        "[href*='blog']",
+        "a:has-text('Блог')",
+        "a:has-text('Blog')"
+    ]
+
+    # Common navigation patterns
+    HEADER_LOGO = "header img[alt*='logo'], .logo"
+    MAIN_NAVIGATION = "header nav, .main-nav, .navigation"
+    FOOTER = "footer"
+    ROOT = "#root"
+    NAVIGATION_LINK_SELECTORS = [
+        "header nav a",
+        ".main-nav a",
+        ".navigation a",
+        "nav a",
+        ".menu a"
+    ]
+
+    # URL patterns
+    ABOUT_US_URL_PATTERN = "/about"
+    CONTACTS_URL_PATTERN = "/contact"
+    SERVICES_URL_PATTERN = "/service"
+    CAREERS_URL_PATTERN = "/career"
+    BLOG_URL_PATTERN = "/blog"
+
+    # Every URL fragment accepted after navigating to a section
+    ABOUT_US_URL_PATTERNS = ["/about", "/o-nas", "/company", "/о-нас"]
+    CONTACTS_URL_PATTERNS = ["/contact", "/kontakty", "/contacts", "/контакты"]
+    SERVICES_URL_PATTERNS = ["/service", "/uslugi", "/services", "/услуги"]
+    CAREERS_URL_PATTERNS = ["/career", "/karera", "/careers", "/карьера", "/vacancy", "/vacancies"]
+    BLOG_URL_PATTERNS = ["/blog", "/news", "/статьи", "/articles"]
+
+
+# Navigation sections checked by the suite: key -> link name, selectors, accepted URLs
+NAVIGATION_TARGETS = {
+    "about_us": {
+        "name": "About Us link",
+        "selectors": MainPageLocators.ABOUT_US_SELECTORS,
+        "url_patterns": MainPageLocators.ABOUT_US_URL_PATTERNS,
+    },
+    "contacts": {
+        "name": "Contacts link",
+        "selectors": MainPageLocators.CONTACTS_SELECTORS,
+        "url_patterns": MainPageLocators.CONTACTS_URL_PATTERNS,
+    },
+    "services": {
+        "name": "Services link",
+        "selectors": MainPageLocators.SERVICES_SELECTORS,
+        "url_patterns": MainPageLocators.SERVICES_URL_PATTERNS,
+    },
+    "careers": {
+        "name": "Careers link",
+        "selectors": MainPageLocators.CAREERS_SELECTORS,
+        "url_patterns": MainPageLocators.CAREERS_URL_PATTERNS,
+    },
+    "blog": {
+        "name": "Blog link",
+        "selectors": MainPageLocators.BLOG_SELECTORS,
+        "url_patterns": MainPageLocators.BLOG_URL_PATTERNS,
+    },
+}
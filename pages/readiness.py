@@ -0,0 +1,177 @@
+import time
+from playwright.sync_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
+
+
+# Installs a MutationObserver on first call and reports whether the DOM has
+# been quiet for `quietMs`. Attribute churn (animations, carousels) is ignored.
+DOM_QUIET_SCRIPT = """
+(quietMs) => {
+    let state = window.__qaDomSettle;
+    if (!state) {
+        state = window.__qaDomSettle = { last: performance.now() };
+        new MutationObserver(() => { state.last = performance.now(); })
+            .observe(document, { childList: true, subtree: true, characterData: true });
+    }
+    return document.readyState !== "loading" && performance.now() - state.last >= quietMs;
+}
+"""
+
+
+class ReadinessStrategy:
+    """Base class for a way of deciding that a page is ready"""
+
+    name = "base"
+
+    def wait(self, page: Page, timeout: int, previous_url: str = None):
+        raise NotImplementedError
+
+    async def wait_async(self, page, timeout: int, previous_url: str = None):
+        raise NotImplementedError
+
+
+class UrlChange(ReadinessStrategy):
+    """Ready once the URL differs from the one before the action"""
+
+    name = "url-change"
+
+    def wait(self, page: Page, timeout: int, previous_url: str = None):
+        if previous_url is None:
+            return
+        page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+
+    async def wait_async(self, page, timeout: int, previous_url: str = None):
+        if previous_url is None:
+            return
+        await page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+
+
+class DomQuiescence(ReadinessStrategy):
+    """Ready once the DOM has stopped mutating for a quiet period"""
+
+    name = "dom-quiescence"
+
+    def __init__(self, quiet_ms: int = 300, polling: int = 100):
+        self.quiet_ms = quiet_ms
+        self.polling = polling
+
+    def wait(self, page: Page, timeout: int, previous_url: str = None):
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                page.wait_for_function(
+                    DOM_QUIET_SCRIPT, arg=self.quiet_ms, polling=self.polling,
+                    timeout=max(int((deadline - time.monotonic()) * 1000), 1)
+                )
+                return
+            except PlaywrightTimeoutError:
+                raise
+            except PlaywrightError as e:
+                # A navigation replaced the document mid-wait; observe the new one
+                if "context was destroyed" not in str(e) or time.monotonic() >= deadline:
+                    raise
+
+    async def wait_async(self, page, timeout: int, previous_url: str = None):
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                await page.wait_for_function(
+                    DOM_QUIET_SCRIPT, arg=self.quiet_ms, polling=self.polling,
+                    timeout=max(int((deadline - time.monotonic()) * 1000), 1)
+                )
+                return
+            except PlaywrightTimeoutError:
+                raise
+            except PlaywrightError as e:
+                if "context was destroyed" not in str(e) or time.monotonic() >= deadline:
+                    raise
+
+
+class NetworkIdle(ReadinessStrategy):
+    """Ready once there has been no network traffic for 500 ms"""
+
+    name = "networkidle"
+
+    def wait(self, page: Page, timeout: int, previous_url: str = None):
+        page.wait_for_load_state("networkidle", timeout=timeout)
+
+    async def wait_async(self, page, timeout: int, previous_url: str = None):
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+
+
+class ReadinessEngine:
+    """Run readiness strategies in order, falling back to another one on timeout.
+
+    Every wait is recorded with the strategy that settled it and the time it took.
+    """
+
+    def __init__(self, page: Page, strategies=None, fallback: ReadinessStrategy = None):
+        self.page = page
+        self.strategies = strategies if strategies is not None else [UrlChange(), DomQuiescence()]
+        self.fallback = fallback
+        self.history = []
+
+    @classmethod
+    def from_name(cls, page: Page, name: str, quiet_ms: int = 300):
+        """Build an engine for a configured strategy name"""
+        if name == "networkidle":
+            return cls(page, [NetworkIdle()])
+        if name == "dom":
+            return cls(page, [UrlChange(), DomQuiescence(quiet_ms)], fallback=NetworkIdle())
+        raise ValueError(f"Unknown readiness strategy '{name}', expected 'dom' or 'networkidle'")
+
+    def _plan(self, timeout: int, previous_url: str = None):
+        """Strategies to run now, with the overall and the primary deadline"""
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        # Keep half of the budget for the fallback so a miss can still settle
+        primary_deadline = start + timeout / 2000 if self.fallback else deadline
+        strategies = [
+            s for s in self.strategies
+            if not (isinstance(s, UrlChange) and previous_url is None)
+        ]
+        return start, deadline, primary_deadline, strategies
+
+    def _record(self, step: str, used, start: float):
+        measurement = {
+            "step": step,
+            "strategy": "+".join(used),
+            "fallback": self.fallback is not None and used[-1:] == [self.fallback.name],
+            "elapsed_ms": round((time.monotonic() - start) * 1000, 1),
+        }
+        self.history.append(measurement)
+        return measurement
+
+    def wait_until_ready(self, step: str, timeout: int, previous_url: str = None):
+        """Wait until the page is ready and return the recorded measurement"""
+        start, deadline, primary_deadline, strategies = self._plan(timeout, previous_url)
+        used = []
+        try:
+            for strategy in strategies:
+                strategy.wait(self.page, self._remaining_ms(primary_deadline), previous_url)
+                used.append(strategy.name)
+        except PlaywrightTimeoutError:
+            if self.fallback is None:
+                raise
+            used.append(self.fallback.name)
+            self.fallback.wait(self.page, self._remaining_ms(deadline), previous_url)
+        return self._record(step, used, start)
+
+    async def wait_until_ready_async(self, step: str, timeout: int, previous_url: str = None):
+        """Async variant of wait_until_ready for playwright.async_api pages"""
+        start, deadline, primary_deadline, strategies = self._plan(timeout, previous_url)
+        used = []
+        try:
+            for strategy in strategies:
+                await strategy.wait_async(self.page, self._remaining_ms(primary_deadline), previous_url)
+                used.append(strategy.name)
+        except PlaywrightTimeoutError:
+            if self.fallback is None:
+                raise
+            used.append(self.fallback.name)
+            await self.fallback.wait_async(self.page, self._remaining_ms(deadline), previous_url)
+        return self._record(step, used, start)
+
+    @staticmethod
+    def _remaining_ms(deadline: float) -> int:
+        # Playwright treats 0 as "no timeout", so never pass it
+        return max(int((deadline - time.monotonic()) * 1000), 1)
@@ -0,0 +1,145 @@
+import time
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from utils.instrumentation import timeline
+
+
+class SelectorNotFoundError(Exception):
+    """Raised when none of the candidate selectors became visible"""
+
+
+class SelectorResolver:
+    """Resolve the first visible selector out of a list of fallback candidates.
+
+    All candidates are raced inside a single wait window instead of being
+    probed one after another, so a miss costs one timeout, not one per candidate.
+    """
+
+    def __init__(self, page: Page, cache=None):
+        self.page = page
+        self.cache = cache
+        self.history = []
+
+    def visible(self, selector: str):
+        """Locator matching only visible elements for the selector"""
+        return self.page.locator(f"{selector} >> visible=true")
+
+    def _race(self, selectors):
+        """Build a single locator matching any visible candidate"""
+        race = self.visible(selectors[0])
+        for selector in selectors[1:]:
+            race = race.or_(self.visible(selector))
+        return race.first
+
+    def _cached(self, selectors, cache_key: str):
+        """Return the cached winner (if still a candidate) and the candidate order"""
+        cached = None
+        if self.cache is not None and cache_key:
+            cached = self.cache.get(cache_key)
+            if cached not in selectors:
+                cached = None
+        if cached:
+            # Try the remembered winner first, both in the fast path and the race
+            selectors = [cached] + [s for s in selectors if s != cached]
+        return cached, list(selectors)
+
+    def _finish(self, name, selectors, index, winner, cached, cache_key, start):
+        """Record the resolution, update the cache and raise on a miss"""
+        resolution = {
+            "name": name,
+            "selector": winner,
+            "index": index,
+            "candidates": selectors,
+            "elapsed_ms": round((time.monotonic() - start) * 1000, 1),
+        }
+        if self.cache is not None and cache_key:
+            hit = cached is not None and winner == cached
+            resolution["cache"] = "hit" if hit else "miss"
+            self.cache.record(hit)
+            if cached and not hit:
+                self.cache.evict(cache_key)
+            if winner is not None:
+                self.cache.put(cache_key, winner)
+        self.history.append(resolution)
+
+        if winner is None:
+            raise SelectorNotFoundError(f"{name} not found")
+        return resolution
+
+    def _pick_winner(self, selectors):
+        """Return (index, selector) of the first candidate with a visible match"""
+        for index, selector in enumerate(selectors):
+            if self.visible(selector).count() > 0:
+                return index, selector
+        return None, None
+
+    def resolve(self, selectors, timeout: int, name: str = None, cache_key: str = None):
+        """Wait for any candidate to become visible and return the resolution record"""
+        name = name or "element"
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        cached, selectors = self._cached(selectors, cache_key)
+
+        index, winner = None, None
+        if cached and self.visible(cached).count() > 0:
+            index, winner = 0, cached
+
+        race = self._race(selectors)
+        attempts = 0
+        while winner is None:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            if attempts:
+                # The visible match vanished before it could be picked
+                timeline.note_retry()
+            attempts += 1
+            try:
+                with timeline.waiting():
+                    race.wait_for(state="visible", timeout=remaining_ms or 1)
+            except PlaywrightTimeoutError:
+                break
+            # Candidate order is the priority order when several are visible
+            index, winner = self._pick_winner(selectors)
+            if winner is None and time.monotonic() >= deadline:
+                break
+
+        return self._finish(name, selectors, index, winner, cached, cache_key, start)
+
+
+class AsyncSelectorResolver(SelectorResolver):
+    """SelectorResolver for pages driven through playwright.async_api"""
+
+    async def _pick_winner(self, selectors):
+        """Return (index, selector) of the first candidate with a visible match"""
+        for index, selector in enumerate(selectors):
+            if await self.visible(selector).count() > 0:
+                return index, selector
+        return None, None
+
+    async def resolve(self, selectors, timeout: int, name: str = None, cache_key: str = None):
+        """Wait for any candidate to become visible and return the resolution record"""
+        name = name or "element"
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        cached, selectors = self._cached(selectors, cache_key)
+
+        index, winner = None, None
+        if cached and await self.visible(cached).count() > 0:
+            index, winner = 0, cached
+
+        race = self._race(selectors)
+        attempts = 0
+        while winner is None:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            if attempts:
+                # The visible match vanished before it could be picked
+                timeline.note_retry()
+            attempts += 1
+            try:
+                with timeline.waiting():
+                    await race.wait_for(state="visible", timeout=remaining_ms or 1)
+            except PlaywrightTimeoutError:
+                break
+            index, winner = await self._pick_winner(selectors)
+            if winner is None and time.monotonic() >= deadline:
+                break
+
+        return self._finish(name, selectors, index, winner, cached, cache_key, start)
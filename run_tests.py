@@ -6,28 +6,59 @@ import os
 import sys
 import subprocess
 import argparse
+import atexit
+import statistics
+import time
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run command and handle errors"""
+def export_settings_args(argv):
+    """Put --profile-name and --step-retries into the environment before Config is imported
+
+    Config and the module-level objects built from it read the profile once, at
+    import, so the crawl and smoke stages of this process need it as early as
+    the pytest processes do.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile-name")
+    parser.add_argument("--step-retries", type=int)
+    args, _ = parser.parse_known_args(argv)
+    if args.profile_name:
+        os.environ["TEST_PROFILE"] = args.profile_name
+    if args.step_retries is not None:
+        os.environ["STEP_RETRIES"] = str(args.step_retries)
+
+
+export_settings_args(sys.argv[1:])
+try:
+    from config.config import PROFILES, Config
+except ValueError as error:
+    sys.exit(f"run_tests.py: error: {error}")
+
+from runner.crawler import CRAWL_MODES, run_crawl
+from runner.daemon import DAEMON_COMMANDS
+from runner.mirror import MIRROR_COMMANDS, mirror_status, mirror_url, start_mirror, stop_mirror
+from runner.parallel import record_timings, run_parallel
+from runner.profile import print_slowest_steps, reset_timeline
+from runner.smoke import run_smoke
+from runner.stream import LiveOutput, ProgressTracker, run_log, stream_command
+from runner.timings import DEFAULT_TEST_ESTIMATE, TimingHistory
+
+
+def run_command(command, description, tracker: ProgressTracker = None):
+    """Run command, streaming its output with live progress and teeing it to the run log"""
     print(f"\n{'='*50}")
     print(f"Running: {description}")
     print(f"Command: {command}")
     print(f"{'='*50}")
     
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    output = LiveOutput(tracker, run_log(Config.RUN_LOG_PATH, Config.RUN_LOG_MAX_BYTES, Config.RUN_LOG_BACKUPS))
+    output.log.info(f"=== {description}: {command}")
+    return_code = stream_command(command, output)
+    output.summary(description)
     
-    if result.stdout:
-        print("STDOUT:")
-        print(result.stdout)
-    
-    if result.stderr:
-        print("STDERR:")
-        print(result.stderr)
-    
-    if result.returncode != 0:
-        print(f"Command failed with return code: {result.returncode}")
+    if return_code != 0:
+        print(f"Command failed with return code: {return_code}")
         return False
     
     return True
@@ -54,7 +85,28 @@ def check_dependencies():
         return False
 
 
+def daemon_main(argv):
+    """run_tests.py daemon start|stop|status"""
+    parser = argparse.ArgumentParser(prog="run_tests.py daemon", description="Manage the warm browser daemon")
+    parser.add_argument("command", choices=list(DAEMON_COMMANDS), help="Start, stop or inspect the daemon")
+    args = parser.parse_args(argv)
+    sys.exit(0 if DAEMON_COMMANDS[args.command]() else 1)
+
+
+def mirror_main(argv):
+    """run_tests.py mirror capture|start|stop|status"""
+    parser = argparse.ArgumentParser(prog="run_tests.py mirror", description="Capture and serve a local mirror of the site")
+    parser.add_argument("command", choices=list(MIRROR_COMMANDS), help="Capture the snapshot, or start, stop or inspect the mirror")
+    args = parser.parse_args(argv)
+    sys.exit(0 if MIRROR_COMMANDS[args.command]() else 1)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "daemon":
+        daemon_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "mirror":
+        mirror_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(description="Run Effective Mobile website tests")
     parser.add_argument("--headed", action="store_true", help="Run tests with visible browser")
     parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"], help="Browser to use")
@@ -62,8 +114,24 @@ def main():
     parser.add_argument("--serve-report", action="store_true", help="Serve Allure report after generation")
     parser.add_argument("--specific-test", help="Run specific test file or method")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
-    parser.add_argument("--reruns", type=int, default=0, help="Number of reruns on failure")
+    parser.add_argument("--reruns", type=int, default=0, help="Number of whole-test reruns on failure (see --step-retries for cheaper step-level retries)")
+    parser.add_argument("--step-retries", type=int, help="Retries of a failing step inside a test before it fails")
+    parser.add_argument("--network", choices=["live", "record", "replay"], help="Network mode: record responses, replay them offline, or use the live site")
+    parser.add_argument("--mirror", action="store_true", help="Run against the local mirror server instead of the live site (started if needed)")
+    parser.add_argument("--workers", help="Run tests in N parallel worker processes (or 'auto' for one per CPU core)")
+    parser.add_argument("--profile", action="store_true", help="Print the slowest steps and page-object actions after the run")
+    parser.add_argument("--profile-name", choices=list(PROFILES), help="Execution profile: fast (lowest latency), standard, debug or forensic")
     parser.add_argument("--check-deps", action="store_true", help="Check dependencies before running tests")
+    parser.add_argument("--smoke", action="store_true", help="Check navigation links over plain HTTP first and stop if any is broken")
+    parser.add_argument("--smoke-only", action="store_true", help="Run only the HTTP smoke tier")
+    parser.add_argument("--refresh-nav-links", action="store_true", help="Reload the cached navigation links from the main page")
+    parser.add_argument("--crawl", action="store_true", help="Crawl every page reachable from the main navigation instead of running tests")
+    parser.add_argument("--crawl-mode", choices=CRAWL_MODES, help="Fetch pages over plain HTTP or with browser pages")
+    parser.add_argument("--crawl-workers", type=int, help="Number of pages fetched at once")
+    parser.add_argument("--crawl-depth", type=int, help="Maximum link depth from the navigation links")
+    parser.add_argument("--crawl-rate", type=float, help="Maximum requests per second (0 = unlimited)")
+    parser.add_argument("--crawl-max-pages", type=int, help="Stop discovering pages after this many URLs")
+    parser.add_argument("--resume-crawl", action="store_true", help="Continue the last crawl from its checkpoint")
     
     args = parser.parse_args()
     
@@ -73,9 +141,36 @@ def main():
             sys.exit(1)
         print("\nDependencies check completed.\n")
     
+    if args.mirror:
+        if not mirror_status():
+            if not start_mirror():
+                sys.exit(1)
+            atexit.register(stop_mirror)
+        # pytest processes read BASE_URL from the environment; this process already loaded Config
+        os.environ["BASE_URL"] = Config.BASE_URL = mirror_url()
+    
     # Ensure directories exist
     ensure_directories()
     
+    if args.crawl or args.resume_crawl:
+        success = run_crawl(
+            mode=args.crawl_mode, browser_name=args.browser, workers=args.crawl_workers,
+            max_depth=args.crawl_depth, rate=args.crawl_rate, max_pages=args.crawl_max_pages,
+            resume=args.resume_crawl
+        )
+        sys.exit(0 if success else 1)
+    
+    # Browserless smoke tier: fail fast before any browser starts
+    if args.smoke or args.smoke_only:
+        print("\nRunning HTTP smoke tier...")
+        if not run_smoke(args.browser, refresh=args.refresh_nav_links):
+            print("HTTP smoke tier failed, browser tests were not started")
+            sys.exit(1)
+        if args.smoke_only:
+            sys.exit(0)
+    
+    reset_timeline(Config.TIMELINE_DIR)
+    
     # Build pytest command
     pytest_cmd = "pytest"
     
@@ -86,7 +181,9 @@ def main():
         pytest_cmd += " --headed"
     
     pytest_cmd += f" --browser={args.browser}"
-    pytest_cmd += " --alluredir=./allure-results"
+    
+    if args.network:
+        pytest_cmd += f" --network={args.network}"
     
     if args.reruns > 0:
         pytest_cmd += f" --reruns {args.reruns}"
@@ -95,7 +192,31 @@ def main():
         pytest_cmd += f" {args.specific_test}"
     
     # Run tests
-    success = run_command(pytest_cmd, "Running automated tests")
+    if args.workers:
+        success = run_parallel(pytest_cmd, args.workers, "allure-results")
+    else:
+        timings_file = Path(".cache/last-run-timings.json")
+        history = TimingHistory()
+        known = history.recent_estimates()
+        tracker = ProgressTracker(
+            history=known,
+            default_estimate=statistics.median(known.values()) if known else DEFAULT_TEST_ESTIMATE
+        )
+        # A run that dies before writing its timings must not store the previous run's
+        timings_file.unlink(missing_ok=True)
+        started = time.time()
+        success = run_command(
+            f"{pytest_cmd} --alluredir=./allure-results --timings-out={timings_file}",
+            "Running automated tests",
+            tracker
+        )
+        run_id = history.start_run(1)
+        record_timings(history, run_id, [timings_file], ["allure-results"], started)
+        history.finish_run(run_id, time.time() - started)
+        history.close()
+    
+    if args.profile:
+        print_slowest_steps(Config.TIMELINE_DIR)
     
     if not success:
         print("Tests failed!")
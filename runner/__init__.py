@@ -0,0 +1 @@
+"""Helpers used by run_tests.py to orchestrate test runs."""
\ No newline at end of file
@@ -0,0 +1,356 @@
+import asyncio
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from playwright.async_api import async_playwright
+from config.config import Config
+from pages.async_base_page import AsyncBasePage
+from utils.async_runner import run_page_checks
+from utils.http_client import HttpClient
+from utils.json_store import atomic_write_json, load_json
+
+
+CRAWL_MODES = ("http", "browser")
+# Cached hrefs of the main navigation, refreshed by every seeding page load
+NAV_LINKS_CACHE = ".cache/nav_links.json"
+# Query parameters that never change page content
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "yclid", "_openstat")
+# Pages between two checkpoint writes
+CHECKPOINT_EVERY = 20
+
+
+def normalize_url(url: str, base: str = None):
+    """Canonical form used for the visited index, or None for non-HTTP or malformed links.
+
+    Resolves relative links, drops fragments and tracking parameters, lowercases
+    scheme and host, strips default ports and trailing slashes, sorts the query.
+    """
+    try:
+        if base:
+            url = urljoin(base, url)
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        # Malformed hrefs such as "http://host:abc/" or "http://[::1" are not links
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return None
+    host = (parts.hostname or "").lower()
+    if port and port != (443 if scheme == "https" else 80):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class LinkExtractor(HTMLParser):
+    """Collect href values of <a> tags from server-rendered HTML"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href)
+
+
+def load_cached_nav_links(path: str = NAV_LINKS_CACHE, base_url: str = None):
+    """Navigation hrefs saved by the last seeding page load of `base_url` (default Config.BASE_URL)"""
+    cached = load_json(path, {})
+    # Links seeded from another host (a mirror, another stand) would all be filtered out as off-site
+    if cached.get("base_url") != normalize_url(base_url or Config.BASE_URL):
+        return []
+    return cached.get("links", [])
+
+
+def seed_navigation_links(browser_name: str = "chromium", launch_args: dict = None,
+                          cache_path: str = NAV_LINKS_CACHE):
+    """Load the main page once and return its navigation hrefs, caching them on disk"""
+    async def collect(main_page):
+        main_page.collect_metrics = False
+        await main_page.navigate_to_main_page()
+        await main_page.wait_for_page_load()
+        links = await main_page.get_navigation_link_info()
+        return main_page.page.url, links
+
+    result, = run_page_checks([collect], browser_name, launch_args or {"headless": not Config.HEADED}, 1)
+    if isinstance(result, Exception):
+        raise result
+    page_url, links = result
+    hrefs = []
+    for link in links:
+        url = normalize_url(link["href"] or "", page_url)
+        if url and url not in hrefs:
+            hrefs.append(url)
+    atomic_write_json(cache_path, {
+        "base_url": normalize_url(Config.BASE_URL), "page": page_url, "saved_at": time.time(), "links": hrefs
+    })
+    return hrefs
+
+
+class HttpFetcher:
+    """Fetch pages with a pooled HTTP client and parse links from the raw HTML"""
+
+    def __init__(self, workers: int):
+        self.client = HttpClient(timeout=Config.PLAYWRIGHT_TIMEOUT / 1000, max_per_host=workers)
+
+    async def start(self):
+        pass
+
+    async def fetch(self, url: str):
+        response = await asyncio.to_thread(self.client.fetch, url)
+        record = response.to_dict()
+        links = []
+        if "html" in response.content_type and response.body:
+            extractor = LinkExtractor()
+            extractor.feed(response.body.decode("utf-8", errors="replace"))
+            links = extractor.links
+        return record, links
+
+    async def close(self):
+        self.client.close()
+
+
+class BrowserFetcher:
+    """Fetch pages with a pool of browser pages so client-rendered links are seen"""
+
+    def __init__(self, workers: int, browser_name: str = "chromium", launch_args: dict = None):
+        self.workers = workers
+        self.browser_name = browser_name
+        self.launch_args = launch_args or {"headless": not Config.HEADED}
+        self._pages = asyncio.Queue()
+        self._playwright = None
+        self._browser = None
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await getattr(self._playwright, self.browser_name).launch(**self.launch_args)
+        for _ in range(self.workers):
+            context = await self._browser.new_context(**Config.CONTEXT_OPTIONS)
+            page = await context.new_page()
+            page.set_default_timeout(Config.PLAYWRIGHT_TIMEOUT)
+            self._pages.put_nowait(AsyncBasePage(page))
+
+    async def fetch(self, url: str):
+        base_page = await self._pages.get()
+        record = {"url": url, "final_url": url, "status": None, "redirect_chain": [], "elapsed_ms": 0.0, "error": None}
+        links = []
+        start = time.monotonic()
+        try:
+            response = await base_page.page.goto(url, wait_until="domcontentloaded")
+            if response is not None:
+                record["status"] = response.status
+                chain = []
+                request = response.request.redirected_from
+                while request is not None:
+                    redirect = await request.response()
+                    chain.append({"url": request.url, "status": redirect.status if redirect else None})
+                    request = request.redirected_from
+                record["redirect_chain"] = list(reversed(chain))
+            record["final_url"] = base_page.page.url
+            await base_page.wait_until_ready("crawl", Config.PLAYWRIGHT_TIMEOUT)
+            links = [link["href"] for link in await base_page.query_elements("a[href]") if link["href"]]
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            record["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+            self._pages.put_nowait(base_page)
+        return record, links
+
+    async def close(self):
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+
+class RateLimiter:
+    """Space request starts at least 1/rate seconds apart across all workers"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Crawler:
+    """Breadth-first crawl of one site with a bounded worker pool.
+
+    Every URL is visited once per normalized form. The result is a link graph:
+    a node per URL with status, timing and redirect chain, and an edge per link.
+    Progress is checkpointed so an interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(self, fetcher, seeds, workers: int = 4, max_depth: int = 2, rate: float = 0,
+                 max_pages: int = 500, checkpoint: str = None, allowed_hosts=None):
+        self.fetcher = fetcher
+        self.seeds = [url for url in (normalize_url(seed) for seed in seeds) if url]
+        self.workers = workers
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.checkpoint = checkpoint
+        self.rate_limiter = RateLimiter(rate)
+        self.allowed_hosts = set(allowed_hosts or {urlsplit(url).netloc for url in self.seeds})
+        self.nodes = {}
+        self.edges = []
+        self.seen = set()
+        self.frontier = {}
+        self._since_checkpoint = 0
+
+    def _load_checkpoint(self):
+        state = load_json(self.checkpoint, None) if self.checkpoint else None
+        if not state:
+            return False
+        self.nodes = state["nodes"]
+        self.edges = [tuple(edge) for edge in state["edges"]]
+        self.frontier = {url: depth for url, depth in state["frontier"]}
+        self.seen = set(self.nodes) | set(self.frontier)
+        return True
+
+    def _save_checkpoint(self, finished: bool = False):
+        if self.checkpoint:
+            atomic_write_json(self.checkpoint, {
+                "seeds": self.seeds,
+                "finished": finished,
+                "nodes": self.nodes,
+                "edges": self.edges,
+                "frontier": sorted(self.frontier.items()),
+            })
+        self._since_checkpoint = 0
+
+    def _enqueue(self, queue, url: str, depth: int):
+        if url in self.seen or len(self.seen) >= self.max_pages:
+            return
+        self.seen.add(url)
+        self.frontier[url] = depth
+        queue.put_nowait((url, depth))
+
+    async def _worker(self, queue):
+        while True:
+            url, depth = await queue.get()
+            try:
+                await self.rate_limiter.wait()
+                record, links = await self.fetcher.fetch(url)
+                record["depth"] = depth
+                self.nodes[url] = record
+
+                base = record.get("final_url") or url
+                for href in links:
+                    target = normalize_url(href, base)
+                    if not target:
+                        continue
+                    self.edges.append((url, target))
+                    if depth < self.max_depth and urlsplit(target).netloc in self.allowed_hosts:
+                        self._enqueue(queue, target, depth + 1)
+
+                # Only now is the page done; a checkpoint taken earlier keeps it in the frontier
+                self.frontier.pop(url, None)
+                self._since_checkpoint += 1
+                if self._since_checkpoint >= CHECKPOINT_EVERY:
+                    self._save_checkpoint()
+            except Exception as e:
+                # A worker that died here would leave queue.join() waiting forever
+                node = self.nodes.setdefault(url, {
+                    "url": url, "final_url": url, "status": None, "redirect_chain": [], "elapsed_ms": 0.0,
+                    "depth": depth,
+                })
+                node["error"] = f"{type(e).__name__}: {e}"
+                self.frontier.pop(url, None)
+            finally:
+                queue.task_done()
+
+    async def crawl(self, resume: bool = False):
+        """Run the crawl and return the link graph"""
+        queue = asyncio.Queue()
+        if resume and self._load_checkpoint():
+            for url, depth in self.frontier.items():
+                queue.put_nowait((url, depth))
+        else:
+            for seed in self.seeds:
+                self._enqueue(queue, seed, 0)
+
+        started = time.monotonic()
+        await self.fetcher.start()
+        tasks = [asyncio.create_task(self._worker(queue)) for _ in range(self.workers)]
+        try:
+            await queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.fetcher.close()
+            self._save_checkpoint(finished=not self.frontier)
+
+        return {
+            "seeds": self.seeds,
+            "elapsed_s": round(time.monotonic() - started, 2),
+            "nodes": self.nodes,
+            "edges": sorted(set(self.edges)),
+        }
+
+
+def summarize_graph(graph: dict) -> dict:
+    """Counts of visited pages by status class, errors and redirects"""
+    summary = {"pages": len(graph["nodes"]), "links": len(graph["edges"]), "errors": [], "redirects": 0}
+    for url, node in graph["nodes"].items():
+        status = node.get("status")
+        bucket = f"{status // 100}xx" if status else "no response"
+        summary[bucket] = summary.get(bucket, 0) + 1
+        if node.get("redirect_chain"):
+            summary["redirects"] += 1
+        if node.get("error") or not status or status >= 400:
+            summary["errors"].append({"url": url, "status": status, "error": node.get("error")})
+    return summary
+
+
+def run_crawl(mode: str = None, browser_name: str = "chromium", workers: int = None, max_depth: int = None,
+              rate: float = None, max_pages: int = None, resume: bool = False, output_dir: str = None):
+    """Seed from the main navigation, crawl, and write the link graph; True if no page failed"""
+    mode = mode or Config.CRAWL_MODE
+    workers = workers or Config.CRAWL_WORKERS
+    max_depth = Config.CRAWL_MAX_DEPTH if max_depth is None else max_depth
+    rate = Config.CRAWL_RATE if rate is None else rate
+    max_pages = max_pages or Config.CRAWL_MAX_PAGES
+    output = Path(output_dir or Config.CRAWL_DIR)
+    checkpoint = output / "checkpoint.json"
+
+    if resume and checkpoint.exists():
+        seeds = load_json(str(checkpoint), {}).get("seeds", [])
+    else:
+        print("Collecting navigation links from the main page...")
+        seeds = [Config.BASE_URL] + seed_navigation_links(browser_name)
+
+    fetcher = HttpFetcher(workers) if mode == "http" else BrowserFetcher(workers, browser_name)
+    crawler = Crawler(
+        fetcher, seeds, workers=workers, max_depth=max_depth, rate=rate,
+        max_pages=max_pages, checkpoint=str(checkpoint),
+        allowed_hosts={urlsplit(normalize_url(Config.BASE_URL)).netloc}
+    )
+    graph = asyncio.run(crawler.crawl(resume=resume))
+    summary = summarize_graph(graph)
+    atomic_write_json(str(output / "link-graph.json"), graph)
+    atomic_write_json(str(output / "summary.json"), summary)
+
+    print(f"\nCrawled {summary['pages']} pages ({summary['links']} links) in {graph['elapsed_s']}s")
+    for error in summary["errors"]:
+        print(f"  ✗ {error['status'] or '---'} {error['url']} {error['error'] or ''}")
+    print(f"Link graph written to {output / 'link-graph.json'}")
+    return not summary["errors"]
@@ -0,0 +1,312 @@
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from config.config import Config
+from utils.browser_daemon import DAEMON_STATE_PATH, browser_daemon
+from utils.json_store import atomic_write_json
+
+
+DAEMON_LOG_PATH = ".cache/browser-daemon.log"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _process_tree_rss_mb(root_pid: int):
+    """Resident memory of a process and all its descendants in MB, or None without Linux /proc"""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    rss = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            status = (entry / "status").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                rss[int(entry.name)] = int(line.split()[1])
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return round(total / 1024, 1)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process exists, without signalling it on any platform"""
+    if os.name == "nt":
+        # os.kill(pid, 0) sends CTRL_C_EVENT on Windows, so ask the kernel instead
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            # Access denied means the process exists but belongs to someone else
+            return ctypes.get_last_error() == 5
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WarmBrowser:
+    """A headless Chromium kept running with a CDP endpoint for test sessions.
+
+    Sessions lease the browser and only ever use fresh contexts, so nothing
+    leaks between them. The browser is relaunched once no lease is active and
+    either `max_sessions` sessions have used it or its memory outgrew `max_rss_mb`.
+    """
+
+    def __init__(self, max_sessions: int, max_rss_mb: float):
+        self.max_sessions = max_sessions
+        self.max_rss_mb = max_rss_mb
+        self.process = None
+        self.port = None
+        self.profile_dir = None
+        self.sessions = 0
+        self.restarts = 0
+        self.started_at = None
+        self.leases = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _executable() -> str:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            return playwright.chromium.executable_path
+
+    def start(self):
+        self.port = _free_port()
+        self.profile_dir = tempfile.mkdtemp(prefix="browser-daemon-")
+        self.process = subprocess.Popen(
+            [
+                self._executable(), "--headless=new", "--no-sandbox", "--no-first-run",
+                "--no-default-browser-check", f"--remote-debugging-port={self.port}",
+                f"--user-data-dir={self.profile_dir}", "about:blank",
+            ],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(f"{self.endpoint}/json/version", timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            self.stop()
+            raise RuntimeError("Browser did not open its debugging port")
+        self.sessions = 0
+        self.started_at = time.time()
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.process = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def rss_mb(self):
+        return _process_tree_rss_mb(self.process.pid) if self.process else 0.0
+
+    def _reap_leases(self):
+        """Drop leases of test processes that died without releasing them"""
+        for lease, pid in list(self.leases.items()):
+            if not _pid_alive(pid):
+                del self.leases[lease]
+
+    def _restart_reason(self):
+        if self.process is None or self.process.poll() is not None:
+            return "browser exited"
+        if self.sessions >= self.max_sessions:
+            return f"{self.sessions} sessions"
+        if self.max_rss_mb:
+            # Not measurable on Windows and macOS, where only the session limit applies
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                return f"memory above {self.max_rss_mb} MB"
+        return None
+
+    def _maybe_restart(self):
+        self._reap_leases()
+        reason = self._restart_reason()
+        # A dead browser cannot serve its leases anyway, so do not wait for them
+        if reason and (not self.leases or reason == "browser exited"):
+            print(f"Restarting browser: {reason}", flush=True)
+            self.stop()
+            self.start()
+            self.restarts += 1
+
+    def acquire(self, pid: int) -> dict:
+        with self.lock:
+            self._maybe_restart()
+            lease = uuid.uuid4().hex
+            self.leases[lease] = pid
+            self.sessions += 1
+            return {"lease": lease, "endpoint": self.endpoint}
+
+    def release(self, lease: str) -> dict:
+        with self.lock:
+            self.leases.pop(lease, None)
+            # Restart now, so the next session does not wait for it
+            self._maybe_restart()
+            return self.status()
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "browser_pid": self.process.pid if self.process else None,
+            "endpoint": self.endpoint,
+            "uptime_s": round(time.time() - self.started_at, 1) if self.started_at else 0,
+            "sessions": self.sessions,
+            "max_sessions": self.max_sessions,
+            "active_leases": len(self.leases),
+            "restarts": self.restarts,
+            "rss_mb": self.rss_mb(),
+            "max_rss_mb": self.max_rss_mb,
+        }
+
+
+def serve(max_sessions: int = None, max_rss_mb: float = None):
+    """Run the daemon in the foreground until /shutdown or SIGTERM"""
+    browser = WarmBrowser(
+        max_sessions or Config.BROWSER_DAEMON_MAX_SESSIONS,
+        Config.BROWSER_DAEMON_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+    )
+    browser.start()
+
+    class ControlHandler(BaseHTTPRequestHandler):
+        def _reply(self, body: dict, code: int = 200):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _payload(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            if self.path == "/status":
+                with browser.lock:
+                    self._reply(browser.status())
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def do_POST(self):
+            payload = self._payload()
+            if self.path == "/acquire":
+                self._reply(browser.acquire(payload.get("pid", 0)))
+            elif self.path == "/release":
+                self._reply(browser.release(payload.get("lease", "")))
+            elif self.path == "/shutdown":
+                self._reply({"stopping": True})
+                threading.Thread(target=server.shutdown, daemon=True).start()
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ControlHandler)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    atomic_write_json(DAEMON_STATE_PATH, {"pid": os.getpid(), "control_port": server.server_address[1]})
+    print(f"Browser daemon listening on 127.0.0.1:{server.server_address[1]}, browser at {browser.endpoint}", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        browser.stop()
+        if os.path.exists(DAEMON_STATE_PATH):
+            os.remove(DAEMON_STATE_PATH)
+
+
+def start_daemon() -> bool:
+    """Start the daemon in the background unless one is already answering"""
+    if browser_daemon.status():
+        print("Browser daemon is already running")
+        return True
+    Path(DAEMON_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
+    with open(DAEMON_LOG_PATH, "a", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "runner.daemon"],
+            stdout=log, stderr=subprocess.STDOUT, start_new_session=True
+        )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        status = browser_daemon.status()
+        if status:
+            print(f"Browser daemon started (pid {status['pid']}, browser at {status['endpoint']})")
+            return True
+        time.sleep(0.2)
+    print(f"Browser daemon did not start, see {DAEMON_LOG_PATH}")
+    return False
+
+
+def stop_daemon() -> bool:
+    if not browser_daemon.shutdown():
+        print("Browser daemon is not running")
+        return True
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and os.path.exists(DAEMON_STATE_PATH):
+        time.sleep(0.1)
+    print("Browser daemon stopped")
+    return True
+
+
+def print_status() -> bool:
+    status = browser_daemon.status()
+    if not status:
+        print("Browser daemon is not running")
+        return False
+    for key, value in status.items():
+        print(f"  {key}: {value}")
+    return True
+
+
+DAEMON_COMMANDS = {"start": start_daemon, "stop": stop_daemon, "status": print_status}
+
+
+if __name__ == "__main__":
+    serve()
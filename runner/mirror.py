@@ -0,0 +1,134 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+from config.config import Config
+from pages.dom_queries import QUERY_ELEMENTS_SCRIPT
+from pages.locators import MainPageLocators
+from utils.json_store import atomic_write_json, load_json
+from utils.network_archive import NetworkArchive
+from .crawler import normalize_url
+
+
+MIRROR_STATE_PATH = ".cache/mirror.json"
+MIRROR_LOG_PATH = ".cache/mirror.log"
+
+
+def mirror_url() -> str:
+    return Config.MIRROR_URL
+
+
+def capture_snapshot(browser_name: str = "chromium", origin: str = None) -> bool:
+    """Record the live main page and every navigation target into the network archive"""
+    from playwright.sync_api import sync_playwright
+
+    origin = (origin or Config.MIRROR_ORIGIN).rstrip("/")
+    archive = NetworkArchive(Config.NETWORK_ARCHIVE_DIR, "record")
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_name).launch(headless=True)
+        context = browser.new_context(**Config.CONTEXT_OPTIONS)
+        archive.install(context)
+        page = context.new_page()
+        page.goto(f"{origin}/", wait_until="networkidle", timeout=Config.PLAYWRIGHT_TIMEOUT)
+        links = page.evaluate(QUERY_ELEMENTS_SCRIPT, {
+            "selectors": MainPageLocators.NAVIGATION_LINK_SELECTORS, "attributes": ["href"]
+        })
+        targets = []
+        for link in links:
+            url = normalize_url(link["href"] or "", page.url)
+            if url and urlsplit(url).netloc == urlsplit(page.url).netloc and url not in targets:
+                targets.append(url)
+        for url in targets:
+            try:
+                page.goto(url, wait_until="networkidle", timeout=Config.PLAYWRIGHT_TIMEOUT)
+                print(f"  ✓ {url}")
+            except Exception as e:
+                print(f"  ✗ {url}: {e}")
+        context.close()
+        browser.close()
+    archive.save()
+    print(f"Captured the main page and {len(targets)} navigation targets into {Config.NETWORK_ARCHIVE_DIR}")
+    return True
+
+
+def mirror_status():
+    """Status reported by a running mirror, or None"""
+    try:
+        with urllib.request.urlopen(f"{mirror_url()}/__mirror__/status", timeout=2) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def start_mirror() -> bool:
+    """Start the mirror server in the background unless one is already answering"""
+    if mirror_status():
+        print(f"Mirror is already running at {mirror_url()}")
+        return True
+    if not os.path.exists(os.path.join(Config.NETWORK_ARCHIVE_DIR, "index.json")):
+        print("No captured snapshot, run `python run_tests.py mirror capture` first")
+        return False
+    Path(MIRROR_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
+    if os.name == "nt":
+        # Keeps Ctrl+C in the caller's console from reaching the server
+        detach = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+    with open(MIRROR_LOG_PATH, "a", encoding="utf-8") as log:
+        process = subprocess.Popen(
+            [sys.executable, "fast_fastapi.py"],
+            stdout=log, stderr=subprocess.STDOUT, **detach
+        )
+    atomic_write_json(MIRROR_STATE_PATH, {"pid": process.pid, "url": mirror_url()})
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        status = mirror_status()
+        if status:
+            print(f"Mirror of {status['origin']} serving {status['resources']} resources at {mirror_url()}")
+            return True
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    print(f"Mirror did not start, see {MIRROR_LOG_PATH}")
+    return False
+
+
+def stop_mirror() -> bool:
+    state = load_json(MIRROR_STATE_PATH, None)
+    if not state:
+        print("Mirror is not running")
+        return True
+    if os.name == "nt":
+        # No process groups to signal; /T terminates uvicorn together with its workers
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(state["pid"])], capture_output=True)
+    else:
+        try:
+            # The server runs in its own session, so this stops uvicorn and its workers
+            os.killpg(state["pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and mirror_status():
+        time.sleep(0.1)
+    os.remove(MIRROR_STATE_PATH)
+    print("Mirror stopped")
+    return True
+
+
+def print_status() -> bool:
+    status = mirror_status()
+    if not status:
+        print("Mirror is not running")
+        return False
+    print(f"  url: {mirror_url()}")
+    for key, value in status.items():
+        print(f"  {key}: {value}")
+    return True
+
+
+MIRROR_COMMANDS = {"capture": capture_snapshot, "start": start_mirror, "stop": stop_mirror, "status": print_status}
@@ -0,0 +1,166 @@
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from config.config import Config
+from utils.network_archive import network_archive
+from .scheduler import schedule_longest_first
+from .stream import LiveOutput, ProgressTracker, pump, run_log, start_process, stop_processes
+from .timings import TimingHistory, load_step_durations, load_test_durations
+
+
+# Per-worker test lists, logs and raw results live here until they are merged
+WORKERS_DIR = ".workers"
+
+
+def resolve_worker_count(value: str, test_count: int) -> int:
+    """Turn --workers N|auto into a worker count no larger than the number of tests"""
+    workers = (os.cpu_count() or 1) if value == "auto" else int(value)
+    return max(1, min(workers, test_count))
+
+
+def collect_tests(pytest_cmd: str):
+    """Return node ids selected by the pytest command, in collection order"""
+    # The ini addopts and the command's own -v both shift the verbosity, and
+    # only -1 prints one node id per line; --verbosity comes last, so it wins
+    result = subprocess.run(
+        f"{pytest_cmd} --collect-only -o addopts= --verbosity=-1",
+        shell=True, capture_output=True, text=True
+    )
+    if result.returncode not in (0, 5):
+        print(result.stdout)
+        print(result.stderr)
+        return []
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line]
+
+
+def run_workers(pytest_cmd: str, shards, results_dir: str = "allure-results", output: LiveOutput = None):
+    """Run one pytest process per shard, each with its own browser and results dir.
+
+    Worker output is streamed to `output` as it arrives, each line prefixed
+    with the worker id, and also kept in the worker's own log file.
+    Returns a list of (worker_id, return_code, wall_time_seconds, log_path).
+    """
+    output = output or LiveOutput()
+    work_root = Path(WORKERS_DIR)
+    if work_root.exists():
+        shutil.rmtree(work_root)
+    work_root.mkdir(parents=True)
+
+    processes = []
+    try:
+        for worker_id, shard in enumerate(shards):
+            worker_dir = work_root / f"worker-{worker_id}"
+            worker_dir.mkdir()
+            test_list = worker_dir / "tests.txt"
+            test_list.write_text("\n".join(shard) + "\n", encoding="utf-8")
+            log_path = worker_dir / "output.log"
+
+            command = (
+                f"{pytest_cmd} --alluredir={worker_dir / 'results'}"
+                f" --test-list={test_list}"
+                f" --timings-out={worker_dir / 'timings.json'}"
+            )
+            process = start_process(command, {"TEST_WORKER_ID": str(worker_id)})
+            log_file = open(log_path, "w", encoding="utf-8")
+            reader = threading.Thread(
+                target=pump, args=(process, output, worker_id, f"[w{worker_id}] ", log_file), daemon=True
+            )
+            reader.start()
+            processes.append((worker_id, process, reader, log_file, log_path, time.monotonic()))
+
+        outcomes = []
+        for worker_id, process, reader, log_file, log_path, started in processes:
+            return_code = process.wait()
+            reader.join()
+            outcomes.append((worker_id, return_code, time.monotonic() - started, log_path))
+        return outcomes
+    finally:
+        # On Ctrl+C or an error, no worker (or its browser) is left running
+        stop_processes([process for _, process, *_ in processes])
+        for worker_id, process, reader, log_file, *_ in processes:
+            reader.join(timeout=5)
+            # A browser that outlived its worker may still hold the pipe; leave the file to its reader
+            if not reader.is_alive():
+                log_file.close()
+
+
+def merge_results(results_dir: str = "allure-results"):
+    """Move every worker's Allure files into results_dir and merge environment files"""
+    from utils.allure_environment import ENVIRONMENT_FILE, merge_environment_files
+
+    work_root = Path(WORKERS_DIR)
+    os.makedirs(results_dir, exist_ok=True)
+    environment_files = []
+    for worker_dir in sorted(work_root.glob("worker-*")):
+        worker_results = worker_dir / "results"
+        if not worker_results.exists():
+            continue
+        for path in worker_results.iterdir():
+            if path.name == ENVIRONMENT_FILE:
+                environment_files.append(str(path))
+                continue
+            # Allure file names are UUIDs, so workers never collide
+            shutil.move(str(path), os.path.join(results_dir, path.name))
+
+    merge_environment_files(environment_files, os.path.join(results_dir, ENVIRONMENT_FILE))
+
+
+def record_timings(history: TimingHistory, run_id: int, timing_files, results_dirs, since: float):
+    """Store per-test and per-step durations of a finished run"""
+    history.add_test_durations(run_id, load_test_durations(timing_files, since))
+    history.add_step_durations(run_id, load_step_durations(results_dirs, since))
+
+
+def run_parallel(pytest_cmd: str, workers_arg: str, results_dir: str = "allure-results"):
+    """Shard the collected tests across worker processes and merge their results"""
+    tests = collect_tests(pytest_cmd)
+    if not tests:
+        print("No tests collected")
+        return False
+
+    workers = resolve_worker_count(workers_arg, len(tests))
+    history = TimingHistory()
+    estimates = history.estimates(tests)
+    shards, predicted = schedule_longest_first(tests, estimates, workers)
+    predicted_makespan = max(predicted)
+    run_id = history.start_run(workers, predicted_makespan)
+    print(f"Running {len(tests)} tests on {workers} workers")
+
+    started = time.time()
+    output = LiveOutput(
+        ProgressTracker(planned=estimates, workers=workers),
+        run_log(Config.RUN_LOG_PATH, Config.RUN_LOG_MAX_BYTES, Config.RUN_LOG_BACKUPS)
+    )
+    try:
+        outcomes = run_workers(pytest_cmd, shards, results_dir, output)
+    except KeyboardInterrupt:
+        output.line("Interrupted")
+        history.close()
+        return False
+    output.summary(f"{len(tests)} tests on {workers} workers")
+    work_root = Path(WORKERS_DIR)
+    record_timings(
+        history, run_id,
+        [work_root / f"worker-{worker_id}" / "timings.json" for worker_id, *_ in outcomes],
+        [work_root / f"worker-{worker_id}" / "results" for worker_id, *_ in outcomes],
+        started
+    )
+    merge_results(results_dir)
+    network_archive.merge_worker_files()
+
+    success = True
+    for worker_id, return_code, wall_time, log_path in outcomes:
+        print(f"Worker {worker_id}: exit code {return_code}, "
+              f"predicted {predicted[worker_id]:.1f}s, actual {wall_time:.1f}s, output in {log_path}")
+        # 5 means the shard selected no tests, which is not a failure
+        if return_code not in (0, 5):
+            success = False
+
+    actual_makespan = max(wall_time for _, _, wall_time, _ in outcomes)
+    history.finish_run(run_id, actual_makespan)
+    history.close()
+    print(f"\nMakespan: predicted {predicted_makespan:.1f}s, actual {actual_makespan:.1f}s")
+    return success
@@ -0,0 +1,53 @@
+import json
+import shutil
+from pathlib import Path
+
+
+def reset_timeline(directory: str):
+    """Remove timeline files of a previous run"""
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def load_timeline(directory: str):
+    """Read every timeline-*.json written by the run's pytest processes"""
+    events = []
+    for path in sorted(Path(directory).glob("timeline-*.json")):
+        try:
+            events.extend(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return events
+
+
+def summarize(events):
+    """Aggregate events per (kind, name): count, total, mean, max, wait and retries"""
+    summary = {}
+    for event in events:
+        key = (event["kind"], event["name"])
+        entry = summary.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "wait_ms": 0.0, "retries": 0})
+        entry["count"] += 1
+        entry["total_ms"] += event["duration_ms"]
+        entry["max_ms"] = max(entry["max_ms"], event["duration_ms"])
+        entry["wait_ms"] += event.get("wait_ms") or 0.0
+        entry["retries"] += event.get("retries") or 0
+    return summary
+
+
+def print_slowest_steps(directory: str, limit: int = 15):
+    """Print the steps and page-object actions with the most total time across the suite"""
+    summary = summarize(load_timeline(directory))
+    if not summary:
+        print(f"No timeline data found in {directory}")
+        return
+
+    rows = sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:limit]
+    print(f"\n{'='*50}")
+    print(f"Slowest steps and actions (timeline: {directory})")
+    print(f"{'='*50}")
+    print(f"{'total s':>9} {'mean ms':>9} {'max ms':>9} {'wait %':>7} {'count':>6} {'retries':>8}  name")
+    for (kind, name), entry in rows:
+        mean = entry["total_ms"] / entry["count"]
+        wait_share = entry["wait_ms"] / entry["total_ms"] * 100 if kind == "action" and entry["total_ms"] else 0
+        wait_column = f"{wait_share:6.0f}%" if kind == "action" else f"{'-':>7}"
+        print(f"{entry['total_ms'] / 1000:9.2f} {mean:9.0f} {entry['max_ms']:9.0f} {wait_column}"
+              f" {entry['count']:6d} {entry['retries']:8d}  [{kind}] {name}")
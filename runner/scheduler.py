@@ -0,0 +1,24 @@
+import heapq
+
+
+def schedule_longest_first(tests, estimates: dict, workers: int):
+    """Longest-processing-time-first schedule.
+
+    Tests are taken longest first and each goes to the currently least loaded
+    worker, so every shard also runs its own tests longest first. Returns the
+    shards and their predicted durations.
+    """
+    ordered = sorted(tests, key=lambda test: estimates[test], reverse=True)
+    shards = [[] for _ in range(workers)]
+    loads = [(0.0, worker) for worker in range(workers)]
+    heapq.heapify(loads)
+
+    for test in ordered:
+        load, worker = heapq.heappop(loads)
+        shards[worker].append(test)
+        heapq.heappush(loads, (load + estimates[test], worker))
+
+    predicted = [0.0] * workers
+    for load, worker in loads:
+        predicted[worker] = load
+    return shards, predicted
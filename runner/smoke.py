@@ -0,0 +1,72 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+from config.config import Config
+from pages.locators import NAVIGATION_TARGETS
+from utils.http_client import HttpClient
+from .crawler import load_cached_nav_links, normalize_url, seed_navigation_links
+
+
+def matches_patterns(url: str, patterns) -> bool:
+    """Whether a URL contains one of the accepted section fragments"""
+    url = unquote(url).lower()
+    return any(pattern in url for pattern in patterns)
+
+
+def resolve_nav_links(browser_name: str = "chromium", refresh: bool = False):
+    """Navigation hrefs from the cache, or from one main page load when missing"""
+    links = [] if refresh else load_cached_nav_links()
+    if not links:
+        print("No cached navigation links, loading the main page once...")
+        links = seed_navigation_links(browser_name)
+    return links
+
+
+def check_links(links, workers: int = None, timeout: float = None):
+    """Fetch every link concurrently over pooled connections; returns HttpResponse objects in order"""
+    workers = workers or Config.SMOKE_WORKERS
+    client = HttpClient(timeout=timeout or Config.SMOKE_TIMEOUT, max_per_host=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: client.fetch(url, read_body=False), links))
+    finally:
+        client.close()
+
+
+def run_smoke(browser_name: str = "chromium", refresh: bool = False) -> bool:
+    """HTTP smoke tier: every same-site nav link answers, every section resolves where expected"""
+    started = time.monotonic()
+    home = normalize_url(Config.BASE_URL)
+    site = urlsplit(home).netloc
+    links = [home] + [url for url in resolve_nav_links(browser_name, refresh) if urlsplit(url).netloc == site]
+    links = list(dict.fromkeys(links))
+
+    results = dict(zip(links, check_links(links)))
+    failures = []
+    broken = set()
+    for url, result in results.items():
+        if result.error or not result.status or result.status >= 400:
+            broken.add(url)
+            failures.append(f"{url}: {result.error or result.status}")
+
+    for key, target in NAVIGATION_TARGETS.items():
+        candidates = [url for url in links if matches_patterns(url, target["url_patterns"])]
+        if not candidates:
+            # The browser test skips in this case too, so it is not a smoke failure
+            print(f"  - {target['name']}: not in the navigation")
+            continue
+        for url in candidates:
+            result = results[url]
+            if url in broken:
+                continue
+            if not matches_patterns(result.final_url, target["url_patterns"]):
+                failures.append(f"{target['name']}: {url} redirects to {result.final_url}")
+            else:
+                hops = f" via {len(result.redirect_chain)} redirect(s)" if result.redirect_chain else ""
+                print(f"  ✓ {target['name']}: {result.status} {url}{hops} ({result.elapsed_ms} ms)")
+
+    elapsed = time.monotonic() - started
+    print(f"HTTP smoke: {len(links)} URLs checked in {elapsed:.2f}s")
+    for failure in failures:
+        print(f"  ✗ {failure}")
+    return not failures
@@ -0,0 +1,256 @@
+import codecs
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+
+# pytest -v prints "nodeid " when a test starts and the outcome when it ends
+TEST_LINE = re.compile(r"^(?P<nodeid>[^\s:]+::\S+)(?: (?P<outcome>PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS|RERUN)\b)?")
+COLLECTED_LINE = re.compile(r"^collected (?P<count>\d+) items?")
+OUTCOME_SYMBOLS = (("passed", "✓"), ("failed", "✗"), ("skipped", "↷"))
+
+
+def _format_seconds(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 60}m{seconds % 60:02d}s" if seconds >= 60 else f"{seconds}s"
+
+
+def run_log(path: str = "logs/run_tests.log", max_bytes: int = 10 * 1024 * 1024, backups: int = 5):
+    """Logger writing raw output lines to a rotating file"""
+    logger = logging.getLogger("run_tests.output")
+    if not logger.handlers:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+class ProgressTracker:
+    """Pass/fail/skip counts, current tests and ETA parsed from pytest -v output.
+
+    The ETA comes from the timing history: the estimates of the tests still to
+    run (`planned`, or the collected count times `default_estimate`), scaled
+    by how fast the finished tests ran compared with their own estimates.
+    """
+
+    def __init__(self, planned: dict = None, history: dict = None, default_estimate: float = 10.0,
+                 workers: int = 1):
+        self.planned = planned
+        self.history = history or planned or {}
+        self.default_estimate = default_estimate
+        self.total = len(planned) if planned else None
+        self.workers = workers
+        self.outcomes = {}
+        self.current = {}
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+
+    def feed(self, line: str, source: str = ""):
+        """Update from one complete output line"""
+        match = TEST_LINE.match(line)
+        with self.lock:
+            if match and match.group("outcome"):
+                outcome = match.group("outcome").lower()
+                if outcome != "rerun":
+                    # A teardown error after a pass is reported on a second line; the last one wins
+                    self.outcomes[match.group("nodeid")] = outcome
+                self.current.pop(source, None)
+            elif self.total is None:
+                collected = COLLECTED_LINE.match(line)
+                if collected:
+                    self.total = int(collected.group("count"))
+
+    def feed_partial(self, text: str, source: str = "") -> bool:
+        """Update from an unfinished line, which names the test that is running; True if it changed"""
+        match = TEST_LINE.match(text)
+        if not match or match.group("outcome"):
+            return False
+        with self.lock:
+            changed = self.current.get(source) != match.group("nodeid")
+            self.current[source] = match.group("nodeid")
+        return changed
+
+    @property
+    def active(self) -> bool:
+        return bool(self.total or self.outcomes or self.current)
+
+    def counts(self) -> dict:
+        counts = {"passed": 0, "failed": 0, "skipped": 0}
+        groups = {"passed": "passed", "xpass": "passed", "failed": "failed", "error": "failed"}
+        for outcome in self.outcomes.values():
+            counts[groups.get(outcome, "skipped")] += 1
+        return counts
+
+    def eta(self):
+        """Seconds left, or None before anything can be estimated"""
+        if not self.total:
+            return None
+        if self.planned:
+            remaining = sum(estimate for nodeid, estimate in self.planned.items() if nodeid not in self.outcomes)
+        else:
+            remaining = max(self.total - len(self.outcomes), 0) * self.default_estimate
+        predicted_done = sum(self.history.get(nodeid, self.default_estimate) for nodeid in self.outcomes)
+        elapsed = time.monotonic() - self.started
+        pace = elapsed * self.workers / predicted_done if predicted_done else 1.0
+        return remaining * pace / self.workers
+
+    def status(self) -> str:
+        counts = self.counts()
+        parts = [f"[{len(self.outcomes)}/{self.total or '?'}]"]
+        parts.append(" ".join(f"{symbol}{counts[name]}" for name, symbol in OUTCOME_SYMBOLS))
+        parts.append(f"elapsed {_format_seconds(time.monotonic() - self.started)}")
+        eta = self.eta()
+        if eta is not None:
+            parts.append(f"ETA {_format_seconds(eta)}")
+        current = list(self.current.values())
+        if current:
+            parts.append(current[0] if len(current) == 1 else f"{current[0]} (+{len(current) - 1} more)")
+        return " | ".join(parts)
+
+
+class LiveOutput:
+    """Streams lines to the console and the run log, with a live status line on a terminal"""
+
+    def __init__(self, tracker: ProgressTracker = None, log=None, stream=None):
+        self.tracker = tracker or ProgressTracker()
+        self.log = log
+        self.stream = stream or sys.stdout
+        self.live = self.stream.isatty()
+        self.lock = threading.Lock()
+        self._status_shown = False
+        self._last_redraw = 0.0
+
+    def _clear_status(self):
+        if self._status_shown:
+            self.stream.write("\r\033[K")
+            self._status_shown = False
+
+    def _draw_status(self):
+        if self.live and self.tracker.active:
+            width = shutil.get_terminal_size().columns
+            self.stream.write(self.tracker.status()[:width - 1])
+            self._status_shown = True
+            self._last_redraw = time.monotonic()
+        self.stream.flush()
+
+    def line(self, text: str, source: str = "", prefix: str = ""):
+        self.tracker.feed(text, source)
+        with self.lock:
+            self._clear_status()
+            self.stream.write(f"{prefix}{text}\n")
+            if self.log:
+                self.log.info(f"{prefix}{text}")
+            self._draw_status()
+
+    def partial(self, text: str, source: str = ""):
+        changed = self.tracker.feed_partial(text, source)
+        with self.lock:
+            # Redraws are throttled so a chatty process does not flood the terminal
+            if self.live and (changed or time.monotonic() - self._last_redraw > 0.2):
+                self._clear_status()
+                self._draw_status()
+
+    def summary(self, description: str):
+        with self.lock:
+            self._clear_status()
+            if self.tracker.outcomes:
+                counts = self.tracker.counts()
+                elapsed = _format_seconds(time.monotonic() - self.tracker.started)
+                self.stream.write(
+                    f"{description}: {counts['passed']} passed, {counts['failed']} failed, "
+                    f"{counts['skipped']} skipped in {elapsed}\n"
+                )
+            self.stream.flush()
+
+
+def pump(process: subprocess.Popen, output: LiveOutput, source: str = "", prefix: str = "", tee=None):
+    """Copy a process's stdout to `output` as it arrives, optionally teeing raw lines to a file"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fd = process.stdout.fileno()
+    pending = ""
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line = line.rstrip("\r")
+            if tee:
+                tee.write(line + "\n")
+            output.line(line, source, prefix)
+        if pending:
+            output.partial(pending, source)
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        if tee:
+            tee.write(pending + "\n")
+        output.line(pending, source, prefix)
+    if tee:
+        tee.flush()
+
+
+def start_process(command, env: dict = None) -> subprocess.Popen:
+    """Start a shell command in its own process group, with unbuffered, merged stdout and stderr"""
+    if os.name == "nt":
+        group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group = {"start_new_session": True}
+    return subprocess.Popen(
+        command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        env={**os.environ, **(env or {}), "PYTHONUNBUFFERED": "1"}, **group
+    )
+
+
+def _signal_group(process: subprocess.Popen, kill: bool = False):
+    """Interrupt (or kill) the shell and everything it started, not just the shell"""
+    if os.name == "nt":
+        if kill:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
+        else:
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGINT)
+    except ProcessLookupError:
+        pass
+
+
+def stop_processes(processes, timeout: float = 10):
+    """Interrupt processes started by start_process, killing any still running after `timeout` seconds.
+
+    SIGINT lets pytest stop as on Ctrl+C: it finishes the report and closes its browser.
+    """
+    running = [process for process in processes if process.poll() is None]
+    for process in running:
+        _signal_group(process)
+    deadline = time.monotonic() + timeout
+    for process in running:
+        try:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            _signal_group(process, kill=True)
+            process.wait()
+
+
+def stream_command(command, output: LiveOutput) -> int:
+    """Run a command, streaming its output; Ctrl+C stops the command, not the caller"""
+    process = start_process(command)
+    try:
+        pump(process, output)
+        return process.wait()
+    except KeyboardInterrupt:
+        stop_processes([process])
+        output.line("Interrupted")
+        return 130
@@ -0,0 +1,188 @@
+import json
+import os
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+
+DEFAULT_HISTORY_PATH = ".cache/timings.sqlite"
+# Estimate for a test that has never run and has no neighbours to learn from
+DEFAULT_TEST_ESTIMATE = 10.0
+# Only the most recent runs of a test count towards its estimate
+HISTORY_WINDOW = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    workers INTEGER NOT NULL,
+    predicted_makespan REAL,
+    actual_makespan REAL
+);
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id INTEGER NOT NULL,
+    nodeid TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_test_durations_nodeid ON test_durations (nodeid);
+CREATE TABLE IF NOT EXISTS step_durations (
+    run_id INTEGER NOT NULL,
+    test TEXT NOT NULL,
+    step TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS page_metrics (
+    recorded_at REAL NOT NULL,
+    test TEXT,
+    step TEXT NOT NULL,
+    url TEXT,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_page_metrics_step ON page_metrics (step, metric);
+"""
+
+
+class TimingHistory:
+    """Local SQLite history of per-test and per-step durations across runs"""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def start_run(self, workers: int, predicted_makespan: float = None) -> int:
+        """Register a new run and return its id"""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, workers, predicted_makespan) VALUES (?, ?, ?)",
+                (time.time(), workers, predicted_makespan)
+            )
+        return cursor.lastrowid
+
+    def finish_run(self, run_id: int, actual_makespan: float):
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET actual_makespan = ? WHERE id = ?", (actual_makespan, run_id)
+            )
+
+    def add_test_durations(self, run_id: int, durations: dict):
+        """Store {nodeid: {"duration": seconds, "outcome": str}} for a run"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO test_durations (run_id, nodeid, duration, outcome) VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, d["duration"], d.get("outcome")) for nodeid, d in durations.items()]
+            )
+
+    def add_step_durations(self, run_id: int, steps):
+        """Store (test, step, seconds) tuples for a run"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO step_durations (run_id, test, step, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, test, step, duration) for test, step, duration in steps]
+            )
+
+    def add_page_metrics(self, records, metrics):
+        """Store the numeric `metrics` of each navigation record from PageMetrics"""
+        rows = [
+            (record["recorded_at"], record["test"], record["step"], record["url"], name, record[name])
+            for record in records for name in metrics if record.get(name) is not None
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO page_metrics (recorded_at, test, step, url, metric, value) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def page_metric_medians(self, steps, metrics, limit: int = 20) -> dict:
+        """{step: {metric: median of its last `limit` values}} for trend comparisons"""
+        medians = {}
+        for step in steps:
+            for metric in metrics:
+                rows = self.connection.execute(
+                    "SELECT value FROM page_metrics WHERE step = ? AND metric = ?"
+                    " ORDER BY recorded_at DESC LIMIT ?",
+                    (step, metric, limit)
+                ).fetchall()
+                if rows:
+                    medians.setdefault(step, {})[metric] = statistics.median(row[0] for row in rows)
+        return medians
+
+    def estimates(self, nodeids) -> dict:
+        """Estimated duration per node id: median of recent runs, or a neighbour-based guess"""
+        known = {}
+        for nodeid in nodeids:
+            rows = self.connection.execute(
+                "SELECT duration FROM test_durations WHERE nodeid = ? AND outcome != 'skipped'"
+                " ORDER BY run_id DESC LIMIT ?",
+                (nodeid, HISTORY_WINDOW)
+            ).fetchall()
+            if rows:
+                known[nodeid] = statistics.median(row[0] for row in rows)
+
+        # New tests get the median of the known ones, which beats a fixed guess
+        default = statistics.median(known.values()) if known else DEFAULT_TEST_ESTIMATE
+        return {nodeid: known.get(nodeid, default) for nodeid in nodeids}
+
+    def recent_estimates(self) -> dict:
+        """Median of the recent durations of every test in the history"""
+        durations = {}
+        rows = self.connection.execute(
+            "SELECT nodeid, duration FROM test_durations WHERE outcome != 'skipped' ORDER BY run_id DESC"
+        )
+        for nodeid, duration in rows:
+            recent = durations.setdefault(nodeid, [])
+            if len(recent) < HISTORY_WINDOW:
+                recent.append(duration)
+        return {nodeid: statistics.median(values) for nodeid, values in durations.items()}
+
+    def last_runs(self, limit: int = 10):
+        """Recent runs as (id, workers, predicted, actual) rows"""
+        return self.connection.execute(
+            "SELECT id, workers, predicted_makespan, actual_makespan FROM runs ORDER BY id DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+
+
+def load_test_durations(paths, since: float = None) -> dict:
+    """Merge the per-test timing files written by pytest --timings-out
+
+    Files last written before `since` are left out: they belong to an earlier
+    run whose successor died before writing its own.
+    """
+    durations = {}
+    for path in paths:
+        if os.path.exists(path) and (since is None or os.path.getmtime(path) >= since):
+            with open(path, "r", encoding="utf-8") as f:
+                durations.update(json.load(f))
+    return durations
+
+
+def load_step_durations(results_dirs, since: float):
+    """Read (test, step, seconds) from Allure result files written after `since`"""
+    since_ms = since * 1000
+    steps = []
+
+    def walk(test, items, prefix=""):
+        for step in items:
+            name = f"{prefix}{step.get('name', '')}"
+            if step.get("start") and step.get("stop"):
+                steps.append((test, name, (step["stop"] - step["start"]) / 1000))
+            walk(test, step.get("steps", []), f"{name} / ")
+
+    for results_dir in results_dirs:
+        for path in Path(results_dir).glob("*-result.json"):
+            try:
+                result = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if result.get("start", 0) < since_ms:
+                continue
+            walk(result.get("fullName", result.get("name", "")), result.get("steps", []))
+    return steps
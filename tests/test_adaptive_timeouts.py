@@ -0,0 +1,83 @@
+import pytest
+import allure
+from utils.adaptive_timeouts import AdaptiveTimeouts, percentile
+from utils.json_store import atomic_write_json, load_json
+
+
+KEY = "MainPage|probe:About Us link|https://example.test"
+
+
+def make_timeouts(tmp_path, history: dict = None, **options) -> AdaptiveTimeouts:
+    path = str(tmp_path / "latency_stats.json")
+    if history is not None:
+        atomic_write_json(path, history)
+    options = {"safety_factor": 3.0, "min_ms": 1000, "max_ms": 30000, "min_samples": 5, **options}
+    return AdaptiveTimeouts(path, **options)
+
+
+@allure.feature("Adaptive timeouts")
+class TestPercentile:
+
+    @pytest.mark.parametrize("q, expected", [(50, 50), (90, 90), (99, 99), (100, 100), (1, 1)])
+    def test_nearest_rank(self, q, expected):
+        assert percentile(list(range(100, 0, -1)), q) == expected
+
+    def test_small_sample_p99_is_the_maximum(self):
+        assert percentile([120, 80, 400, 95, 110], 99) == 400
+
+
+@allure.feature("Adaptive timeouts")
+class TestBudget:
+
+    def test_default_until_min_samples(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [100, 120, 110, 90], "timeouts": 0}})
+
+        assert timeouts.budget(KEY, 5000) == 5000
+        assert timeouts.budget("unknown", 5000) == 5000
+        assert timeouts.decisions == {}
+
+    def test_p99_times_safety_factor(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [400, 500, 600, 700, 800], "timeouts": 0}})
+
+        assert timeouts.budget(KEY, 5000) == 2400
+        assert timeouts.decisions[KEY] == {"default_ms": 5000, "budget_ms": 2400, "p99_ms": 800, "samples": 5}
+        assert timeouts.report()["tightened"][0]["key"] == KEY
+
+    @pytest.mark.parametrize("samples, expected", [([10] * 5, 1000), ([20000] * 5, 30000)])
+    def test_clamped_to_min_and_max(self, tmp_path, samples, expected):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": samples, "timeouts": 0}})
+
+        assert timeouts.budget(KEY, 5000) == expected
+
+    def test_not_tightened_below_default_after_a_timeout(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [100] * 5, "timeouts": 1}})
+
+        assert timeouts.budget(KEY, 5000) == 5000
+
+    def test_disabled_returns_default(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [100] * 5, "timeouts": 0}}, enabled=False)
+
+        assert timeouts.budget(KEY, 5000) == 5000
+
+
+@allure.feature("Adaptive timeouts")
+class TestHistory:
+
+    def test_observations_are_saved_within_the_window(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [100, 200, 300], "timeouts": 2}}, window=4)
+        timeouts.observe(KEY, 400)
+        timeouts.observe(KEY, 500)
+        timeouts.save()
+
+        assert load_json(timeouts.path, {})[KEY] == {"samples": [200, 300, 400, 500], "timeouts": 0}
+
+    def test_timeout_is_counted_and_loosens_the_next_budget(self, tmp_path):
+        timeouts = make_timeouts(tmp_path, {KEY: {"samples": [100] * 5, "timeouts": 0}})
+        assert timeouts.budget(KEY, 5000) == 1000
+
+        with pytest.raises(AssertionError):
+            with timeouts.measure(KEY, 5000):
+                raise AssertionError("not visible")
+
+        assert timeouts.stats[KEY]["timeouts"] == 1
+        assert timeouts.budget(KEY, 5000) == 5000
@@ -0,0 +1,64 @@
+import json
+import pytest
+import allure
+from pages.locators import NAVIGATION_TARGETS
+from pages.selector_resolver import SelectorNotFoundError
+
+
+def make_navigation_check(key: str, target: dict):
+    """Build an async check that opens the main page and follows one navigation link"""
+    async def check(main_page):
+        await main_page.navigate_to_main_page()
+        await main_page.wait_for_page_load()
+        try:
+            resolution = await getattr(main_page, f"click_{key}")()
+        except SelectorNotFoundError as e:
+            return {"section": key, "found": False, "error": str(e)}
+        await main_page.wait_for_navigation()
+        url = main_page.page.url
+        return {
+            "section": key,
+            "found": True,
+            "selector": resolution["selector"],
+            "url": url,
+            "url_matches": any(pattern in url.lower() for pattern in target["url_patterns"]),
+        }
+    
+    return check
+
+
+@allure.feature("Main Page Navigation")
+@allure.story("Concurrent Navigation")
+class TestConcurrentNavigation:
+    
+    @allure.title("Navigate to all sections concurrently")
+    @allure.description("Follow every main navigation link on its own page of one browser at once")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_navigate_to_all_sections_concurrently(self, async_pages):
+        """Run all navigation checks concurrently against one browser"""
+        with allure.step("Run navigation checks concurrently"):
+            results = async_pages([
+                make_navigation_check(key, target) for key, target in NAVIGATION_TARGETS.items()
+            ])
+        
+        with allure.step("Attach navigation results"):
+            report = [
+                result if isinstance(result, dict) else {"error": repr(result)}
+                for result in results
+            ]
+            allure.attach(
+                json.dumps(report, indent=2, ensure_ascii=False),
+                name="Concurrent Navigation Results",
+                attachment_type=allure.attachment_type.JSON
+            )
+        
+        with allure.step("Verify URLs of found sections"):
+            errors = [result for result in results if isinstance(result, Exception)]
+            assert not errors, f"Navigation checks raised: {errors}"
+            
+            found = [result for result in results if result["found"]]
+            if not found:
+                pytest.skip("No navigation links found on the main page")
+            
+            mismatched = [result for result in found if not result["url_matches"]]
+            assert not mismatched, f"Unexpected URLs after navigation: {mismatched}"
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+import pytest
+import allure
+from utils.console_log import ConsoleLog
+
+
+def console_message(text: str, kind: str = "error", url: str = "https://example.test/app.js", line: int = 1):
+    return SimpleNamespace(type=kind, text=text, location={"url": url, "lineNumber": line})
+
+
+@allure.feature("Diagnostics")
+@allure.story("Console log")
+class TestConsoleLog:
+
+    def test_unknown_level_is_rejected(self):
+        with pytest.raises(ValueError):
+            ConsoleLog("verbose")
+
+    def test_messages_below_min_level_are_ignored(self):
+        log = ConsoleLog("warning")
+        log._on_console(console_message("hello", kind="log"))
+        log._on_console(console_message("debugging", kind="debug"))
+
+        assert log.entries == {}
+
+    def test_repeats_are_counted_not_stored(self):
+        log = ConsoleLog()
+        for _ in range(3):
+            log._on_console(console_message("boom"))
+        log._on_console(console_message("boom", line=2))
+
+        assert len(log.entries) == 2
+        assert sorted(entry["count"] for entry in log.entries.values()) == [1, 3]
+        assert "[ERROR x3] boom (https://example.test/app.js:1)" in log.report()
+
+    def test_capacity_bounds_errors_too(self):
+        log = ConsoleLog(capacity=3)
+        for index in range(5):
+            log._on_console(console_message(f"warning {index}", kind="warning"))
+        for index in range(4):
+            log._on_page_error(SimpleNamespace(message=f"error {index}", stack=None))
+
+        assert len(log.entries) == 3
+        assert (log.dropped, log.dropped_errors) == (6, 4)
+        assert "6 further messages dropped after 3 distinct ones, 4 of them errors" in log.report()
+
+    def test_repeats_of_stored_messages_are_counted_at_capacity(self):
+        log = ConsoleLog(capacity=1)
+        log._on_console(console_message("boom"))
+        log._on_console(console_message("boom"))
+        log._on_console(console_message("other"))
+
+        assert list(log.entries.values())[0]["count"] == 2
+        assert log.dropped == 1
+
+    def test_new_errors_against_baseline(self):
+        log = ConsoleLog()
+        log._on_console(console_message("known"))
+        baseline = log.baseline()
+        log.assert_no_new_errors(baseline)
+
+        log._on_console(console_message("known"))
+        log._on_page_error(SimpleNamespace(message="TypeError: x is undefined", stack=None))
+
+        assert [entry["text"] for entry in log.new_errors(baseline)] == ["known", "TypeError: x is undefined"]
+        with pytest.raises(AssertionError, match="New JavaScript errors"):
+            log.assert_no_new_errors(baseline)
+
+    def test_dropped_errors_still_fail_the_assertion(self):
+        log = ConsoleLog(capacity=1)
+        log._on_console(console_message("first"))
+        baseline = log.baseline()
+        log._on_console(console_message("second"))
+
+        new = log.new_errors(baseline)
+        assert [entry["kind"] for entry in new] == ["dropped"]
+        with pytest.raises(AssertionError, match="1 errors not stored"):
+            log.assert_no_new_errors(baseline)
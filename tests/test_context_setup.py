@@ -0,0 +1,46 @@
+import asyncio
+import allure
+from config.config import Config
+from utils import context_setup
+from utils.network_archive import network_archive
+
+
+class FakeAsyncContext:
+    """Records listeners and the route registrations that were actually awaited"""
+
+    def __init__(self):
+        self.listeners = []
+        self.routes = []
+        self.matchers = []
+
+    def on(self, event, handler):
+        self.listeners.append(event)
+
+    async def route(self, url, handler):
+        self.routes.append(handler.__self__)
+        self.matchers.append(url)
+
+
+@allure.feature("Diagnostics")
+@allure.story("Context setup")
+class TestPrepareAsyncContext:
+
+    def test_route_handlers_are_registered_in_order(self, monkeypatch):
+        monkeypatch.setattr(network_archive, "mode", "replay")
+        context = FakeAsyncContext()
+        request_filter = asyncio.run(context_setup.prepare_async_context(context, "lean"))
+
+        # The filter is registered last, so Playwright runs it first
+        assert context.routes == [network_archive, request_filter]
+        assert context.listeners == ["response"]
+
+    def test_mirror_runs_serve_offsite_requests_from_the_archive(self, monkeypatch):
+        monkeypatch.setattr(network_archive, "mode", "live")
+        monkeypatch.setattr(Config, "BASE_URL", Config.MIRROR_URL)
+        context = FakeAsyncContext()
+        asyncio.run(context_setup.prepare_async_context(context, "full"))
+
+        assert context.routes == [network_archive]
+        offsite = context.matchers[0]
+        assert offsite("https://cdn.example.test/app.js")
+        assert not offsite(f"{Config.MIRROR_URL}/about")
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+import allure
+from runner.crawler import Crawler, load_cached_nav_links, normalize_url
+from utils.json_store import atomic_write_json
+
+
+class StubFetcher:
+    """Serves a fixed link graph; URLs listed in `broken` raise instead"""
+
+    def __init__(self, pages: dict, broken=()):
+        self.pages = pages
+        self.broken = set(broken)
+        self.fetched = []
+
+    async def start(self):
+        pass
+
+    async def fetch(self, url: str):
+        self.fetched.append(url)
+        if url in self.broken:
+            raise RuntimeError("connection reset")
+        record = {"url": url, "final_url": url, "status": 200, "redirect_chain": [], "elapsed_ms": 1.0, "error": None}
+        return record, self.pages.get(url, [])
+
+    async def close(self):
+        pass
+
+
+@allure.feature("Crawler")
+@allure.story("URL normalization")
+class TestNormalizeUrl:
+
+    @pytest.mark.parametrize("url, expected", [
+        ("HTTP://Example.TEST:80/Path/", "http://example.test/Path"),
+        ("https://example.test:443", "https://example.test/"),
+        ("https://example.test:8443/a", "https://example.test:8443/a"),
+        ("https://example.test/?b=2&utm_source=x&a=1&gclid=y#top", "https://example.test/?a=1&b=2"),
+    ])
+    def test_canonical_form(self, url, expected):
+        assert normalize_url(url) == expected
+
+    def test_resolves_relative_links(self):
+        assert normalize_url("../news/", "https://example.test/about/team") == "https://example.test/news"
+
+    @pytest.mark.parametrize("url", ["mailto:info@example.test", "javascript:void(0)", "tel:+100"])
+    def test_non_http_links(self, url):
+        assert normalize_url(url, "https://example.test/") is None
+
+    @pytest.mark.parametrize("url", ["http://a.test:abc/", "http://[::1", "http://a.test:99999/"])
+    def test_malformed_links(self, url):
+        assert normalize_url(url, "https://example.test/") is None
+
+
+@allure.feature("Crawler")
+@allure.story("Worker pool")
+class TestCrawler:
+
+    def crawl(self, fetcher, **kwargs):
+        crawler = Crawler(fetcher, ["https://example.test/"], **kwargs)
+        return asyncio.run(asyncio.wait_for(crawler.crawl(), timeout=10))
+
+    def test_builds_link_graph(self):
+        fetcher = StubFetcher({
+            "https://example.test/": ["/a", "/b", "https://other.test/", "mailto:x@example.test"],
+            "https://example.test/a": ["/b", "/"],
+        })
+        graph = self.crawl(fetcher, workers=2)
+
+        assert sorted(graph["nodes"]) == ["https://example.test/", "https://example.test/a", "https://example.test/b"]
+        assert ("https://example.test/", "https://other.test/") in graph["edges"]
+        assert sorted(fetcher.fetched) == sorted(graph["nodes"])
+
+    def test_malformed_links_and_failing_pages_do_not_stall_the_crawl(self):
+        fetcher = StubFetcher({
+            "https://example.test/": ["http://example.test:abc/", "http://[::1", "/broken", "/ok"],
+        }, broken=["https://example.test/broken"])
+        graph = self.crawl(fetcher, workers=1)
+
+        assert graph["nodes"]["https://example.test/broken"]["error"] == "RuntimeError: connection reset"
+        assert graph["nodes"]["https://example.test/ok"]["status"] == 200
+
+
+@allure.feature("Crawler")
+@allure.story("Navigation link cache")
+class TestNavLinksCache:
+
+    def test_cache_is_keyed_by_base_url(self, tmp_path):
+        path = str(tmp_path / "nav_links.json")
+        atomic_write_json(path, {"base_url": "https://example.test/", "links": ["https://example.test/news"]})
+
+        assert load_cached_nav_links(path, "https://EXAMPLE.test") == ["https://example.test/news"]
+        assert load_cached_nav_links(path, "http://127.0.0.1:8000") == []
+
+    def test_cache_without_base_url_is_ignored(self, tmp_path):
+        path = str(tmp_path / "nav_links.json")
+        atomic_write_json(path, {"page": "https://example.test/", "links": ["https://example.test/news"]})
+
+        assert load_cached_nav_links(path, "https://example.test/") == []
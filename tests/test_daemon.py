@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+import allure
+from runner.daemon import WarmBrowser, _pid_alive
+
+
+@allure.feature("Browser daemon")
+@allure.story("Leases")
+class TestLeaseReaping:
+
+    def test_leases_of_dead_processes_are_dropped(self):
+        finished = subprocess.Popen([sys.executable, "-c", "pass"])
+        finished.wait()
+        browser = WarmBrowser(max_sessions=10, max_rss_mb=0)
+        browser.leases = {"alive": os.getpid(), "dead": finished.pid}
+        browser._reap_leases()
+
+        assert _pid_alive(os.getpid())
+        assert not _pid_alive(finished.pid)
+        assert browser.leases == {"alive": os.getpid()}
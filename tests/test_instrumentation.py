@@ -0,0 +1,37 @@
+import allure
+from allure_commons import model2
+from utils.instrumentation import Timeline
+
+
+class FakeReporter:
+    def __init__(self, step: model2.TestStepResult):
+        self.step = step
+
+    def get_item(self, uuid):
+        return self.step
+
+    def get_last_item(self):
+        return self.step
+
+
+@allure.feature("Diagnostics")
+@allure.story("Timeline")
+class TestTimelineParameters:
+
+    def test_repeated_actions_in_one_step_get_numbered_parameters(self):
+        step = model2.TestStepResult(name="Navigate")
+        timeline = Timeline()
+        timeline.reporter = FakeReporter(step)
+        for _ in range(3):
+            with timeline.action("MainPage.click_about_us"):
+                pass
+        with timeline.action("MainPage.wait_for_navigation"):
+            pass
+
+        assert [parameter.name for parameter in step.parameters] == [
+            "MainPage.click_about_us",
+            "MainPage.click_about_us #2",
+            "MainPage.click_about_us #3",
+            "MainPage.wait_for_navigation",
+        ]
+        assert len(timeline.events) == 4
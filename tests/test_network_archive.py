@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+import allure
+from utils.json_store import load_json
+from utils.network_archive import NetworkArchive
+
+
+def finished_request(url: str, body: bytes = b"ok"):
+    request = SimpleNamespace(method="GET", url=url)
+    request.response = lambda: SimpleNamespace(
+        status=200, headers={"content-type": "text/plain"}, body=lambda: body
+    )
+    return request
+
+
+@allure.feature("Network archive")
+class TestParallelRecording:
+
+    def test_worker_recordings_are_merged_not_overwritten(self, tmp_path):
+        directory = str(tmp_path)
+        workers = [NetworkArchive(directory, "record", worker=str(index)) for index in range(2)]
+        workers[0].record_request(finished_request("https://example.test/a.js"))
+        workers[1].record_request(finished_request("https://example.test/b.js"))
+        workers[1].missing.add("GET https://example.test/gone.js")
+        for worker in workers:
+            worker.save()
+
+        runner = NetworkArchive(directory, "record")
+        runner.merge_worker_files()
+
+        assert set(load_json(runner.index_path, {})) == {
+            "GET https://example.test/a.js", "GET https://example.test/b.js"
+        }
+        assert (tmp_path / "missing.txt").read_text(encoding="utf-8") == "GET https://example.test/gone.js\n"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["blobs", "index.json", "missing.txt"]
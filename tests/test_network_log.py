@@ -0,0 +1,100 @@
+import allure
+from utils.network_log import NetworkLog
+
+
+class FakeRequest:
+    def __init__(self, url: str, body_size: int = None, resource_type: str = "script"):
+        self.url = url
+        self.method = "GET"
+        self.resource_type = resource_type
+        self.headers = {}
+        self.redirected_from = None
+        self.failure = None
+        self.body_size = body_size
+        self.size_lookups = 0
+
+    def sizes(self):
+        self.size_lookups += 1
+        if self.body_size is None:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return {"responseBodySize": self.body_size}
+
+
+class FakeResponse:
+    def __init__(self, request: FakeRequest, status: int = 200, headers: dict = None):
+        self.request = request
+        self.status = status
+        self.headers = headers or {}
+
+
+def load(log: NetworkLog, request: FakeRequest, headers: dict = None, status: int = 200):
+    log._on_request(request)
+    log._on_response(FakeResponse(request, status, headers))
+    log._on_finished(request)
+
+
+@allure.feature("Diagnostics")
+@allure.story("Network waterfall")
+class TestNetworkLog:
+
+    def test_ring_buffer_keeps_the_latest_requests(self):
+        log = NetworkLog(capacity=3)
+        for index in range(5):
+            load(log, FakeRequest(f"https://example.test/{index}.js"), {"content-length": "10"})
+
+        assert [entry["url"] for entry in log.entries()] == [f"https://example.test/{index}.js" for index in (2, 3, 4)]
+        assert log.dropped == 2
+        assert log.waterfall().splitlines()[0].endswith("2 older dropped")
+
+    def test_in_flight_requests_are_bounded(self):
+        log = NetworkLog(capacity=2)
+        for index in range(3):
+            log._on_request(FakeRequest(f"https://example.test/{index}"))
+
+        assert [entry["url"] for entry in log.entries()] == ["https://example.test/1", "https://example.test/2"]
+        assert log.dropped == 1
+        assert "2 request(s) still open" in log.waterfall()
+
+    def test_size_from_content_length(self):
+        log = NetworkLog()
+        request = FakeRequest("https://example.test/app.js", body_size=999)
+        load(log, request, {"content-length": "2048"})
+        log.fill_sizes()
+
+        assert log.entries()[0]["size"] == 2048
+        assert request.size_lookups == 0
+        assert " 2K " in log.waterfall()
+
+    def test_missing_content_length_is_filled_from_body_size(self):
+        log = NetworkLog()
+        request = FakeRequest("https://example.test/chunked.js", body_size=3 * 1024 * 1024)
+        load(log, request)
+
+        assert log.entries()[0]["size"] is None
+        assert "     ? " in log.waterfall()
+        log.fill_sizes()
+        log.fill_sizes()
+
+        assert log.entries()[0]["size"] == 3 * 1024 * 1024
+        assert request.size_lookups == 1
+        assert " 3.0M " in log.waterfall()
+
+    def test_size_stays_unknown_when_the_lookup_fails(self):
+        log = NetworkLog()
+        load(log, FakeRequest("https://example.test/closed.js"))
+        log.fill_sizes()
+
+        assert log.entries()[0]["size"] is None
+        assert "     ? " in log.waterfall()
+
+    def test_failed_requests_have_no_size(self):
+        log = NetworkLog()
+        request = FakeRequest("https://tracker.test/pixel.gif")
+        request.failure = "net::ERR_BLOCKED_BY_CLIENT"
+        log._on_request(request)
+        log._on_failed(request)
+        log.fill_sizes()
+
+        assert request.size_lookups == 0
+        line = log.waterfall().splitlines()[1]
+        assert "FAIL" in line and "     - " in line and "(net::ERR_BLOCKED_BY_CLIENT)" in line
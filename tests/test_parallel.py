@@ -0,0 +1,17 @@
+import sys
+import pytest
+import allure
+from runner.parallel import collect_tests
+
+
+@allure.feature("Test runner")
+@allure.story("Parallel collection")
+class TestCollectTests:
+    """Collection runs against the repository's real pytest.ini and its -v addopts"""
+
+    @pytest.mark.parametrize("flags", ["", "-v", "-q"])
+    def test_collects_node_ids(self, flags):
+        tests = collect_tests(f"{sys.executable} -m pytest {flags} tests/test_concurrent_navigation.py")
+
+        assert tests
+        assert all(test.startswith("tests/test_concurrent_navigation.py::") for test in tests)
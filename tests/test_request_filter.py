@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+import allure
+from utils.request_filter import KnownSizes, RequestFilter
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+    def abort(self, error_code: str = None):
+        self.outcome = error_code
+
+
+@allure.feature("Request filter")
+class TestKnownSizes:
+
+    def test_least_recently_used_is_evicted(self):
+        sizes = KnownSizes(limit=2)
+        sizes.set("a", 1)
+        sizes.set("b", 2)
+        assert sizes.get("a") == 1
+        sizes.set("c", 3)
+
+        assert len(sizes) == 2
+        assert (sizes.get("a"), sizes.get("b"), sizes.get("c")) == (1, None, 3)
+
+
+@allure.feature("Request filter")
+class TestRequestFilter:
+
+    def test_allow_rules_win_over_deny_rules(self):
+        request_filter = RequestFilter("test", deny_types=["image"], deny_domains=["tracker.test"],
+                                       allow_domains=["example.test"])
+
+        assert request_filter.is_blocked("https://cdn.other.test/a.png", "image")
+        assert request_filter.is_blocked("https://pixel.tracker.test/p.js", "script")
+        assert not request_filter.is_blocked("https://static.example.test/a.png", "image")
+        assert not request_filter.is_blocked("https://cdn.other.test/a.js", "script")
+
+    def test_blocked_requests_are_aborted_and_counted(self):
+        request_filter = RequestFilter("test", deny_types=["image"])
+        passed = FakeRoute("https://example.test/app.js", "script")
+        blocked = FakeRoute("https://example.test/a.png", "image")
+        request_filter.handle_route(passed)
+        request_filter.handle_route(blocked)
+
+        assert (passed.outcome, blocked.outcome) == ("fallback", "blockedbyclient")
+        assert request_filter.stats()["requests_blocked"] == 1
@@ -0,0 +1,72 @@
+import json
+import os
+import allure
+from runner.scheduler import schedule_longest_first
+from runner.timings import DEFAULT_TEST_ESTIMATE, TimingHistory, load_test_durations
+
+
+@allure.feature("Test runner")
+@allure.story("Scheduling")
+class TestScheduleLongestFirst:
+
+    def test_longest_first_onto_least_loaded_worker(self):
+        estimates = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 2, "f": 2}
+        shards, predicted = schedule_longest_first(list(estimates), estimates, 2)
+
+        # a->w0, b->w1, c->w1 (5<7), d->w0 (7<9), e->w1 (9<10), f->w0 (10<11)
+        assert shards == [["a", "d", "f"], ["b", "c", "e"]]
+        assert predicted == [12, 11]
+
+    def test_more_workers_than_tests(self):
+        shards, predicted = schedule_longest_first(["a", "b"], {"a": 3, "b": 1}, 3)
+
+        assert sorted(map(len, shards)) == [0, 1, 1]
+        assert sorted(predicted) == [0.0, 1, 3]
+
+    def test_no_history_falls_back_to_default_estimate(self, tmp_path):
+        history = TimingHistory(str(tmp_path / "timings.sqlite"))
+        tests = [f"tests/test_x.py::test_{index}" for index in range(5)]
+        try:
+            estimates = history.estimates(tests)
+        finally:
+            history.close()
+        shards, predicted = schedule_longest_first(tests, estimates, 2)
+
+        assert set(estimates.values()) == {DEFAULT_TEST_ESTIMATE}
+        assert [len(shard) for shard in shards] == [3, 2]
+        assert predicted == [3 * DEFAULT_TEST_ESTIMATE, 2 * DEFAULT_TEST_ESTIMATE]
+        # Equal estimates keep collection order
+        assert shards[0] == [tests[0], tests[2], tests[4]]
+
+    def test_new_tests_get_the_median_of_known_ones(self, tmp_path):
+        history = TimingHistory(str(tmp_path / "timings.sqlite"))
+        try:
+            run_id = history.start_run(1)
+            history.add_test_durations(run_id, {
+                "t::slow": {"duration": 30.0, "outcome": "passed"},
+                "t::mid": {"duration": 6.0, "outcome": "passed"},
+                "t::fast": {"duration": 2.0, "outcome": "passed"},
+            })
+            estimates = history.estimates(["t::slow", "t::mid", "t::fast", "t::new"])
+        finally:
+            history.close()
+        shards, predicted = schedule_longest_first(list(estimates), estimates, 2)
+
+        assert estimates["t::new"] == 6.0
+        assert shards == [["t::slow"], ["t::mid", "t::new", "t::fast"]]
+        assert predicted == [30.0, 14.0]
+
+
+@allure.feature("Test runner")
+@allure.story("Scheduling")
+class TestLoadTestDurations:
+
+    def test_files_from_an_earlier_run_are_ignored(self, tmp_path):
+        fresh, stale = tmp_path / "fresh.json", tmp_path / "stale.json"
+        fresh.write_text(json.dumps({"t::fresh": {"duration": 1.0, "outcome": "passed"}}), encoding="utf-8")
+        stale.write_text(json.dumps({"t::stale": {"duration": 9.0, "outcome": "passed"}}), encoding="utf-8")
+        os.utime(fresh, (2000, 2000))
+        os.utime(stale, (500, 500))
+
+        assert list(load_test_durations([fresh, stale, tmp_path / "missing.json"], since=1000)) == ["t::fresh"]
+        assert len(load_test_durations([fresh, stale])) == 2
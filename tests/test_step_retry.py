@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+import allure
+from utils.step_retry import StepRetry
+
+
+class FlakyStep:
+    """Fails with `error` on the first `failures` calls, then returns "done" """
+
+    def __init__(self, failures: int, error=AssertionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error(f"attempt {self.calls} failed")
+        return "done"
+
+
+class PreviousStep:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+
+@allure.feature("Step retry")
+class TestStepRetry:
+
+    @pytest.fixture
+    def retry(self):
+        retry = StepRetry(retries=2, budget_ms=60000)
+        retry.start_test("tests/test_example.py::test_flaky")
+        return retry
+
+    def test_passing_step_runs_once(self, retry):
+        step, previous = FlakyStep(0), PreviousStep()
+
+        assert retry.run("Check", step, previous=previous) == "done"
+        assert (step.calls, previous.calls) == (1, 0)
+        assert retry.history == []
+
+    def test_recovers_within_retries_and_repeats_previous_step(self, retry):
+        step, previous = FlakyStep(2), PreviousStep()
+
+        assert retry.run("Check", step, previous=previous) == "done"
+        assert (step.calls, previous.calls) == (3, 2)
+        assert [entry["recovered"] for entry in retry.history] == [False, True]
+        assert [entry["attempt"] for entry in retry.history] == [2, 3]
+        assert retry.history[0]["test"] == "tests/test_example.py::test_flaky"
+        assert retry.summary()["retries"] == 2
+        assert retry.summary()["recovered"] == 1
+
+    def test_raises_last_error_when_retries_run_out(self, retry):
+        step, previous = FlakyStep(5), PreviousStep()
+
+        with pytest.raises(AssertionError, match="attempt 3 failed"):
+            retry.run("Check", step, previous=previous)
+        assert (step.calls, previous.calls) == (3, 2)
+        assert not any(entry["recovered"] for entry in retry.history)
+
+    def test_other_errors_are_not_retried(self, retry):
+        step = FlakyStep(1, error=ValueError)
+
+        with pytest.raises(ValueError):
+            retry.run("Check", step)
+        assert step.calls == 1
+        assert retry.history == []
+
+    def test_used_up_budget_stops_retries(self):
+        retry = StepRetry(retries=2, budget_ms=0)
+        retry.start_test("tests/test_example.py::test_flaky")
+        step = FlakyStep(1)
+
+        with pytest.raises(AssertionError):
+            retry.run("Check", step)
+        assert step.calls == 1
+
+    def test_async_steps_recover_the_same_way(self, retry):
+        step, previous = FlakyStep(1), PreviousStep()
+
+        async def action():
+            return step()
+
+        async def repeat_previous():
+            previous()
+
+        assert asyncio.run(retry.run_async("Check", action, previous=repeat_previous)) == "done"
+        assert (step.calls, previous.calls) == (2, 1)
+        assert [entry["recovered"] for entry in retry.history] == [True]
@@ -0,0 +1,113 @@
+import io
+import pytest
+import allure
+from runner import stream
+from runner.stream import LiveOutput, ProgressTracker
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(stream.time, "monotonic", clock)
+    return clock
+
+
+@allure.feature("Test runner")
+@allure.story("Live progress")
+class TestProgressTracker:
+
+    def test_parses_collection_and_outcomes(self, clock):
+        tracker = ProgressTracker()
+        for line in [
+            "============================= test session starts ==============================",
+            "collected 5 items",
+            "",
+            "tests/test_a.py::TestA::test_one[chromium] PASSED                        [ 20%]",
+            "tests/test_a.py::TestA::test_two[chromium] RERUN                         [ 40%]",
+            "tests/test_a.py::TestA::test_two[chromium] FAILED                        [ 40%]",
+            "tests/test_a.py::TestA::test_three[chromium] SKIPPED (no link)           [ 60%]",
+            "tests/test_b.py::test_four PASSED                                        [ 80%]",
+            "tests/test_b.py::test_four ERROR                                         [ 80%]",
+            "tests/test_b.py::test_five XPASS                                         [100%]",
+            "FAILED tests/test_a.py::TestA::test_two[chromium] - AssertionError: URL",
+        ]:
+            tracker.feed(line)
+
+        assert tracker.total == 5
+        assert tracker.outcomes == {
+            "tests/test_a.py::TestA::test_one[chromium]": "passed",
+            "tests/test_a.py::TestA::test_two[chromium]": "failed",
+            "tests/test_a.py::TestA::test_three[chromium]": "skipped",
+            "tests/test_b.py::test_four": "error",
+            "tests/test_b.py::test_five": "xpass",
+        }
+        assert tracker.counts() == {"passed": 2, "failed": 2, "skipped": 1}
+
+    def test_running_test_from_partial_line(self, clock):
+        tracker = ProgressTracker()
+        tracker.feed("collected 2 items")
+
+        assert tracker.feed_partial("tests/test_a.py::test_one ", "w0") is True
+        assert tracker.feed_partial("tests/test_a.py::test_one ", "w0") is False
+        assert tracker.feed_partial("tests/test_b.py::test_two ", "w1") is True
+        assert tracker.status().endswith("tests/test_a.py::test_one (+1 more)")
+
+        tracker.feed("tests/test_a.py::test_one PASSED", "w0")
+        assert tracker.current == {"w1": "tests/test_b.py::test_two"}
+
+    def test_eta_unknown_before_collection(self, clock):
+        assert ProgressTracker().eta() is None
+        assert ProgressTracker().status() == "[0/?] | ✓0 ✗0 ↷0 | elapsed 0s"
+
+    def test_eta_scales_default_estimates_by_observed_pace(self, clock):
+        # Finished tests took twice their history, so the rest is expected to as well
+        tracker = ProgressTracker(history={"t::a": 5.0, "t::b": 5.0}, default_estimate=10.0)
+        tracker.feed("collected 4 items")
+        tracker.feed("t::a PASSED")
+        tracker.feed("t::b PASSED")
+        clock.now += 20
+
+        assert tracker.eta() == pytest.approx(40.0)
+        assert tracker.status() == "[2/4] | ✓2 ✗0 ↷0 | elapsed 20s | ETA 40s"
+
+    def test_eta_from_planned_estimates_across_workers(self, clock):
+        tracker = ProgressTracker(planned={"t::a": 10.0, "t::b": 20.0, "t::c": 30.0}, workers=2)
+        assert tracker.eta() == pytest.approx(30.0)
+
+        tracker.feed("t::a PASSED", "w0")
+        clock.now += 5
+        # Two workers finished 10s of estimated work in 5s: exactly on pace
+        assert tracker.eta() == pytest.approx(25.0)
+
+        clock.now += 15
+        # 20s for the same work: four times slower than predicted
+        assert tracker.eta() == pytest.approx(100.0)
+        assert "ETA 1m40s" in tracker.status()
+
+
+@allure.feature("Test runner")
+@allure.story("Live progress")
+class TestLiveOutput:
+
+    def test_lines_are_written_and_counted_without_a_status_line(self, clock):
+        buffer = io.StringIO()
+        output = LiveOutput(ProgressTracker(), stream=buffer)
+        output.line("collected 1 item")
+        output.partial("tests/test_a.py::test_one ")
+        output.line("tests/test_a.py::test_one PASSED", prefix="[w0] ")
+        clock.now += 3
+        output.summary("Running automated tests")
+
+        assert buffer.getvalue() == (
+            "collected 1 item\n"
+            "[w0] tests/test_a.py::test_one PASSED\n"
+            "Running automated tests: 1 passed, 0 failed, 0 skipped in 3s\n"
+        )
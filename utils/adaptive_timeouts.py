@@ -0,0 +1,132 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from config.config import Config
+from .json_store import load_json, atomic_write_json
+
+
+def percentile(samples, q: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class AdaptiveTimeouts:
+    """Per-wait timeout budgets learned from the latencies of previous runs.
+
+    Each wait is keyed like the selector cache (page object, wait, base URL).
+    Once a key has `min_samples` observations its budget is the observed p99
+    times `safety_factor`, clamped to [min_ms, max_ms]; until then the caller's
+    default is used. A wait that timed out since the last budget is never
+    tightened below its default, so a flaky wait loosens instead of failing again.
+    """
+
+    def __init__(self, path: str, enabled: bool = True, safety_factor: float = 3.0,
+                 min_ms: int = 1000, max_ms: int = 30000, min_samples: int = 5, window: int = 50):
+        self.path = path
+        self.enabled = enabled
+        self.safety_factor = safety_factor
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.min_samples = min_samples
+        self.window = window
+        self.decisions = {}
+        self._stats = None
+        self._new = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        """Lazily loaded {key: {"samples": [ms, ...], "timeouts": n}}"""
+        if self._stats is None:
+            self._stats = load_json(self.path, {}) if self.enabled else {}
+        return self._stats
+
+    def budget(self, key: str, default_ms: int) -> int:
+        """Timeout in ms for the next wait on key"""
+        if not self.enabled:
+            return default_ms
+        with self._lock:
+            entry = self.stats.get(key, {})
+            samples = entry.get("samples", [])
+            if len(samples) < self.min_samples:
+                return default_ms
+            p99 = percentile(samples, 99)
+            budget = int(min(max(p99 * self.safety_factor, self.min_ms), self.max_ms))
+            if entry.get("timeouts"):
+                budget = max(budget, default_ms)
+            self.decisions[key] = {
+                "default_ms": default_ms,
+                "budget_ms": budget,
+                "p99_ms": round(p99, 1),
+                "samples": len(samples),
+            }
+            return budget
+
+    def observe(self, key: str, elapsed_ms: float, timed_out: bool = False):
+        """Record how long a wait on key took, or that it ran out of time"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self.stats.setdefault(key, {"samples": [], "timeouts": 0})
+            new = self._new.setdefault(key, {"samples": [], "timeouts": 0})
+            if timed_out:
+                entry["timeouts"] = new["timeouts"] = entry.get("timeouts", 0) + 1
+            else:
+                entry["samples"] = (entry["samples"] + [round(elapsed_ms, 1)])[-self.window:]
+                new["samples"].append(round(elapsed_ms, 1))
+                # A success after a timeout means the wait is healthy again
+                entry["timeouts"] = new["timeouts"] = 0
+
+    @contextmanager
+    def measure(self, key: str, default_ms: int, timeout_errors=()):
+        """Yield the budget for key and record the wait's outcome.
+
+        Playwright timeouts and expect() failures count as the wait running out
+        of time, as do any extra `timeout_errors` the caller raises on a miss.
+        """
+        budget = self.budget(key, default_ms)
+        start = time.monotonic()
+        try:
+            yield budget
+        except (PlaywrightTimeoutError, AssertionError, *timeout_errors):
+            self.observe(key, (time.monotonic() - start) * 1000, timed_out=True)
+            raise
+        self.observe(key, (time.monotonic() - start) * 1000)
+
+    def report(self) -> dict:
+        """Budgets handed out this run, split into tightened and loosened against the defaults"""
+        tightened, loosened = [], []
+        for key, decision in sorted(self.decisions.items()):
+            row = {"key": key, **decision}
+            if decision["budget_ms"] < decision["default_ms"]:
+                tightened.append(row)
+            elif decision["budget_ms"] > decision["default_ms"]:
+                loosened.append(row)
+        return {"tightened": tightened, "loosened": loosened}
+
+    def save(self):
+        """Merge this run's observations into the on-disk history"""
+        if not self.enabled or not self._new:
+            return
+        # Re-read so parallel workers do not overwrite each other's samples
+        merged = load_json(self.path, {})
+        for key, new in self._new.items():
+            entry = merged.setdefault(key, {"samples": [], "timeouts": 0})
+            entry["samples"] = (entry["samples"] + new["samples"])[-self.window:]
+            entry["timeouts"] = new["timeouts"]
+        atomic_write_json(self.path, merged)
+        self._new.clear()
+
+
+adaptive_timeouts = AdaptiveTimeouts(
+    Config.ADAPTIVE_TIMEOUTS_PATH,
+    enabled=Config.ADAPTIVE_TIMEOUTS_ENABLED,
+    safety_factor=Config.TIMEOUT_SAFETY_FACTOR,
+    min_ms=Config.TIMEOUT_MIN_MS,
+    max_ms=Config.TIMEOUT_MAX_MS,
+    min_samples=Config.TIMEOUT_MIN_SAMPLES,
+)
@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+
+ENVIRONMENT_FILE = "environment.properties"
+
+# Per-worker counters that are added up when worker results are merged
+SUMMED_PROPERTIES = {
+    "Selector Cache Hits",
+    "Selector Cache Misses",
+    "Selector Cache Evictions",
+    "Snapshot Bytes",
+    "Snapshots Deduplicated",
+    "Timeouts Tightened",
+    "Timeouts Loosened",
+    "Step Retries",
+    "Steps Recovered",
+}
+
+
+def read_properties(path: str) -> dict:
+    """Read an Allure environment.properties file into an ordered dict"""
+    properties = {}
+    if not os.path.exists(path):
+        return properties
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if "=" in line and not line.startswith("#"):
+                key, value = line.split("=", 1)
+                properties[key] = value
+    return properties
+
+
+def write_properties(path: str, properties: dict):
+    """Write environment.properties atomically so parallel writers never interleave"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".env-", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for key, value in properties.items():
+            f.write(f"{key}={value}\n")
+    os.replace(tmp_path, path)
+
+
+def update_environment(results_dir: str, properties: dict):
+    """Add or replace properties in the environment file of a results directory"""
+    path = os.path.join(results_dir, ENVIRONMENT_FILE)
+    merged = read_properties(path)
+    merged.update(properties)
+    write_properties(path, merged)
+
+
+def merge_environment_files(paths, target_path: str):
+    """Merge worker environment files, summing counters and keeping shared values"""
+    merged = {}
+    for path in paths:
+        for key, value in read_properties(path).items():
+            if key in SUMMED_PROPERTIES and key in merged:
+                merged[key] = str(int(merged[key]) + int(value))
+            else:
+                merged.setdefault(key, value)
+    if merged:
+        write_properties(target_path, merged)
@@ -0,0 +1,100 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import allure
+from playwright.sync_api import Page
+from config.config import Config
+from .instrumentation import current_test
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it the browser encodes JPEG itself
+    Image = None
+
+
+# format -> (Pillow format name, file extension, Allure attachment type or MIME type)
+FORMATS = {
+    "png": ("PNG", "png", allure.attachment_type.PNG),
+    "jpeg": ("JPEG", "jpg", allure.attachment_type.JPG),
+    "webp": ("WEBP", "webp", "image/webp"),
+}
+
+
+class ArtifactPipeline:
+    """Capture failure screenshots in memory and encode them off the test thread.
+
+    Encoded images are attached to Allure when the test is flushed, which
+    conftest does at the end of teardown. At most `max_pending` images wait for
+    encoding at once; beyond that screenshots are attached as captured, so a
+    failure storm cannot pile up raw images in memory. An encoding that takes
+    longer than `flush_timeout` seconds is given up and the raw PNG attached.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 4, flush_timeout: float = 10.0):
+        self.flush_timeout = flush_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _encode(raw: bytes, fmt: str, quality: int) -> bytes:
+        image = Image.open(io.BytesIO(raw))
+        if fmt == "jpeg":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, format=FORMATS[fmt][0], quality=quality)
+        return output.getvalue()
+
+    @staticmethod
+    def _attach(body: bytes, name: str, fmt: str):
+        _, extension, attachment_type = FORMATS[fmt]
+        allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+
+    def capture_screenshot(self, page: Page, name: str, key: str = None,
+                           fmt: str = None, quality: int = None, full_page: bool = None):
+        """Take a screenshot into memory and queue it for encoding and attachment"""
+        fmt = fmt or Config.SCREENSHOT_FORMAT
+        quality = quality or Config.SCREENSHOT_QUALITY
+        full_page = Config.SCREENSHOT_FULL_PAGE if full_page is None else full_page
+        key = key or current_test()
+
+        if Image is None or fmt == "png":
+            # Nothing to do off-thread: the browser encodes PNG or JPEG directly
+            fmt = "jpeg" if fmt == "jpeg" else "png"
+            options = {"quality": quality} if fmt == "jpeg" else {}
+            self._attach(page.screenshot(type=fmt, full_page=full_page, **options), name, fmt)
+            return
+
+        raw = page.screenshot(type="png", full_page=full_page)
+        if not self._slots.acquire(blocking=False):
+            self._attach(raw, name, "png")
+            return
+
+        future = self._executor.submit(self._encode, raw, fmt, quality)
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._pending.setdefault(key, []).append((future, raw, name, fmt))
+
+    def flush(self, key: str = None):
+        """Attach every finished encoding queued for a test"""
+        key = key or current_test()
+        with self._lock:
+            pending = self._pending.pop(key, [])
+        for future, raw, name, fmt in pending:
+            try:
+                self._attach(future.result(timeout=self.flush_timeout), name, fmt)
+            except FutureTimeoutError:
+                future.cancel()
+                self._attach(raw, name, "png")
+            except Exception as e:
+                print(f"Failed to encode screenshot '{name}': {e}")
+
+    def shutdown(self):
+        """Drop anything still queued and stop the encoder threads"""
+        with self._lock:
+            self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+
+artifact_pipeline = ArtifactPipeline(Config.ARTIFACT_WORKERS, Config.ARTIFACT_MAX_PENDING, Config.ARTIFACT_FLUSH_TIMEOUT)
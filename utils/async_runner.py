@@ -0,0 +1,67 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from playwright.async_api import async_playwright
+from config.config import Config
+from pages.async_main_page import AsyncMainPage
+from .context_setup import prepare_async_context, setup_page, start_network_log
+
+
+async def _run_checks(checks, browser_name: str, launch_args: dict, concurrency: int, endpoint: str = None,
+                      resource_profile: str = None, network_log: bool = False, on_done=None):
+    """Run every check on its own page of one browser, at most `concurrency` at once"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with async_playwright() as playwright:
+        browser_type = getattr(playwright, browser_name)
+        if endpoint:
+            # Warm daemon browser: checks still get their own fresh contexts
+            browser = await browser_type.connect_over_cdp(endpoint, slow_mo=launch_args.get("slow_mo"))
+        else:
+            browser = await browser_type.launch(**launch_args)
+
+        async def run_one(index, check):
+            async with semaphore:
+                context = await browser.new_context(**Config.CONTEXT_OPTIONS)
+                # Same network handling and diagnostics as the sync test contexts
+                diagnostics = {
+                    "request_filter": await prepare_async_context(context, resource_profile),
+                    "network_log": start_network_log(context, force=network_log),
+                    "console_log": None,
+                }
+                try:
+                    page = await context.new_page()
+                    diagnostics["console_log"] = setup_page(page)
+                    result = await check(AsyncMainPage(page))
+                except Exception as e:
+                    result = e
+                finally:
+                    await context.close()
+                if on_done:
+                    on_done(index, result, diagnostics)
+                return result
+
+        try:
+            return await asyncio.gather(*(run_one(index, check) for index, check in enumerate(checks)),
+                                        return_exceptions=True)
+        finally:
+            await browser.close()
+
+
+def run_page_checks(checks, browser_name: str = "chromium", launch_args: dict = None,
+                    concurrency: int = None, endpoint: str = None, resource_profile: str = None,
+                    network_log: bool = False, on_done=None):
+    """Run async page checks concurrently and return their results in order.
+
+    Each check is a coroutine function taking an AsyncMainPage. Exceptions are
+    returned in place of results so one failing page does not hide the others.
+    With a CDP `endpoint` the checks run on that browser instead of a new one.
+    Contexts get the network archive and the `resource_profile` request filter;
+    `on_done(index, result, diagnostics)` receives each check's request filter,
+    network log (recorded per policy, or always with `network_log`) and console log.
+    """
+    concurrency = concurrency or Config.ASYNC_CONCURRENCY
+    coroutine = _run_checks(checks, browser_name, launch_args or {}, concurrency, endpoint,
+                            resource_profile, network_log, on_done)
+    # The sync API keeps its own event loop on the test thread, so run asyncio on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -0,0 +1,55 @@
+import json
+import os
+import urllib.request
+from utils.json_store import load_json
+
+
+# Written by the daemon on start: pid and control port
+DAEMON_STATE_PATH = ".cache/browser-daemon.json"
+
+
+class BrowserDaemonClient:
+    """Talk to the warm browser daemon started by `run_tests.py daemon start`.
+
+    Every call returns None when the daemon is not running or does not answer,
+    so callers can fall back to launching a browser themselves.
+    """
+
+    def __init__(self, state_path: str = DAEMON_STATE_PATH, timeout: float = 2):
+        self.state_path = state_path
+        self.timeout = timeout
+
+    def _url(self, path: str):
+        state = load_json(self.state_path, None)
+        if not state:
+            return None
+        return f"http://127.0.0.1:{state['control_port']}{path}"
+
+    def _call(self, path: str, payload: dict = None, timeout: float = None):
+        url = self._url(path)
+        if url is None:
+            return None
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def status(self):
+        return self._call("/status")
+
+    def acquire(self):
+        """Lease the warm browser; returns {"lease", "endpoint"} or None"""
+        # A restart may be due before the lease is granted, which takes a browser launch
+        return self._call("/acquire", {"pid": os.getpid()}, timeout=60)
+
+    def release(self, lease: str):
+        return self._call("/release", {"lease": lease})
+
+    def shutdown(self):
+        return self._call("/shutdown", {})
+
+
+browser_daemon = BrowserDaemonClient()
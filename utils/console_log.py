@@ -0,0 +1,123 @@
+import time
+from playwright.sync_api import ConsoleMessage, Page
+
+
+# Severity of console message types, page errors and crashes
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+CONSOLE_LEVELS = {"debug": 10, "warning": 30, "error": 40, "assert": 40}
+PAGE_ERROR_LEVEL = 50
+CRASH_LEVEL = 60
+LEVEL_NAMES = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "PAGEERROR", 60: "CRASH"}
+# Baseline entry holding the number of errors dropped over capacity
+DROPPED_KEY = ("dropped", "", "")
+
+
+class ConsoleLog:
+    """Console messages, page errors and crashes of one page, deduplicated in memory.
+
+    Handlers drop messages below `min_level` first and otherwise only bump a
+    counter or add one dict entry, so log-heavy pages do not slow the event
+    loop. Repeated messages (same kind, text and source location) are
+    counted, not stored again. At most `capacity` distinct messages are
+    kept, errors included; further ones are only counted, and errors among
+    them still count as new errors.
+    """
+
+    def __init__(self, min_level: str = "warning", capacity: int = 200):
+        if min_level not in LEVELS:
+            raise ValueError(f"Unknown console log level '{min_level}', expected one of {list(LEVELS)}")
+        self.min_level = LEVELS[min_level]
+        self.capacity = capacity
+        self.started = time.monotonic()
+        self.entries = {}
+        self.dropped = 0
+        self.dropped_errors = 0
+
+    def install(self, page: Page):
+        page.on("console", self._on_console)
+        page.on("pageerror", self._on_page_error)
+        page.on("crash", self._on_crash)
+
+    def _add(self, kind: str, level: int, text: str, location: str = "", stack: str = None):
+        if level < self.min_level:
+            return
+        key = (kind, text, location)
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry["count"] += 1
+            entry["last_at"] = round(time.monotonic() - self.started, 3)
+            return
+        if len(self.entries) >= self.capacity:
+            self.dropped += 1
+            if level >= LEVELS["error"]:
+                self.dropped_errors += 1
+            return
+        at = round(time.monotonic() - self.started, 3)
+        self.entries[key] = {
+            "kind": kind, "level": level, "text": text, "location": location,
+            "stack": stack, "count": 1, "first_at": at, "last_at": at,
+        }
+
+    def _on_console(self, message: ConsoleMessage):
+        level = CONSOLE_LEVELS.get(message.type, LEVELS["info"])
+        if level < self.min_level:
+            return
+        location = message.location or {}
+        source = f"{location.get('url', '')}:{location.get('lineNumber', '')}" if location.get("url") else ""
+        self._add(f"console.{message.type}", level, message.text, source)
+
+    def _on_page_error(self, error):
+        self._add("pageerror", PAGE_ERROR_LEVEL, getattr(error, "message", None) or str(error),
+                  stack=getattr(error, "stack", None))
+
+    def _on_crash(self, page: Page):
+        self._add("crash", CRASH_LEVEL, f"Page crashed: {page.url}")
+
+    def errors(self) -> list:
+        """Console errors, page errors and crashes"""
+        return [entry for entry in self.entries.values() if entry["level"] >= LEVELS["error"]]
+
+    def baseline(self) -> dict:
+        """Marker of the errors seen so far, for assert_no_new_errors"""
+        baseline = {(e["kind"], e["text"], e["location"]): e["count"] for e in self.errors()}
+        baseline[DROPPED_KEY] = self.dropped_errors
+        return baseline
+
+    def new_errors(self, baseline: dict = None) -> list:
+        """Errors not in the baseline, or seen more often than when it was taken"""
+        baseline = baseline or {}
+        new = [
+            entry for entry in self.errors()
+            if entry["count"] > baseline.get((entry["kind"], entry["text"], entry["location"]), 0)
+        ]
+        dropped = self.dropped_errors - baseline.get(DROPPED_KEY, 0)
+        if dropped > 0:
+            new.append({
+                "kind": "dropped", "level": LEVELS["error"], "location": "", "stack": None, "count": dropped,
+                "text": f"{dropped} errors not stored after {self.capacity} distinct messages",
+            })
+        return new
+
+    def assert_no_new_errors(self, baseline: dict = None):
+        """Fail if JavaScript errors appeared since `baseline` (or at all, without one)"""
+        new = self.new_errors(baseline)
+        assert not new, "New JavaScript errors:\n" + "\n".join(
+            f"  {entry['kind']}: {entry['text']}" + (f" ({entry['location']})" if entry["location"] else "")
+            for entry in new
+        )
+
+    def report(self) -> str:
+        """One line per distinct message, in order of first appearance"""
+        lines = []
+        for entry in self.entries.values():
+            repeated = f" x{entry['count']}" if entry["count"] > 1 else ""
+            location = f" ({entry['location']})" if entry["location"] else ""
+            lines.append(
+                f"+{entry['first_at']:.3f}s [{LEVEL_NAMES[entry['level']]}{repeated}] {entry['text']}{location}"
+            )
+            if entry["stack"]:
+                lines.extend(f"    {line.strip()}" for line in entry["stack"].splitlines()[1:6])
+        if self.dropped:
+            errors = f", {self.dropped_errors} of them errors" if self.dropped_errors else ""
+            lines.append(f"{self.dropped} further messages dropped after {self.capacity} distinct ones{errors}")
+        return "\n".join(lines)
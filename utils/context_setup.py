@@ -0,0 +1,50 @@
+from config.config import Config
+from .console_log import ConsoleLog
+from .network_archive import network_archive
+from .network_log import NetworkLog
+from .request_filter import RequestFilter
+
+
+def _install_network_handling(context, request_filter: RequestFilter) -> list:
+    """Install the archive and the filter, returning the route registrations made"""
+    registrations = [network_archive.install(context)]
+    # The mirror only serves its own origin; replay already serves everything from the archive
+    if Config.BASE_URL.rstrip("/") == Config.MIRROR_URL and network_archive.mode != "replay":
+        registrations.append(network_archive.install_offsite(context, Config.MIRROR_URL))
+    # Registered last so it runs before any other route handler
+    registrations.append(request_filter.install(context))
+    return [registration for registration in registrations if registration is not None]
+
+
+def prepare_context(context, resource_profile: str = None) -> RequestFilter:
+    """Apply network handling to a new sync context"""
+    request_filter = RequestFilter.from_profile(resource_profile or Config.RESOURCE_PROFILE)
+    _install_network_handling(context, request_filter)
+    return request_filter
+
+
+async def prepare_async_context(context, resource_profile: str = None) -> RequestFilter:
+    """Apply network handling to a new async context, awaiting its route registrations in order"""
+    request_filter = RequestFilter.from_profile(resource_profile or Config.RESOURCE_PROFILE)
+    for registration in _install_network_handling(context, request_filter):
+        await registration
+    return request_filter
+
+
+def start_network_log(context, force: bool = False):
+    """Record the context's requests unless the network log policy is "never" """
+    if Config.NETWORK_LOG_POLICY == "never" and not force:
+        return None
+    network_log = NetworkLog(Config.NETWORK_LOG_CAPACITY)
+    network_log.install(context)
+    return network_log
+
+
+def setup_page(page) -> ConsoleLog:
+    """Apply common page settings and return the page's console log"""
+    page.set_default_timeout(Config.PLAYWRIGHT_TIMEOUT)
+    page.set_default_navigation_timeout(Config.NAVIGATION_TIMEOUT)
+    # Console messages, page errors and crashes are buffered and attached once per test
+    console_log = ConsoleLog(Config.CONSOLE_LOG_LEVEL, Config.CONSOLE_LOG_CAPACITY)
+    console_log.install(page)
+    return console_log
@@ -0,0 +1,143 @@
+import http.client
+import queue
+import ssl
+import threading
+import time
+from urllib.parse import urljoin, urlsplit
+from config.config import Config
+
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Bodies are only needed for link extraction; anything larger is cut off
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+
+class HttpResponse:
+    """Outcome of one URL after following its redirects"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.final_url = url
+        self.status = None
+        self.headers = {}
+        self.body = b""
+        self.redirect_chain = []
+        self.elapsed_ms = 0.0
+        self.error = None
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "")
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "final_url": self.final_url,
+            "status": self.status,
+            "redirect_chain": self.redirect_chain,
+            "elapsed_ms": self.elapsed_ms,
+            "error": self.error,
+        }
+
+
+class HttpClient:
+    """Thread-safe keep-alive HTTP(S) client with a small connection pool per host.
+
+    Connections are reused across requests to the same origin, so checking many
+    URLs of one site costs one TCP/TLS handshake per pooled connection.
+    """
+
+    def __init__(self, timeout: float = 10, max_per_host: int = 8, verify_tls: bool = None):
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        verify_tls = not Config.CONTEXT_OPTIONS.get("ignore_https_errors") if verify_tls is None else verify_tls
+        self._ssl_context = ssl.create_default_context() if verify_tls else ssl._create_unverified_context()
+        self._pools = {}
+        self._lock = threading.Lock()
+        self.stats = {"connections": 0, "requests": 0}
+
+    def _pool(self, origin):
+        with self._lock:
+            if origin not in self._pools:
+                self._pools[origin] = queue.LifoQueue(self.max_per_host)
+            return self._pools[origin]
+
+    def _connect(self, origin):
+        scheme, host, port = origin
+        self.stats["connections"] += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _release(self, origin, connection, reusable: bool):
+        if not reusable:
+            connection.close()
+            return
+        try:
+            self._pool(origin).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method: str, url: str, headers: dict = None, read_body: bool = True):
+        """Send one request over a pooled connection; returns (status, headers, body)"""
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        headers = {"User-Agent": "qa-http-client", "Accept-Encoding": "identity", **(headers or {})}
+
+        for attempt in range(2):
+            try:
+                connection = self._pool(origin).get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._connect(origin)
+                reused = False
+            try:
+                connection.request(method, path, headers=headers)
+                response = connection.getresponse()
+                body = response.read(MAX_BODY_BYTES) if read_body else b""
+                # The connection can only be reused once the body has been consumed
+                if not response.isclosed():
+                    response.read()
+                self.stats["requests"] += 1
+                reusable = not response.will_close
+                response_headers = {key.lower(): value for key, value in response.getheaders()}
+                self._release(origin, connection, reusable)
+                return response.status, response_headers, body
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                # A pooled keep-alive connection may have been closed by the server; retry once fresh
+                if not reused or attempt:
+                    raise
+            except Exception:
+                connection.close()
+                raise
+
+    def fetch(self, url: str, method: str = "GET", max_redirects: int = 10, read_body: bool = True):
+        """Request a URL, following redirects manually so the chain is recorded"""
+        result = HttpResponse(url)
+        start = time.monotonic()
+        current = url
+        try:
+            for _ in range(max_redirects + 1):
+                status, headers, body = self.request(method, current, read_body=read_body)
+                result.status, result.headers, result.body, result.final_url = status, headers, body, current
+                if status not in REDIRECT_STATUSES or "location" not in headers:
+                    break
+                result.redirect_chain.append({"url": current, "status": status})
+                current = urljoin(current, headers["location"])
+            else:
+                result.error = f"More than {max_redirects} redirects"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.elapsed_ms = round((time.monotonic() - start) * 1000, 1)
+        return result
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            while not pool.empty():
+                pool.get_nowait().close()
@@ -0,0 +1,149 @@
+import contextvars
+import csv
+import inspect
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+import allure_commons
+from allure_commons.model2 import Parameter, TestStepResult
+
+
+TIMELINE_FIELDS = [
+    "test", "kind", "name", "start", "end", "duration_ms", "wait_ms", "action_ms", "retries", "status"
+]
+
+# Open page-object actions of the current thread or asyncio task
+_actions = contextvars.ContextVar("timeline_actions", default=())
+
+
+def current_test() -> str:
+    """Node id of the running test, as published by pytest"""
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+
+
+class Timeline:
+    """Monotonic timing of every Allure step and instrumented page-object action.
+
+    Steps are captured through Allure's own start_step/stop_step hooks, so both
+    `@allure.step` methods and `with allure.step(...)` blocks are covered without
+    touching them. Durations are added to the steps as Allure parameters.
+    """
+
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.test = None
+        self.events = []
+        self.reporter = None
+        self._steps = {}
+
+    def _now(self) -> float:
+        return round((time.monotonic() - self.origin) * 1000, 1)
+
+    def _add_step_parameter(self, name: str, value: str, uuid=None):
+        """Attach a parameter to an open Allure step, if there is one.
+
+        Repeats of a name within one step are numbered, since Allure shows only
+        one parameter per name.
+        """
+        if self.reporter is None:
+            return
+        item = self.reporter.get_item(uuid) if uuid else self.reporter.get_last_item()
+        if not isinstance(item, TestStepResult):
+            return
+        taken = {parameter.name for parameter in item.parameters}
+        unique, number = name, 1
+        while unique in taken:
+            number += 1
+            unique = f"{name} #{number}"
+        item.parameters.append(Parameter(name=unique, value=value))
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._steps[uuid] = (title, self._now())
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title, start = self._steps.pop(uuid, (None, None))
+        if title is None:
+            return
+        end = self._now()
+        self.events.append({
+            "test": self.test, "kind": "step", "name": title, "start": start, "end": end,
+            "duration_ms": round(end - start, 1), "wait_ms": None, "action_ms": None,
+            "retries": 0, "status": "failed" if exc_type else "passed",
+        })
+        # Runs before Allure closes the step, so the parameter lands on it
+        self._add_step_parameter("duration", f"{end - start:.0f} ms", uuid)
+
+    @contextmanager
+    def action(self, name: str):
+        """Time a page-object action, splitting wait time from action time"""
+        record = {"name": name, "start": self._now(), "wait_ms": 0.0, "retries": 0}
+        token = _actions.set(_actions.get() + (record,))
+        status = "passed"
+        try:
+            yield record
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            _actions.reset(token)
+            end = self._now()
+            duration = round(end - record["start"], 1)
+            wait = round(min(record["wait_ms"], duration), 1)
+            self.events.append({
+                "test": self.test, "kind": "action", "name": name, "start": record["start"],
+                "end": end, "duration_ms": duration, "wait_ms": wait,
+                "action_ms": round(duration - wait, 1), "retries": record["retries"], "status": status,
+            })
+            self._add_step_parameter(
+                name, f"{duration:.0f} ms (wait {wait:.0f} ms, retries {record['retries']})"
+            )
+
+    @contextmanager
+    def waiting(self):
+        """Count the enclosed block as wait time for every open action"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = (time.monotonic() - start) * 1000
+            for record in _actions.get():
+                record["wait_ms"] += elapsed
+
+    def note_retry(self):
+        """Count a retry against the innermost open action"""
+        stack = _actions.get()
+        if stack:
+            stack[-1]["retries"] += 1
+
+    def write(self, directory: str, name: str):
+        """Write the run's events as JSON and CSV"""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(self.events, f, indent=1, ensure_ascii=False)
+        with open(os.path.join(directory, f"{name}.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=TIMELINE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.events)
+
+
+def timed_action(func):
+    """Record a page-object method in the timeline as `Class.method`"""
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            with timeline.action(f"{type(self).__name__}.{func.__name__}"):
+                return await func(self, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with timeline.action(f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+timeline = Timeline()
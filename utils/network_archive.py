@@ -0,0 +1,194 @@
+import glob
+import hashlib
+import os
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext, Request, Route
+from config.config import Config
+from .json_store import load_json, atomic_write_json
+from .response_cache import ResponseCache
+
+
+NETWORK_MODES = ("live", "record", "replay")
+
+
+class NetworkArchive:
+    """Content-addressed archive of network responses for record/replay runs.
+
+    `index.json` maps "METHOD URL" to status, headers and the SHA-256 of the
+    body; bodies live once under `blobs/`. In replay mode the index and every
+    body read are kept in memory, so repeated loads never touch the disk or
+    the network again.
+
+    Parallel workers (`worker` set) save into `index.worker-N.json` and
+    `missing.worker-N.txt` instead; the runner merges them with
+    `merge_worker_files` once every worker has finished.
+    """
+
+    def __init__(self, directory: str, mode: str = "live", worker: str = None):
+        self.directory = directory
+        self.mode = mode
+        self.worker = worker
+        self.missing = set()
+        self._index = None
+        self._recorded = {}
+        self._blobs = {}
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    @property
+    def missing_path(self) -> str:
+        return os.path.join(self.directory, "missing.txt")
+
+    def _save_path(self, path: str) -> str:
+        if self.worker is None:
+            return path
+        stem, extension = os.path.splitext(path)
+        return f"{stem}.worker-{self.worker}{extension}"
+
+    @property
+    def index(self) -> dict:
+        """Lazily loaded archive index"""
+        if self._index is None:
+            self._index = load_json(self.index_path, {})
+        return self._index
+
+    @staticmethod
+    def make_key(method: str, url: str) -> str:
+        return f"{method} {url}"
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def _write_blob(self, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _read_blob(self, digest: str) -> bytes:
+        body = self._blobs.get(digest)
+        if body is None:
+            with open(self._blob_path(digest), "rb") as f:
+                body = f.read()
+            self._blobs[digest] = body
+        return body
+
+    def record_request(self, request: Request):
+        """Store the response of a finished request"""
+        response = request.response()
+        if response is None:
+            return
+        try:
+            body = response.body()
+        except Exception:
+            # Redirects have no body; keep status and location only
+            body = b""
+        self._store(request, response, body)
+
+    async def record_request_async(self, request):
+        """Store the response of a finished request of an async context"""
+        response = await request.response()
+        if response is None:
+            return
+        try:
+            body = await response.body()
+        except Exception:
+            body = b""
+        self._store(request, response, body)
+
+    def _store(self, request, response, body: bytes):
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() not in ResponseCache.DROPPED_HEADERS
+        }
+        self._recorded[self.make_key(request.method, request.url)] = {
+            "status": response.status,
+            "headers": headers,
+            "body": self._write_blob(body),
+        }
+
+    def handle_route(self, route: Route):
+        """Serve a request from the archive, aborting unknown URLs"""
+        request = route.request
+        entry = self.index.get(self.make_key(request.method, request.url))
+        if entry is None:
+            self.missing.add(self.make_key(request.method, request.url))
+            return route.abort("internetdisconnected")
+        # Returned so the async API awaits it; the handler serves sync and async contexts
+        return route.fulfill(
+            status=entry["status"],
+            headers=entry["headers"],
+            body=self._read_blob(entry["body"]),
+        )
+
+    def install(self, context: BrowserContext):
+        """Hook the archive into a context according to the current mode.
+
+        Returns the route registration, which the async API must await.
+        """
+        if self.mode == "record":
+            async_context = isinstance(context, AsyncBrowserContext)
+            context.on("requestfinished", self.record_request_async if async_context else self.record_request)
+        elif self.mode == "replay":
+            return context.route("**/*", self.handle_route)
+        return None
+
+    def install_offsite(self, context: BrowserContext, site: str):
+        """Serve every request outside `site` from the archive, aborting unknown URLs.
+
+        The local mirror only serves its own origin, so third-party and CDN
+        assets come from the captured snapshot instead of the live network.
+        Returns the route registration, which the async API must await.
+        """
+        prefix = site.rstrip("/") + "/"
+        return context.route(lambda url: not url.startswith(prefix), self.handle_route)
+
+    def save(self):
+        """Merge recorded responses into the on-disk index and write the miss list"""
+        if self._recorded:
+            if self.worker is None:
+                self._index = _merge_indexes(self.index_path, [self._recorded])
+            else:
+                # An unlocked read-modify-write of index.json would lose other workers' entries
+                _merge_indexes(self._save_path(self.index_path), [self._recorded])
+            self._recorded.clear()
+        if self.missing:
+            _write_missing(self._save_path(self.missing_path), self.missing)
+
+    def merge_worker_files(self):
+        """Fold the workers' indexes and miss lists into index.json and missing.txt"""
+        worker_indexes = sorted(glob.glob(os.path.join(self.directory, "index.worker-*.json")))
+        if worker_indexes:
+            self._index = _merge_indexes(self.index_path, [load_json(path, {}) for path in worker_indexes])
+        worker_missing = sorted(glob.glob(os.path.join(self.directory, "missing.worker-*.txt")))
+        if worker_missing:
+            missing = set()
+            for path in worker_missing:
+                with open(path, "r", encoding="utf-8") as f:
+                    missing.update(line.strip() for line in f if line.strip())
+            _write_missing(self.missing_path, missing)
+        for path in worker_indexes + worker_missing:
+            os.remove(path)
+
+
+def _merge_indexes(path: str, updates) -> dict:
+    merged = load_json(path, {})
+    for update in updates:
+        merged.update(update)
+    atomic_write_json(path, merged)
+    return merged
+
+
+def _write_missing(path: str, missing):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(sorted(missing)) + "\n")
+
+network_archive = NetworkArchive(Config.NETWORK_ARCHIVE_DIR, Config.NETWORK_MODE, os.getenv("TEST_WORKER_ID"))
@@ -0,0 +1,139 @@
+import time
+from collections import deque
+from playwright.sync_api import BrowserContext, Request, Response
+
+
+def _format_size(size, answered: bool = False) -> str:
+    if size is None:
+        # "?" is a response of unknown size, "-" a request that got none
+        return "?" if answered else "-"
+    if size >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.1f}M"
+    if size >= 1024:
+        return f"{size / 1024:.0f}K"
+    return f"{size}B"
+
+
+class NetworkLog:
+    """Bounded log of a context's requests, rendered as a waterfall on demand.
+
+    Event handlers only store references and timestamps; nothing that needs a
+    round trip to the browser runs while the test does. Finished requests go
+    into a ring buffer of `capacity` entries, and at most `capacity` requests
+    are tracked as in flight, so a chatty page cannot grow the log without
+    bound. Sizes come from Content-Length; `fill_sizes` looks up the rest
+    (chunked or compressed responses) when the waterfall is about to be shown.
+    """
+
+    def __init__(self, capacity: int = 500):
+        self.capacity = capacity
+        self.started = time.monotonic()
+        self.finished = deque(maxlen=capacity)
+        self.in_flight = {}
+        self.dropped = 0
+
+    def install(self, context: BrowserContext):
+        context.on("request", self._on_request)
+        context.on("response", self._on_response)
+        context.on("requestfinished", self._on_finished)
+        context.on("requestfailed", self._on_failed)
+
+    def _on_request(self, request: Request):
+        if len(self.in_flight) >= self.capacity:
+            # Drop the oldest request still open rather than grow
+            self.in_flight.pop(next(iter(self.in_flight)))
+            self.dropped += 1
+        redirected_from = request.redirected_from
+        self.in_flight[request] = {
+            "start": time.monotonic() - self.started,
+            "method": request.method,
+            "url": request.url,
+            "type": request.resource_type,
+            "initiator": redirected_from.url if redirected_from else request.headers.get("referer"),
+            "status": None,
+            "size": None,
+            "response": None,
+        }
+
+    def _on_response(self, response: Response):
+        entry = self.in_flight.get(response.request)
+        if entry is not None:
+            entry["status"] = response.status
+            entry["response"] = time.monotonic() - self.started
+            length = response.headers.get("content-length")
+            entry["size"] = int(length) if length and length.isdigit() else None
+
+    def _finish(self, request: Request, error: str = None):
+        entry = self.in_flight.pop(request, None)
+        if entry is None:
+            return
+        entry["end"] = time.monotonic() - self.started
+        entry["error"] = error
+        if entry["size"] is None and error is None:
+            # Kept for fill_sizes; the ring buffer bounds how many are held
+            entry["request"] = request
+        if len(self.finished) == self.finished.maxlen:
+            self.dropped += 1
+        self.finished.append(entry)
+
+    def _on_finished(self, request: Request):
+        self._finish(request)
+
+    def _on_failed(self, request: Request):
+        self._finish(request, request.failure or "failed")
+
+    def fill_sizes(self):
+        """Body sizes of finished responses that had no Content-Length.
+
+        One browser round trip per response (sync API only), so this runs when
+        the waterfall is attached, never from the event handlers.
+        """
+        for entry in self.finished:
+            request = entry.pop("request", None)
+            if request is None:
+                continue
+            try:
+                entry["size"] = request.sizes()["responseBodySize"]
+            except Exception:
+                # The context may be closing; the size stays unknown
+                pass
+
+    def entries(self) -> list:
+        """Finished and still open requests, ordered by start"""
+        now = time.monotonic() - self.started
+        pending = [{**entry, "end": None, "error": None, "open_for": now - entry["start"]}
+                   for entry in self.in_flight.values()]
+        return sorted(list(self.finished) + pending, key=lambda entry: entry["start"])
+
+    def waterfall(self, width: int = 40) -> str:
+        """Compact text waterfall: offset, duration, status, type, size, bar and URL"""
+        entries = self.entries()
+        if not entries:
+            return "No requests recorded"
+        span = max((entry["end"] or entry["start"] + entry["open_for"]) for entry in entries) or 1
+        lines = [f"{len(entries)} requests over {span:.2f}s"
+                 + (f", {self.dropped} older dropped" if self.dropped else "")]
+        for entry in entries:
+            end = entry["end"] if entry["end"] is not None else entry["start"] + entry["open_for"]
+            left = int(entry["start"] / span * width)
+            length = max(int((end - entry["start"]) / span * width), 1)
+            bar = (" " * left + ("=" if entry["end"] is not None else ">") * length)[:width]
+            if entry["end"] is None:
+                status = "OPEN"
+            elif entry["error"]:
+                status = "FAIL"
+            else:
+                status = str(entry["status"] or "-")
+            line = (f"+{entry['start']:7.3f}s {(end - entry['start']) * 1000:7.0f}ms {status:>4} "
+                    f"{entry['type'][:10]:10} {_format_size(entry['size'], entry['status'] is not None):>6} "
+                    f"|{bar:<{width}}| "
+                    f"{entry['method']} {entry['url'][:150]}")
+            if entry["error"]:
+                line += f"  ({entry['error']})"
+            elif entry["initiator"] and entry["type"] != "document":
+                line += f"  <- {entry['initiator'][:100]}"
+            lines.append(line)
+        open_requests = [entry for entry in entries if entry["end"] is None]
+        if open_requests:
+            lines.append(f"{len(open_requests)} request(s) still open, these keep the network from going idle")
+        return "\n".join(lines)
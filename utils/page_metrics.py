@@ -0,0 +1,82 @@
+import json
+import statistics
+import threading
+import time
+import allure
+from config.config import Config
+
+
+# Shown in the report and the terminal summary, in this order
+SUMMARY_METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "cls", "duration_ms", "requests", "transfer_bytes")
+
+
+class PerformanceBudgetError(AssertionError):
+    """Raised when a navigation exceeds one of the configured performance budgets"""
+
+
+class PageMetrics:
+    """Performance metrics of every navigation, kept per test and checked against budgets.
+
+    Page objects collect the metrics in the browser and hand them to `record`,
+    which attaches them to the current Allure step and raises
+    PerformanceBudgetError if any metric is above its budget (0 disables one).
+    `records` holds the whole session for the trend history.
+    """
+
+    def __init__(self, budgets: dict, enabled: bool = True):
+        self.budgets = budgets
+        self.enabled = enabled
+        self.test = None
+        self.records = []
+        self.baseline = {}
+        self._lock = threading.Lock()
+
+    def start_test(self, nodeid: str):
+        self.test = nodeid
+
+    def breaches(self, metrics: dict) -> list:
+        """Human-readable list of budgets the metrics exceed"""
+        found = []
+        for name, budget in self.budgets.items():
+            value = metrics.get(name)
+            if budget and value is not None and value > budget:
+                found.append(f"{name} {value} > {budget:g}")
+        return found
+
+    def record(self, step: str, url: str, metrics: dict, attach: bool = True) -> dict:
+        """Store one navigation's metrics and fail on a budget breach"""
+        entry = {"test": self.test, "step": step, "url": url, "recorded_at": time.time(), **metrics}
+        breaches = self.breaches(metrics)
+        entry["breaches"] = breaches
+        with self._lock:
+            self.records.append(entry)
+        if attach:
+            allure.attach(
+                json.dumps(entry, indent=2, ensure_ascii=False),
+                name=f"Performance: {step}",
+                attachment_type=allure.attachment_type.JSON
+            )
+        if breaches:
+            raise PerformanceBudgetError(f"Performance budget exceeded on {step} ({url}): {', '.join(breaches)}")
+        return entry
+
+    def test_records(self, nodeid: str) -> list:
+        return [entry for entry in self.records if entry["test"] == nodeid]
+
+    def summary(self) -> dict:
+        """Median of each summary metric per step in this session"""
+        by_step = {}
+        for entry in self.records:
+            by_step.setdefault(entry["step"], []).append(entry)
+        summary = {}
+        for step, entries in sorted(by_step.items()):
+            medians = {}
+            for name in SUMMARY_METRICS:
+                values = [entry[name] for entry in entries if entry.get(name) is not None]
+                if values:
+                    medians[name] = round(statistics.median(values), 3)
+            summary[step] = {"samples": len(entries), "breaches": sum(bool(e["breaches"]) for e in entries), **medians}
+        return summary
+
+
+page_metrics = PageMetrics(Config.PERF_BUDGETS, enabled=Config.PERF_METRICS_ENABLED)
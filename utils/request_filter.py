@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Response, Route
+from config.config import Config
+
+
+class KnownSizes:
+    """Response sizes by URL, least recently used evicted beyond `limit`.
+
+    Shared by every context of the session: a blocked request never gets a
+    response in its own context, so its size can only come from another one.
+    """
+
+    def __init__(self, limit: int = 5000):
+        self.limit = limit
+        self._sizes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str):
+        with self._lock:
+            size = self._sizes.get(url)
+            if size is not None:
+                self._sizes.move_to_end(url)
+            return size
+
+    def set(self, url: str, size: int):
+        with self._lock:
+            self._sizes[url] = size
+            self._sizes.move_to_end(url)
+            if len(self._sizes) > self.limit:
+                self._sizes.popitem(last=False)
+
+    def __len__(self):
+        return len(self._sizes)
+
+
+# Response sizes seen during the session, used to estimate bytes saved
+_known_sizes = KnownSizes()
+
+
+def _host_matches(host: str, domains) -> bool:
+    """Check host against domain rules, subdomains included"""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class RequestFilter:
+    """Abort requests by resource type and domain and count what was saved.
+
+    Allow rules win over deny rules, so a first-party domain can stay fully
+    loaded while images or trackers elsewhere are dropped.
+    """
+
+    def __init__(self, name: str = "full", deny_types=(), deny_domains=(), allow_domains=()):
+        self.name = name
+        self.deny_types = set(deny_types)
+        self.deny_domains = tuple(deny_domains)
+        self.allow_domains = tuple(allow_domains)
+        self.requests_blocked = 0
+        self.bytes_saved = 0
+        self.unknown_sizes = 0
+
+    @classmethod
+    def from_profile(cls, name: str):
+        """Build a filter from a profile defined in Config.RESOURCE_PROFILES"""
+        if name not in Config.RESOURCE_PROFILES:
+            raise ValueError(
+                f"Unknown resource profile '{name}', expected one of {sorted(Config.RESOURCE_PROFILES)}"
+            )
+        return cls(name, **Config.RESOURCE_PROFILES[name])
+
+    @property
+    def active(self) -> bool:
+        return bool(self.deny_types or self.deny_domains)
+
+    def is_blocked(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request should be aborted"""
+        host = urlsplit(url).hostname or ""
+        if _host_matches(host, self.allow_domains):
+            return False
+        return resource_type in self.deny_types or _host_matches(host, self.deny_domains)
+
+    def handle_route(self, route: Route):
+        """Abort blocked requests, pass everything else on.
+
+        Route calls are returned so the async API awaits them, which lets sync
+        and async contexts share the handler.
+        """
+        request = route.request
+        if not self.is_blocked(request.url, request.resource_type):
+            return route.fallback()
+        self.requests_blocked += 1
+        size = _known_sizes.get(request.url)
+        if size is None:
+            self.unknown_sizes += 1
+        else:
+            self.bytes_saved += size
+        return route.abort("blockedbyclient")
+
+    def remember_size(self, response: Response):
+        """Learn response sizes from headers without an extra browser round trip"""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            _known_sizes.set(response.url, int(length))
+
+    def install(self, context: BrowserContext):
+        """Apply the filter to every page of the context.
+
+        Returns the route registration, which the async API must await.
+        """
+        context.on("response", self.remember_size)
+        if self.active:
+            return context.route("**/*", self.handle_route)
+        return None
+
+    def stats(self) -> dict:
+        """Per-context counters for reporting"""
+        return {
+            "profile": self.name,
+            "requests_blocked": self.requests_blocked,
+            "bytes_saved": self.bytes_saved,
+            "blocked_with_unknown_size": self.unknown_sizes,
+        }
@@ -0,0 +1,67 @@
+from playwright.sync_api import BrowserContext, Response, Route
+
+
+class ResponseCache:
+    """In-memory copy of responses captured during a warm-up page load.
+
+    Installed on a fresh context it serves the captured responses through
+    route interception, giving new contexts a warm HTTP cache without
+    sharing any cookies, storage or page state with the warm-up context.
+    """
+
+    CACHEABLE_TYPES = {"document", "stylesheet", "script", "image", "font", "media"}
+    # Bodies are stored decoded, so transport headers no longer apply
+    DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+    def __init__(self, max_bytes: int = 100 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url: str):
+        return url in self._entries
+
+    def store(self, url: str, status: int, headers: dict, body: bytes):
+        """Store a response body under its URL"""
+        if url in self._entries or self.size + len(body) > self.max_bytes:
+            return
+        headers = {k: v for k, v in headers.items() if k.lower() not in self.DROPPED_HEADERS}
+        self._entries[url] = (status, headers, body)
+        self.size += len(body)
+
+    def record(self, response: Response):
+        """Store a successful GET response of a cacheable resource type"""
+        request = response.request
+        if request.method != "GET" or response.status != 200:
+            return
+        if request.resource_type not in self.CACHEABLE_TYPES:
+            return
+        try:
+            body = response.body()
+        except Exception:
+            # Body is gone for redirects and aborted requests
+            return
+        self.store(response.url, response.status, response.headers, body)
+
+    def lookup(self, url: str):
+        """Return (status, headers, body) for a URL or None"""
+        return self._entries.get(url)
+
+    def handle_route(self, route: Route):
+        """Fulfil GET requests from the cache, pass everything else on"""
+        request = route.request
+        entry = self._entries.get(request.url) if request.method == "GET" else None
+        if entry is None:
+            route.fallback()
+            return
+        status, headers, body = entry
+        self.hits += 1
+        route.fulfill(status=status, headers=headers, body=body)
+
+    def install(self, context: BrowserContext):
+        """Serve cached responses to every page of the context"""
+        context.route("**/*", self.handle_route)
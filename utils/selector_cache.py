@@ -0,0 +1,82 @@
+from config.config import Config
+from .json_store import load_json, atomic_write_json
+
+
+class SelectorCache:
+    """On-disk memo of the winning fallback selector per page object action.
+
+    Entries are keyed by page object, action and base URL. A cached selector
+    is tried first on the next run and evicted as soon as it stops matching.
+    """
+
+    def __init__(self, path: str, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = None
+        self._updated = {}
+        self._evicted = set()
+
+    @staticmethod
+    def make_key(page_object: str, action: str, base_url: str) -> str:
+        """Build cache key for a page object action"""
+        return f"{page_object}|{action}|{base_url}"
+
+    @property
+    def entries(self) -> dict:
+        """Lazily loaded cache entries"""
+        if self._entries is None:
+            self._entries = load_json(self.path, {}) if self.enabled else {}
+        return self._entries
+
+    def get(self, key: str):
+        """Return cached selector for key or None"""
+        if not self.enabled:
+            return None
+        return self.entries.get(key)
+
+    def put(self, key: str, selector: str):
+        """Remember winning selector for key"""
+        if not self.enabled or self.entries.get(key) == selector:
+            return
+        self.entries[key] = selector
+        self._updated[key] = selector
+        self._evicted.discard(key)
+
+    def evict(self, key: str):
+        """Drop a selector that no longer matches"""
+        if not self.enabled or key not in self.entries:
+            return
+        del self.entries[key]
+        self._updated.pop(key, None)
+        self._evicted.add(key)
+        self.evictions += 1
+
+    def record(self, hit: bool):
+        """Count a cache lookup outcome"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters for reporting"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def save(self):
+        """Merge local changes into the on-disk cache"""
+        if not self.enabled or not (self._updated or self._evicted):
+            return
+        # Re-read so parallel workers do not overwrite each other's entries
+        merged = load_json(self.path, {})
+        for key in self._evicted:
+            merged.pop(key, None)
+        merged.update(self._updated)
+        atomic_write_json(self.path, merged)
+        self._updated.clear()
+        self._evicted.clear()
+
+
+selector_cache = SelectorCache(Config.SELECTOR_CACHE_PATH, Config.SELECTOR_CACHE_ENABLED)
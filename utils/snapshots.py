@@ -0,0 +1,145 @@
+import gzip
+import hashlib
+import threading
+import allure
+import allure_commons
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, TestResult, TestStepResult
+from playwright.sync_api import Page
+from config.config import Config
+from .instrumentation import current_test
+
+
+SNAPSHOT_POLICIES = ("always", "failure", "never")
+GZIP_MIME_TYPE = "application/gzip"
+GZIP_EXTENSION = "html.gz"
+
+
+class Snapshot:
+    """One serialized copy of a page's DOM"""
+
+    def __init__(self, url: str, title: str, html: str):
+        self.url = url
+        self.title = title
+        self.html = html
+        self.data = html.encode("utf-8")
+        self.sha = hashlib.sha256(self.data).hexdigest()
+
+    def preview(self, limit: int = 1000) -> str:
+        return self.html[:limit] + "..." if len(self.html) > limit else self.html
+
+
+class SnapshotService:
+    """Serialize a page's DOM once per Allure step and attach it compactly.
+
+    Every helper asking for the DOM inside the same step gets the same copy;
+    the copy is dropped when a step starts or ends or the page navigates.
+    Attachments are gzip-compressed and stored once per content hash, so an
+    identical DOM in another test only adds a reference to the existing file.
+    `budget` caps the compressed bytes written to allure-results per run.
+    """
+
+    def __init__(self, policy: str = "failure", budget: int = 0, max_bytes: int = 0):
+        if policy not in SNAPSHOT_POLICIES:
+            raise ValueError(f"Unknown snapshot policy '{policy}', expected one of {SNAPSHOT_POLICIES}")
+        self.policy = policy
+        self.budget = budget
+        self.max_bytes = max_bytes
+        self.reporter = None
+        self.written = 0
+        self.stats = {"captured": 0, "reused": 0, "attached": 0, "deduplicated": 0, "over_budget": 0}
+        self._cache = {}
+        self._files = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.invalidate()
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the shared copies; the next capture serializes the DOM again"""
+        with self._lock:
+            self._cache.clear()
+
+    def capture(self, page: Page) -> Snapshot:
+        """Return the current step's snapshot of the page, serializing it at most once"""
+        with self._lock:
+            snapshot = self._cache.get(id(page))
+        if snapshot is not None and snapshot.url == page.url:
+            self.stats["reused"] += 1
+            return snapshot
+
+        snapshot = Snapshot(page.url, page.title(), page.content())
+        self.stats["captured"] += 1
+        with self._lock:
+            self._cache[id(page)] = snapshot
+        return snapshot
+
+    def attach(self, page: Page, name: str, key: str = None):
+        """Attach the page's DOM according to the snapshot policy"""
+        if self.policy == "never":
+            return
+        snapshot = self.capture(page)
+        if self.policy == "always":
+            self._attach(snapshot, name)
+            return
+        # "failure": keep the snapshot until the test's outcome is known
+        with self._lock:
+            self._pending.setdefault(key or current_test(), []).append((snapshot, name))
+
+    def flush(self, key: str = None, failed: bool = False):
+        """Attach a test's held snapshots if it failed, otherwise drop them"""
+        with self._lock:
+            pending = self._pending.pop(key or current_test(), [])
+        if failed:
+            for snapshot, name in pending:
+                self._attach(snapshot, name)
+
+    def _attach(self, snapshot: Snapshot, name: str):
+        data = snapshot.data
+        truncated = self.max_bytes and len(data) > self.max_bytes
+        if truncated:
+            data = data[:self.max_bytes]
+        sha = hashlib.sha256(data).hexdigest() if truncated else snapshot.sha
+        title = f"{name} (truncated to {self.max_bytes} bytes)" if truncated else name
+
+        file_name = self._files.get(sha)
+        if file_name and self.reporter is not None:
+            self._reference(file_name, title)
+            self.stats["deduplicated"] += 1
+            return
+
+        body = gzip.compress(data)
+        if self.budget and self.written + len(body) > self.budget:
+            self.stats["over_budget"] += 1
+            allure.attach(
+                f"Snapshot of {snapshot.url} skipped: {len(body)} bytes would exceed "
+                f"the {self.budget} byte snapshot budget (sha256 {sha})",
+                name=name,
+                attachment_type=allure.attachment_type.TEXT
+            )
+            return
+
+        if self.reporter is not None:
+            uuid = f"snapshot-{sha[:32]}"
+            self.reporter.attach_data(
+                uuid, body, name=title, attachment_type=GZIP_MIME_TYPE, extension=GZIP_EXTENSION
+            )
+            self._files[sha] = ATTACHMENT_PATTERN.format(prefix=uuid, ext=GZIP_EXTENSION)
+        else:
+            allure.attach(body, name=title, attachment_type=GZIP_MIME_TYPE, extension=GZIP_EXTENSION)
+        self.written += len(body)
+        self.stats["attached"] += 1
+
+    def _reference(self, file_name: str, name: str):
+        """Point the current step or test at an already written snapshot file"""
+        item = self.reporter.get_last_item(TestStepResult) or self.reporter.get_last_item(TestResult)
+        if item is not None:
+            item.attachments.append(Attachment(source=file_name, name=name, type=GZIP_MIME_TYPE))
+
+
+snapshot_service = SnapshotService(Config.SNAPSHOT_POLICY, Config.SNAPSHOT_BUDGET_BYTES, Config.SNAPSHOT_MAX_BYTES)
@@ -0,0 +1,145 @@
+import time
+import traceback
+import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from config.config import Config
+from .instrumentation import current_test
+
+
+# Failures worth retrying: timing flakes, not broken selectors or test bugs
+RETRY_ON = (AssertionError, PlaywrightTimeoutError)
+
+
+class StepRetry:
+    """Retry a single failing step instead of rerunning the whole test.
+
+    `run` executes an action inside an Allure step. If it fails with a retryable
+    error, the action (optionally preceded by the step before it) is run again
+    in a nested "Retry" step, up to `retries` times and within a per-test time
+    budget. Every retry is attached to the report and kept for the run summary.
+    """
+
+    def __init__(self, retries: int = 2, budget_ms: int = 15000):
+        self.retries = retries
+        self.budget_ms = budget_ms
+        self.history = []
+        self.test = None
+        self._test_started = time.monotonic()
+        self._spent_ms = 0.0
+
+    def start_test(self, nodeid: str):
+        """Reset the per-test budget"""
+        self.test = nodeid
+        self._test_started = time.monotonic()
+        self._spent_ms = 0.0
+
+    def _record(self, title: str, attempt: int, error: BaseException, elapsed_ms: float,
+                recovered: bool, step_started: float):
+        entry = {
+            "test": self.test or current_test(),
+            "step": title,
+            "attempt": attempt,
+            "error": f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}",
+            "retry_ms": round(elapsed_ms, 1),
+            # What a whole-test rerun would have repeated before reaching this step
+            "rerun_cost_ms": round((step_started - self._test_started) * 1000, 1),
+            "recovered": recovered,
+        }
+        self.history.append(entry)
+        return entry
+
+    def _attach_first_failure(self, title: str, error: BaseException):
+        allure.attach(
+            "".join(traceback.format_exception_only(type(error), error)),
+            name=f"Attempt 1 failed: {title}",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+    def _budget_used_up(self, title: str) -> bool:
+        if self._spent_ms < self.budget_ms:
+            return False
+        allure.attach(
+            f"Retry budget of {self.budget_ms} ms for this test is used up",
+            name=f"Not retried: {title}",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        return True
+
+    def run(self, title: str, action, previous=None, retries: int = None, retry_on=RETRY_ON):
+        """Run `action` as an Allure step, retrying it (and `previous` first) on failure"""
+        retries = self.retries if retries is None else retries
+        with allure.step(title):
+            step_started = time.monotonic()
+            try:
+                return action()
+            except retry_on as first_error:
+                error = first_error
+                self._attach_first_failure(title, error)
+
+            for attempt in range(2, retries + 2):
+                if self._budget_used_up(title):
+                    break
+                start = time.monotonic()
+                try:
+                    with allure.step(f"Retry {attempt - 1}: {title}"):
+                        if previous is not None:
+                            with allure.step("Repeat previous step"):
+                                previous()
+                        result = action()
+                except retry_on as retry_error:
+                    elapsed = (time.monotonic() - start) * 1000
+                    self._spent_ms += elapsed
+                    self._record(title, attempt, error, elapsed, False, step_started)
+                    error = retry_error
+                    continue
+                elapsed = (time.monotonic() - start) * 1000
+                self._spent_ms += elapsed
+                self._record(title, attempt, error, elapsed, True, step_started)
+                return result
+            raise error
+
+    async def run_async(self, title: str, action, previous=None, retries: int = None, retry_on=RETRY_ON):
+        """`run` for coroutine functions, as used by the async page objects"""
+        retries = self.retries if retries is None else retries
+        with allure.step(title):
+            step_started = time.monotonic()
+            try:
+                return await action()
+            except retry_on as first_error:
+                error = first_error
+                self._attach_first_failure(title, error)
+
+            for attempt in range(2, retries + 2):
+                if self._budget_used_up(title):
+                    break
+                start = time.monotonic()
+                try:
+                    with allure.step(f"Retry {attempt - 1}: {title}"):
+                        if previous is not None:
+                            with allure.step("Repeat previous step"):
+                                await previous()
+                        result = await action()
+                except retry_on as retry_error:
+                    elapsed = (time.monotonic() - start) * 1000
+                    self._spent_ms += elapsed
+                    self._record(title, attempt, error, elapsed, False, step_started)
+                    error = retry_error
+                    continue
+                elapsed = (time.monotonic() - start) * 1000
+                self._spent_ms += elapsed
+                self._record(title, attempt, error, elapsed, True, step_started)
+                return result
+            raise error
+
+    def summary(self) -> dict:
+        """Retries made, how many recovered a step, and the time they cost versus test reruns"""
+        recovered = [entry for entry in self.history if entry["recovered"]]
+        return {
+            "retries": len(self.history),
+            "recovered": len(recovered),
+            "retry_ms": round(sum(entry["retry_ms"] for entry in self.history), 1),
+            "rerun_cost_ms": round(sum(entry["rerun_cost_ms"] + entry["retry_ms"] for entry in recovered), 1),
+        }
+
+
+step_retry = StepRetry(Config.STEP_RETRIES, Config.STEP_RETRY_BUDGET_MS)
@@ -3,29 +3,24 @@ import allure
 import pytest
 from playwright.sync_api import Page
 from typing import Dict, List
+from config.config import Config
+from .artifacts import artifact_pipeline
+from .snapshots import snapshot_service
 
 
 def take_screenshot_on_failure(page: Page, test_name: str):
     """Take screenshot when test fails"""
-    if not os.path.exists("screenshots"):
-        os.makedirs("screenshots")
-    
-    screenshot_path = f"screenshots/{test_name}_failure.png"
-    page.screenshot(path=screenshot_path, full_page=True)
-    
-    allure.attach.file(
-        screenshot_path,
-        name=f"Screenshot: {test_name}",
-        attachment_type=allure.attachment_type.PNG
-    )
+    # Encoded in the background and attached at the end of the test's teardown
+    artifact_pipeline.capture_screenshot(page, f"Screenshot: {test_name}")
 
 
 def log_page_info(page: Page, test_name: str):
     """Log page information for debugging"""
+    snapshot = snapshot_service.capture(page)
     page_info = {
-        "url": page.url,
-        "title": page.title(),
-        "content": page.content()[:1000] + "..." if len(page.content()) > 1000 else page.content()
+        "url": snapshot.url,
+        "title": snapshot.title,
+        "content": snapshot.preview(1000)
     }
     
     allure.attach(
@@ -35,13 +30,14 @@ def log_page_info(page: Page, test_name: str):
     )
 
 
-def wait_for_network_idle(page: Page, timeout: int = 30000):
+def wait_for_network_idle(page: Page, timeout: int = None):
     """Wait for network to be idle"""
-    page.wait_for_load_state("networkidle", timeout=timeout)
+    page.wait_for_load_state("networkidle", timeout=timeout or Config.TIMEOUT)
 
 
-def get_element_text_safe(page: Page, selector: str, timeout: int = 10000) -> str:
+def get_element_text_safe(page: Page, selector: str, timeout: int = None) -> str:
     """Safely get element text with timeout"""
+    timeout = timeout or Config.ELEMENT_TIMEOUT
     try:
         element = page.locator(selector)
         element.wait_for(state="visible", timeout=timeout)
@@ -57,9 +53,5 @@ def verify_url_contains(page: Page, expected_pattern: str):
 
 
 def attach_html_content(page: Page, name: str = "Page HTML"):
-    """Attach HTML content to Allure report"""
-    allure.attach(
-        page.content(),
-        name=name,
-        attachment_type=allure.attachment_type.HTML
-    )
+    """Attach HTML content to Allure report (gzip, deduplicated, only on failure by default)"""
+    snapshot_service.attach(page, name)